@@ -9,7 +9,10 @@ ToGo now offers:
 - Shapely-compatible properties (geom_type, bounds, area, length, coords, etc.)
 - Shapely-compatible module functions (from_wkt, from_geojson, to_wkt, etc.)
 
-Run with: python benchmarks/bench_shapely_vs_togo.py
+Run with: python benchmarks/bench_shapely_vs_togo.py [--json results.json]
+
+For size/thread scaling curves and baseline regression checks see
+benchmarks/bench_suite.py.
 """
 
 import os
@@ -233,6 +236,7 @@ def main():
         default=DEFAULT_WARMUP,
         help="Warmup iterations before each timed run",
     )
+    parser.add_argument("--json", help="Write the per-case results to this JSON file")
     args = parser.parse_args()
 
     DEFAULT_REPEATS = max(1, args.repeats)
@@ -999,6 +1003,17 @@ def main():
 
     print("\nNote: Results are rough microbenchmarks. Real-world performance can vary.")
 
+    if args.json:
+        meta = {
+            "python": sys.version.split()[0],
+            "shapely": getattr(shapely, "__version__", "unknown"),
+            "repeats": DEFAULT_REPEATS,
+            "warmup": DEFAULT_WARMUP,
+        }
+        with open(args.json, "w") as f:
+            json.dump({"meta": meta, "results": BENCH_RESULTS}, f, indent=2)
+        print(f"Wrote {len(BENCH_RESULTS)} results to {args.json}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,324 @@
+"""
+Scaling benchmark suite for togo.
+
+Sweeps geometry size (10 to 10^6 vertices) for parsing, writing, predicates,
+overlays and transforms, and batch size x thread count for the parallel
+``*_many`` / ``sjoin`` APIs. Every case records its median time and the peak
+memory of one extra run: native TG allocations (``allocator_stats``) and
+Python allocations (``tracemalloc``). GEOS-internal allocations are not seen
+by either counter.
+
+Results can be written as JSON and compared against a stored baseline:
+
+    python benchmarks/bench_suite.py --json results.json
+    python benchmarks/bench_suite.py --baseline results.json --tolerance 0.15
+
+The comparison prints every case that got slower than the tolerance allows
+and exits with status 1 if there is any, so it can gate CI jobs. Use
+``--quick`` for a short smoke run (sizes up to 10^4).
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Ensure the repo root is importable when running from a checkout
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+try:
+    import togo
+    from togo import (
+        Point,
+        allocator_stats,
+        box,
+        buffer_many,
+        from_geojson,
+        from_wkb,
+        from_wkt,
+        intersection_many,
+        simplify_many,
+        sjoin,
+        to_geojson,
+        to_web_mercator,
+        to_wkb,
+        to_wkt,
+        transform,
+    )
+    from togo.datasets import coastline, gps_points, star_polygon
+except Exception as e:
+    print("ERROR: Failed to import togo:", e)
+    sys.exit(1)
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+QUICK_SIZES = [10, 100, 1_000, 10_000]
+BATCHES = [1, 100, 10_000]
+QUICK_BATCHES = [1, 100]
+CATEGORIES = ("parse", "write", "predicate", "overlay", "transform", "batch")
+
+
+def time_case(fn, min_time, repeats):
+    """Median/min seconds per call; iterations are calibrated to ``min_time``."""
+    t0 = time.perf_counter()
+    fn()
+    once = time.perf_counter() - t0
+    iters = max(1, int(min_time / once)) if once > 0 else 1000
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for _ in range(iters):
+            fn()
+        times.append((time.perf_counter() - t0) / iters)
+    return {
+        "seconds": statistics.median(times),
+        "min_seconds": min(times),
+        "stdev_seconds": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "iters": iters,
+        "repeats": repeats,
+    }
+
+
+def peak_memory(fn):
+    """Peak native (TG) and Python bytes allocated by one call of ``fn``."""
+    live = allocator_stats(reset_peak=True)["live_bytes"]
+    tracemalloc.start()
+    try:
+        fn()
+        _, py_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_native_bytes": allocator_stats()["peak_bytes"] - live,
+        "peak_python_bytes": py_peak,
+    }
+
+
+def _size_cases(n):
+    # Spiky holed polygon for codecs and predicates. GEOS handles random
+    # spikes very slowly, so overlays and transforms run on a coastline.
+    poly = star_polygon(n, holes=n // 1000, radius=100.0, seed=1)
+    coast = coastline(n, radius=100.0, seed=2)
+    other = star_polygon(64, radius=60.0, center=(50.0, 20.0), seed=3)
+    wkt = to_wkt(poly)
+    wkb = to_wkb(poly)
+    geojson = to_geojson(poly)
+    inside = Point(1.0, 1.0)
+    probe = box(-10.0, -10.0, 10.0, 10.0)
+    # Roughly the vertex spacing; a fixed distance would make buffer cost
+    # explode as the coastline gets denser.
+    step = 200.0 / n
+    return [
+        ("parse", "from_wkt", lambda: from_wkt(wkt)),
+        ("parse", "from_wkb", lambda: from_wkb(wkb)),
+        ("parse", "from_geojson", lambda: from_geojson(geojson)),
+        ("write", "to_wkt", lambda: to_wkt(poly)),
+        ("write", "to_wkb", lambda: to_wkb(poly)),
+        ("write", "to_geojson", lambda: to_geojson(poly)),
+        ("predicate", "intersects_point", lambda: poly.intersects(inside)),
+        ("predicate", "contains_point", lambda: poly.contains(inside)),
+        ("predicate", "intersects_polygon", lambda: poly.intersects(other)),
+        ("predicate", "contains_box", lambda: poly.contains(probe)),
+        ("overlay", "intersection", lambda: coast.intersection(other)),
+        ("overlay", "union", lambda: coast.union(other)),
+        ("overlay", "difference", lambda: coast.difference(other)),
+        ("transform", "buffer", lambda: coast.buffer(step, quad_segs=8)),
+        ("transform", "simplify", lambda: coast.simplify(step)),
+        ("transform", "convex_hull", lambda: coast.convex_hull),
+        ("transform", "to_web_mercator", lambda: to_web_mercator(coast)),
+        ("transform", "transform", lambda: transform(lambda x, y: (y, x), coast)),
+    ]
+
+
+def _batch_cases(batch):
+    polys = [
+        star_polygon(64, radius=2.0, center=((i % 100) * 3.0, (i // 100) * 3.0), seed=i)
+        for i in range(batch)
+    ]
+    clip = box(-5.0, -5.0, 150.0, 150.0)
+    points = gps_points(
+        batch, extent=(0.0, 0.0, 300.0, 300.0), spread=5.0, seed=3
+    ).geoms
+    return [
+        ("buffer_many", lambda t: buffer_many(polys, 0.5, quad_segs=8, threads=t)),
+        ("simplify_many", lambda t: simplify_many(polys, 0.1, threads=t)),
+        ("intersection_many", lambda t: intersection_many(polys, clip, threads=t)),
+        ("sjoin", lambda t: sjoin(points, polys, threads=t)),
+    ]
+
+
+def run(args):
+    sizes = [
+        n for n in (QUICK_SIZES if args.quick else SIZES) if n <= args.max_vertices
+    ]
+    batches = QUICK_BATCHES if args.quick else BATCHES
+    threads = args.threads or sorted({1, 2, 4, os.cpu_count() or 1})
+    categories = set(args.category or CATEGORIES)
+    results = []
+
+    def record(category, op, fn, vertices=None, batch=None, nthreads=None):
+        if args.filter and args.filter not in op:
+            return
+        row = {
+            "name": _case_name(category, op, vertices, batch, nthreads),
+            "category": category,
+            "op": op,
+            "vertices": vertices,
+            "batch": batch,
+            "threads": nthreads,
+        }
+        row.update(time_case(fn, args.min_time, args.repeats))
+        row.update(peak_memory(fn))
+        results.append(row)
+        print(
+            f"- {row['name']:<48} {row['seconds'] * 1e3:12.4f} ms"
+            f"   peak native {row['peak_native_bytes'] / 1024:10.1f} KiB"
+            f"   python {row['peak_python_bytes'] / 1024:10.1f} KiB",
+            flush=True,
+        )
+
+    for n in sizes:
+        for category, op, fn in _size_cases(n):
+            if category in categories:
+                record(category, op, fn, vertices=n)
+    if "batch" in categories:
+        for batch in batches:
+            for op, fn in _batch_cases(batch):
+                for t in threads:
+                    record(
+                        "batch", op, lambda fn=fn, t=t: fn(t), batch=batch, nthreads=t
+                    )
+    return results
+
+
+def _case_name(category, op, vertices, batch, threads):
+    parts = [f"{category}/{op}"]
+    if vertices is not None:
+        parts.append(f"n={vertices}")
+    if batch is not None:
+        parts.append(f"batch={batch}")
+    if threads is not None:
+        parts.append(f"threads={threads}")
+    return " ".join(parts)
+
+
+def metadata():
+    try:
+        from importlib.metadata import version
+
+        togo_version = version("togo")
+    except Exception:
+        togo_version = "unknown"
+    return {
+        "togo": togo_version,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "allocator": togo.get_allocator(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return ``(regressions, improvements)`` against a baseline run."""
+    base = {row["name"]: row for row in baseline["results"]}
+    regressions = []
+    improvements = []
+    for row in results:
+        old = base.get(row["name"])
+        if old is None or old["seconds"] <= 0:
+            continue
+        ratio = row["seconds"] / old["seconds"]
+        entry = (row["name"], old["seconds"], row["seconds"], ratio)
+        if ratio > 1.0 + tolerance:
+            regressions.append(entry)
+        elif ratio < 1.0 / (1.0 + tolerance):
+            improvements.append(entry)
+    return regressions, improvements
+
+
+def _print_comparison(title, entries):
+    if not entries:
+        return
+    print(f"\n{title}:")
+    for name, old, new, ratio in sorted(entries, key=lambda e: -abs(math.log(e[3]))):
+        print(
+            f"  - {name:<48} {old * 1e3:10.4f} ms -> {new * 1e3:10.4f} ms ({ratio:.2f}x)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="togo scaling benchmark suite")
+    parser.add_argument(
+        "--quick", action="store_true", help="Small sizes only (smoke run)"
+    )
+    parser.add_argument(
+        "--max-vertices",
+        type=int,
+        default=SIZES[-1],
+        help="Largest geometry size to run",
+    )
+    parser.add_argument(
+        "--category",
+        action="append",
+        choices=CATEGORIES,
+        help="Only run this category (repeatable)",
+    )
+    parser.add_argument("--filter", help="Only run operations whose name contains this")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        action="append",
+        help="Thread count for batch cases (repeatable; default 1, 2, 4 and CPU count)",
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per case")
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="Target seconds per timed run"
+    )
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this JSON results file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed slowdown vs baseline before a case counts as a regression",
+    )
+    args = parser.parse_args()
+    args.repeats = max(1, args.repeats)
+
+    meta = metadata()
+    print("Benchmark suite: togo")
+    print(f"togo: {meta['togo']}  Python: {meta['python']}  CPUs: {meta['cpu_count']}")
+    results = run(args)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+        print(f"\nWrote {len(results)} results to {args.json}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions, improvements = compare(results, baseline, args.tolerance)
+        print(
+            f"\nBaseline: {args.baseline} (togo {baseline['meta'].get('togo')}, "
+            f"tolerance {args.tolerance:.0%})"
+        )
+        _print_comparison("Regressions", regressions)
+        _print_comparison("Improvements", improvements)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed.")
+            sys.exit(1)
+        print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+
+import pytest
+
+import togo
+from togo import Point, _aio_batch, aio, box, buffer_many
+
+
+def _boxes(n):
+    return [box(i, 0, i + 2, 2) for i in range(n)]
+
+
+def test_namespace_is_importable():
+    import togo.aio as mod
+
+    assert mod is togo.aio
+    assert set(aio.__all__) <= set(dir(aio))
+
+
+def test_single_operations_match_methods():
+    a, b = box(0, 0, 2, 2), box(1, 1, 3, 3)
+
+    async def main():
+        return await asyncio.gather(
+            aio.buffer(Point(0, 0), 1.0, quad_segs=8),
+            aio.simplify(a, 0.1),
+            aio.intersection(a, b),
+            aio.union(a, b),
+            aio.difference(a, b),
+            aio.unary_union(_boxes(10), group_size=4),
+        )
+
+    buf, simp, inter, uni, diff, merged = asyncio.run(main())
+    assert buf.area == pytest.approx(Point(0, 0).buffer(1.0, quad_segs=8).area)
+    assert simp.equals(a.simplify(0.1))
+    assert inter.area == pytest.approx(1.0)
+    assert uni.area == pytest.approx(7.0)
+    assert diff.area == pytest.approx(3.0)
+    assert merged.area == pytest.approx(22.0)
+
+
+def test_batch_operations_preserve_order():
+    geoms = _boxes(50)
+
+    async def main():
+        return (
+            await aio.buffer_many(geoms, 0.5, chunk_size=7),
+            await aio.intersection_many(geoms, box(0, 0, 10, 10), chunk_size=3),
+            await aio.union_many(geoms, list(reversed(geoms)), chunk_size=16),
+        )
+
+    buffered, clipped, unioned = asyncio.run(main())
+    expected = buffer_many(geoms, 0.5, threads=1)
+    assert [g.area for g in buffered] == pytest.approx([g.area for g in expected])
+    assert [g.area for g in clipped] == pytest.approx(
+        [g.intersection(box(0, 0, 10, 10)).area for g in geoms]
+    )
+    assert len(unioned) == len(geoms)
+
+
+def test_errors_propagate():
+    async def main():
+        with pytest.raises(ValueError):
+            await aio.buffer(box(0, 0, 1, 1), 1.0, cap_style=9)
+        with pytest.raises(ValueError):
+            await aio.buffer_many(_boxes(3), 1.0, chunk_size=0)
+        with pytest.raises(ValueError):
+            await aio.union_many(_boxes(3), _boxes(2))
+        with pytest.raises(ValueError):
+            await aio.unary_union([])
+        with pytest.raises(TypeError):
+            await aio.buffer_many([object()], 1.0)
+
+    asyncio.run(main())
+
+
+def test_work_runs_off_the_loop_thread():
+    async def main():
+        return await aio.run(threading.get_ident), threading.get_ident()
+
+    worker, loop_thread = asyncio.run(main())
+    assert worker != loop_thread
+
+
+def test_cancellation_stops_pending_chunks():
+    aio.configure(max_workers=1)
+    calls = []
+    release = threading.Event()
+
+    def slow(chunk, threads=1, **kwargs):
+        calls.append(len(chunk))
+        release.wait(5)
+        return chunk
+
+    async def main():
+        task = asyncio.ensure_future(
+            _aio_batch(slow, list(range(10)), None, False, 1, {})
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    try:
+        asyncio.run(main())
+        assert calls == [1]
+    finally:
+        aio.configure(max_workers=None)
+        aio.shutdown()
+
+
+def test_configure_validates():
+    with pytest.raises(ValueError):
+        aio.configure(max_workers=0)
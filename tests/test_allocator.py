@@ -0,0 +1,175 @@
+import json
+import threading
+
+import pytest
+
+from togo import (
+    Arena,
+    allocator_stats,
+    from_geojson,
+    from_wkt,
+    get_allocator,
+    set_allocator,
+)
+
+WKT = "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0), (2 2, 4 2, 4 4, 2 4, 2 2))"
+AREA = from_wkt(WKT).area
+
+
+def test_stats_track_live_allocations():
+    before = allocator_stats()
+    geom = from_wkt(WKT)
+    during = allocator_stats()
+    assert during["live_blocks"] > before["live_blocks"]
+    assert during["live_bytes"] > before["live_bytes"]
+    assert during["allocs"] > before["allocs"]
+    del geom
+    after = allocator_stats()
+    assert after["live_bytes"] == before["live_bytes"]
+    assert after["frees"] > before["frees"]
+    assert allocator_stats(reset_peak=True)["peak_bytes"] >= after["live_bytes"]
+    assert allocator_stats()["peak_bytes"] == allocator_stats()["live_bytes"]
+
+
+@pytest.mark.parametrize("backend", ["malloc", "pymem"])
+def test_peak_covers_realloc_growth(backend):
+    # GeoJSON foreign members are collected in a buffer grown with realloc.
+    extra = "x" * 200_000
+    doc = json.dumps({"type": "Point", "coordinates": [1, 2], "foo": extra})
+    set_allocator(backend)
+    try:
+        before = allocator_stats(reset_peak=True)["live_bytes"]
+        geom = from_geojson(doc)
+        stats = allocator_stats()
+    finally:
+        set_allocator("malloc")
+    assert stats["reallocs"] > 0
+    assert stats["peak_bytes"] >= stats["live_bytes"]
+    assert stats["peak_bytes"] - before >= len(extra)
+    del geom
+
+
+def test_pymem_allocator_round_trip():
+    assert get_allocator() == "malloc"
+    made_with_malloc = from_wkt(WKT)
+    set_allocator("pymem")
+    try:
+        assert get_allocator() == "pymem"
+        made_with_pymem = from_wkt(WKT)
+        assert made_with_pymem.equals(made_with_malloc)
+    finally:
+        set_allocator("malloc")
+    del made_with_pymem, made_with_malloc
+    with pytest.raises(ValueError):
+        set_allocator("jemalloc")
+
+
+def test_arena_scope():
+    before = allocator_stats()["live_bytes"]
+    with Arena(chunk_size=4096) as arena:
+        assert arena.active
+        geoms = [from_wkt(WKT) for _ in range(100)]
+        assert arena.live_blocks >= 100
+        assert arena.reserved_bytes >= 4096
+        assert all(g.area == pytest.approx(AREA) for g in geoms)
+        del geoms
+        assert arena.live_blocks == 0
+        kept = from_wkt(WKT)
+    assert not arena.active
+    assert arena.live_blocks is None
+    # Geometries may outlive the scope; the arena is freed with the last one.
+    assert kept.area == pytest.approx(AREA)
+    assert kept.buffer(1.0).area > AREA
+    del kept
+    assert allocator_stats()["live_bytes"] == before
+
+
+def test_arena_is_per_thread_and_nested():
+    results = {}
+    with Arena() as outer:
+        with Arena() as inner:
+            from_wkt(WKT)
+            thread = threading.Thread(target=lambda: results.update(geom=from_wkt(WKT)))
+            thread.start()
+            thread.join()
+            assert inner.live_blocks == 0
+        assert outer.live_blocks == 0
+        with pytest.raises(RuntimeError):
+            outer.__enter__()
+    assert results["geom"].area == pytest.approx(AREA)
+
+
+def test_arena_exit_order_is_checked():
+    outer = Arena()
+    inner = Arena()
+    outer.__enter__()
+    inner.__enter__()
+    with pytest.raises(RuntimeError):
+        outer.__exit__(None, None, None)
+    # The misordered exit still unlinks ``outer``; ``inner`` stays current.
+    assert not outer.active
+    from_wkt(WKT)
+    inner.__exit__(None, None, None)
+    outer.__exit__(None, None, None)
+    with pytest.raises(ValueError):
+        Arena(chunk_size=16)
+
+
+def test_arena_closed_from_other_thread():
+    arenas = []
+    entered = threading.Event()
+    closed = threading.Event()
+
+    def worker():
+        arenas.append(Arena().__enter__())
+        entered.set()
+        closed.wait()
+        arenas.append(from_wkt(WKT))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    entered.wait()
+    with pytest.raises(RuntimeError):
+        arenas[0].__exit__(None, None, None)
+    assert not arenas[0].active
+    closed.set()
+    thread.join()
+    assert arenas[1].area == pytest.approx(AREA)
+
+
+def test_arena_left_open_is_released_at_thread_exit():
+    results = {}
+
+    def worker():
+        results["arena"] = Arena().__enter__()
+        results["geom"] = from_wkt(WKT)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    arena = results["arena"]
+    assert arena.live_blocks >= 1
+    # A later thread may reuse the same thread-local slot; it must not see the arena.
+    thread = threading.Thread(target=lambda: results.update(other=from_wkt(WKT)))
+    thread.start()
+    thread.join()
+    blocks = arena.live_blocks
+    del results["other"]
+    assert arena.live_blocks == blocks
+    with pytest.raises(RuntimeError):
+        arena.__exit__(None, None, None)
+    assert results.pop("geom").area == pytest.approx(AREA)
+
+
+def test_dropped_arena_is_closed():
+    before = allocator_stats()["live_bytes"]
+    arena = Arena()
+    arena.__enter__()
+    kept = from_wkt(WKT)
+    del arena
+    with Arena() as probe:
+        from_wkt(WKT)
+    assert probe.live_blocks is None
+    assert kept.area == pytest.approx(AREA)
+    del kept
+    assert allocator_stats()["live_bytes"] == before
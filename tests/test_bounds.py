@@ -0,0 +1,79 @@
+import math
+
+import pytest
+
+from togo import (
+    Line,
+    LineString,
+    Point,
+    Poly,
+    Polygon,
+    Rect,
+    RectArray,
+    Ring,
+    Segment,
+    bounds,
+    box,
+    from_wkt,
+    total_bounds,
+)
+
+
+def _mixed():
+    return [
+        from_wkt("MULTIPOINT ((1 2), (3 -4))"),
+        Poly(Ring([(0, 0), (4, 0), (4, 3), (0, 3)])),
+        Polygon([(10, 10), (12, 10), (12, 11)]),
+        Ring([(-1, -1), (1, -1), (1, 1)]),
+        Line([(5, 5), (7, 9)]),
+        LineString([(2, 2), (3, 1)]),
+        Point(8, -2),
+        Rect(Point(0, 0), Point(1, 1)),
+        Segment((3, 3), (1, 6)),
+        box(-5, -6, -4, -3),
+    ]
+
+
+def test_bounds_rows_match_bounds_property():
+    geoms = _mixed()
+    rows = bounds(geoms)
+    assert rows.shape == (len(geoms), 4)
+    expected = [
+        (1.0, -4.0, 3.0, 2.0),
+        (0.0, 0.0, 4.0, 3.0),
+        (10.0, 10.0, 12.0, 11.0),
+        (-1.0, -1.0, 1.0, 1.0),
+        (5.0, 5.0, 7.0, 9.0),
+        (2.0, 1.0, 3.0, 2.0),
+        (8.0, -2.0, 8.0, -2.0),
+        (0.0, 0.0, 1.0, 1.0),
+        (1.0, 3.0, 3.0, 6.0),
+        (-5.0, -6.0, -4.0, -3.0),
+    ]
+    assert [tuple(rows[i, j] for j in range(4)) for i in range(len(geoms))] == expected
+    for i in (0, 1, 4, 6, 9):
+        assert tuple(rows[i, j] for j in range(4)) == tuple(geoms[i].bounds)
+
+
+def test_bounds_accepts_iterables_and_empty():
+    assert len(bounds([])) == 0
+    rows = bounds(g for g in [box(0, 0, 1, 1)])
+    assert rows.shape == (1, 4)
+    with pytest.raises(TypeError):
+        bounds([object()])
+
+
+def test_rect_array_bounds_of_accepts_mixed_classes():
+    geoms = _mixed()
+    rects = RectArray.bounds_of(geoms)
+    rows = bounds(geoms)
+    assert list(rects.minx) == [rows[i, 0] for i in range(len(geoms))]
+    assert list(rects.maxy) == [rows[i, 3] for i in range(len(geoms))]
+
+
+def test_total_bounds_skips_empty_geometries():
+    geoms = _mixed() + [from_wkt("POLYGON EMPTY")]
+    assert total_bounds(geoms) == (-5.0, -6.0, 12.0, 11.0)
+    assert total_bounds([from_wkt("POINT (3 4)")]) == (3.0, 4.0, 3.0, 4.0)
+    assert all(math.isnan(v) for v in total_bounds([]))
+    assert all(math.isnan(v) for v in total_bounds([from_wkt("LINESTRING EMPTY")]))
@@ -0,0 +1,98 @@
+import gc
+
+import pytest
+
+from togo import (
+    Line,
+    Point,
+    Poly,
+    Ring,
+    allocator_stats,
+    box,
+    from_wkt,
+    get_cache_policy,
+    set_cache_policy,
+)
+
+SQUARE = [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]
+
+
+@pytest.fixture(autouse=True)
+def restore_policy():
+    yield
+    set_cache_policy("on")
+
+
+def test_default_caches_on_the_object():
+    ring = Ring(SQUARE)
+    assert ring.as_geometry() is ring.as_geometry()
+    assert get_cache_policy()["mode"] == "on"
+
+
+def test_as_geometry_shares_native_structures():
+    ring, line = Ring(SQUARE), Line(SQUARE)
+    poly = Poly(ring, [Ring([(2, 2), (4, 2), (4, 4), (2, 4)])])
+    before = allocator_stats()
+    views = [ring.as_geometry(), line.as_geometry(), poly.as_geometry()]
+    assert allocator_stats()["live_bytes"] == before["live_bytes"]
+    assert views[0].memsize == ring.memsize
+    assert views[2].area == poly.as_geometry().area
+
+
+def test_off_rebuilds_every_time():
+    set_cache_policy("off")
+    ring = Ring(SQUARE)
+    assert ring.as_geometry() is not ring.as_geometry()
+    assert ring.as_geometry().equals(ring.as_geometry())
+    geom = from_wkt("POINT (1 2)")
+    assert geom.__geo_interface__ == {"type": "Point", "coordinates": [1.0, 2.0]}
+
+
+def test_weak_reuses_only_live_views():
+    set_cache_policy("weak")
+    point = Point(1, 2)
+    view = point.as_geometry()
+    assert point.as_geometry() is view
+    del view
+    gc.collect()
+    assert point.as_geometry().equals(from_wkt("POINT (1 2)"))
+    poly = Poly(Ring(SQUARE))
+    assert poly.__geo_interface__["type"] == "Polygon"
+
+
+def test_lru_respects_byte_budget():
+    set_cache_policy("lru", max_bytes=4096)
+    polys = [Poly(Ring([(i, 0), (i + 1, 0), (i + 1, 1), (i, 1)])) for i in range(200)]
+    for poly in polys:
+        assert poly.__geo_interface__["type"] == "Polygon"
+    info = get_cache_policy()
+    assert info["mode"] == "lru" and info["max_bytes"] == 4096
+    assert 0 < info["bytes"] <= 4096
+    assert 0 < info["entries"] < 200
+    # The most recent entry survives and is still served from cache.
+    assert polys[-1].__geo_interface__["coordinates"][0][0] == (199.0, 0.0)
+    del polys, poly
+    gc.collect()
+    assert get_cache_policy()["entries"] == 0
+    assert get_cache_policy()["bytes"] == 0
+
+
+def test_lru_geometry_views_and_switching_modes():
+    set_cache_policy("lru", max_bytes=1 << 20)
+    rings = [Ring(SQUARE) for _ in range(10)]
+    views = [r.as_geometry() for r in rings]
+    assert all(r.as_geometry() is v for r, v in zip(rings, views))
+    assert get_cache_policy()["entries"] == 10
+    set_cache_policy("on")
+    assert get_cache_policy()["entries"] == 0
+    assert rings[0].as_geometry() is not views[0]
+    assert box(0, 0, 1, 1).__geo_interface__["type"] == "Polygon"
+
+
+def test_policy_validation():
+    with pytest.raises(ValueError):
+        set_cache_policy("sometimes")
+    with pytest.raises(ValueError):
+        set_cache_policy("lru")
+    with pytest.raises(ValueError):
+        set_cache_policy("on", max_bytes=10)
@@ -328,3 +328,88 @@ class TestConvexHullEdgeCases:
         assert hull.geom_type == "Point"
         # Verify coordinates are preserved
         assert "POINT(5 5)" in hull.to_wkt()
+
+
+class TestNativeConvexHull:
+    """Test the native (monotone chain) convex hull path"""
+
+    def test_large_multipoint_hull(self):
+        """Hull of a dense point grid is its bounding square"""
+        points = [(x, y) for x in range(50) for y in range(50)]
+        hull = MultiPoint(points).convex_hull
+        assert hull.geom_type == "Polygon"
+        assert hull.bounds == (0.0, 0.0, 49.0, 49.0)
+        assert abs(hull.area - 49.0 * 49.0) < 1e-9
+        # Collinear boundary points are dropped from the hull
+        assert len(hull.exterior.coords) == 5
+
+    def test_multipoint_with_duplicates(self):
+        """Duplicate points do not affect the hull"""
+        points = [(0, 0), (0, 0), (2, 0), (2, 0), (1, 2), (1, 2), (1, 1)]
+        hull = MultiPoint(points).convex_hull
+        assert hull.geom_type == "Polygon"
+        assert abs(hull.area - 2.0) < 1e-9
+
+    def test_convex_polygon_fast_path(self):
+        """Convex polygon exterior is reused as the hull"""
+        geom = Geometry(
+            "POLYGON((0 0, 4 0, 4 4, 0 4, 0 0), (1 1, 2 1, 2 2, 1 2, 1 1))", fmt="wkt"
+        )
+        hull = geom.convex_hull
+        assert hull.geom_type == "Polygon"
+        assert len(hull.interiors) == 0
+        assert abs(hull.area - 16.0) < 1e-9
+
+    def test_multipolygon_hull(self):
+        """Hull spans all polygons of a MultiPolygon"""
+        geom = Geometry(
+            "MULTIPOLYGON(((0 0, 1 0, 1 1, 0 1, 0 0)), ((3 3, 4 3, 4 4, 3 4, 3 3)))",
+            fmt="wkt",
+        )
+        hull = geom.convex_hull
+        assert hull.geom_type == "Polygon"
+        assert hull.contains(geom)
+        assert hull.bounds == (0.0, 0.0, 4.0, 4.0)
+
+    def test_geometrycollection_hull(self):
+        """Hull collects vertices from every collection member"""
+        geom = Geometry(
+            "GEOMETRYCOLLECTION(POINT(0 0), LINESTRING(4 0, 4 4), POINT(0 4))",
+            fmt="wkt",
+        )
+        hull = geom.convex_hull
+        assert hull.geom_type == "Polygon"
+        assert abs(hull.area - 16.0) < 1e-9
+
+    def test_collinear_multipoint_falls_back(self):
+        """Collinear points still produce a LineString hull"""
+        hull = MultiPoint([(0, 0), (1, 1), (2, 2), (3, 3)]).convex_hull
+        assert hull.geom_type == "LineString"
+
+    @pytest.mark.parametrize(
+        "wkt, expected",
+        [
+            ("MULTIPOINT((0 0),(2 0),(1 1),(1 0.2))", "POLYGON((0 0,1 1,2 0,0 0))"),
+            ("POLYGON((0 0,0 2,2 2,2 0,0 0))", "POLYGON((0 0,0 2,2 2,2 0,0 0))"),
+            ("POLYGON((0 0,2 0,2 2,0 2,0 0))", "POLYGON((0 0,0 2,2 2,2 0,0 0))"),
+            (
+                "MULTIPOINT((5 1),(0 3),(3 -2),(4 4),(-1 0),(2 2))",
+                "POLYGON((3 -2,-1 0,0 3,4 4,5 1,3 -2))",
+            ),
+            ("LINESTRING(3 3,0 0,1 5,4 1)", "POLYGON((0 0,1 5,3 3,4 1,0 0))"),
+            (
+                "MULTIPOINT((1 0),(0 1),(2 1),(1 2),(0 0))",
+                "POLYGON((0 0,0 1,1 2,2 1,1 0,0 0))",
+            ),
+            # Convex polygons lose collinear and repeated vertices, like GEOS.
+            ("POLYGON((0 0,2 0,4 0,4 4,0 4,0 0))", "POLYGON((0 0,0 4,4 4,4 0,0 0))"),
+            ("POLYGON((0 0,4 0,4 0,4 4,0 4,0 0))", "POLYGON((0 0,0 4,4 4,4 0,0 0))"),
+            (
+                "POLYGON((0 0,4 0,4 2,4 4,2 4,0 4,0 2,0 0))",
+                "POLYGON((0 0,0 4,4 4,4 0,0 0))",
+            ),
+        ],
+    )
+    def test_hull_orientation_matches_geos(self, wkt, expected):
+        """Hulls run clockwise from the lowest, then leftmost, vertex like GEOS"""
+        assert Geometry(wkt, fmt="wkt").convex_hull.wkt == expected
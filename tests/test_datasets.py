@@ -0,0 +1,103 @@
+import pytest
+
+import togo
+from togo import datasets
+from togo.datasets import coastline, gps_points, road_network, star_polygon
+
+
+def test_exposed_as_submodule():
+    assert togo.datasets is datasets
+    assert set(datasets.__all__) == {
+        "star_polygon",
+        "coastline",
+        "road_network",
+        "gps_points",
+    }
+
+
+@pytest.mark.parametrize("holes", [0, 1, 5])
+def test_star_polygon_is_valid_with_holes(holes):
+    poly = star_polygon(200, holes=holes, radius=10.0, center=(3, 4), seed=7)
+    assert poly.geom_type == "Polygon"
+    assert poly.is_valid
+    assert len(poly.exterior.coords) == 201
+    assert len(poly.interiors) == holes
+    minx, miny, maxx, maxy = poly.bounds
+    assert -7 <= minx and maxx <= 13 and -6 <= miny and maxy <= 14
+    assert poly.contains(togo.Point(3, 4)) or holes
+
+
+@pytest.mark.parametrize("vertices", [4, 5, 6, 8, 12, 20])
+@pytest.mark.parametrize("holes", [1, 2, 5])
+def test_star_polygon_holes_fit_few_vertices(vertices, holes):
+    for seed in range(50):
+        poly = star_polygon(vertices, holes=holes, seed=seed)
+        assert poly.is_valid, (vertices, holes, seed)
+        assert len(poly.interiors) == holes
+
+
+def test_generators_are_deterministic():
+    for make in (
+        lambda s: star_polygon(500, holes=3, seed=s),
+        lambda s: coastline(1000, seed=s),
+        lambda s: road_network(10, 20, seed=s),
+        lambda s: gps_points(1000, clusters=4, seed=s),
+    ):
+        assert make(1).to_wkb() == make(1).to_wkb()
+        assert make(1).to_wkb() != make(2).to_wkb()
+
+
+@pytest.mark.parametrize("roughness", [0.0, 0.5, 1.0])
+def test_coastline_is_simple_fractal_ring(roughness):
+    coast = coastline(4096, roughness=roughness, radius=5.0, seed=3)
+    assert coast.is_valid
+    assert len(coast.exterior.coords) == 4097
+    assert coast.exterior.length > 2 * 3.14159 * 2.5
+    assert (
+        coastline(1000, roughness=1.0).exterior.length
+        > coastline(1000, roughness=0.0).exterior.length
+    )
+
+
+def test_road_network_crosses_extent():
+    roads = road_network(12, 50, extent=(0, 0, 10, 5), seed=2)
+    assert roads.geom_type == "MultiLineString"
+    assert len(roads.geoms) == 12
+    assert all(len(line.coords) == 50 for line in roads.geoms)
+    assert roads.bounds == (0.0, 0.0, 10.0, 5.0)
+    assert roads.geoms[0].intersects(roads.geoms[1])
+
+
+def test_gps_points_are_clustered_in_extent():
+    pts = gps_points(5000, clusters=3, spread=0.01, extent=(10, 20, 11, 21), seed=4)
+    assert pts.geom_type == "MultiPoint"
+    assert len(pts.geoms) == 5000
+    minx, miny, maxx, maxy = pts.bounds
+    assert 10 <= minx and maxx <= 11 and 20 <= miny and maxy <= 21
+    rounded = {(round(p.x, 1), round(p.y, 1)) for p in pts.geoms}
+    assert len(rounded) < 30
+    assert gps_points(0).is_empty
+
+
+def test_large_inputs_build_quickly():
+    assert len(star_polygon(1_000_000, holes=10).exterior.coords) == 1_000_001
+    assert len(coastline(1_000_000).exterior.coords) == 1_000_001
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        star_polygon(2)
+    with pytest.raises(ValueError):
+        star_polygon(3, holes=1)
+    with pytest.raises(ValueError):
+        star_polygon(10, holes=-1)
+    with pytest.raises(ValueError):
+        coastline(100, roughness=2)
+    with pytest.raises(ValueError):
+        road_network(0)
+    with pytest.raises(ValueError):
+        road_network(3, extent=(1, 1, 0, 0))
+    with pytest.raises(ValueError):
+        gps_points(10, clusters=0)
+    with pytest.raises(ValueError):
+        gps_points(10, spread=-1)
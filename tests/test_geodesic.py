@@ -0,0 +1,112 @@
+import array
+import math
+
+import pytest
+
+from togo import (
+    Geometry,
+    LineString,
+    Point,
+    Polygon,
+    geodesic_area,
+    geodesic_areas,
+    geodesic_distance,
+    geodesic_distances,
+    geodesic_length,
+    geodesic_lengths,
+)
+
+# One degree of longitude along the equator on WGS84 and on the mean sphere
+EQUATOR_DEGREE_WGS84 = 111319.49079327357
+MERIDIAN_DEGREE_SPHERE = 6371008.8 * math.pi / 180.0
+
+
+def test_geodesic_distance_vincenty_equator():
+    d = geodesic_distance((0, 0), (1, 0))
+    assert d == pytest.approx(EQUATOR_DEGREE_WGS84, rel=1e-9)
+
+
+def test_geodesic_distance_haversine():
+    d = geodesic_distance(Point(0, 0), Point(0, 1), method="haversine")
+    assert d == pytest.approx(MERIDIAN_DEGREE_SPHERE, rel=1e-12)
+
+
+def test_geodesic_distance_same_point():
+    assert geodesic_distance((12.5, 41.9), (12.5, 41.9)) == 0.0
+
+
+def test_geodesic_distance_methods_agree_roughly():
+    london = (-0.1246, 51.5007)
+    new_york = (-74.0445, 40.6892)
+    v = geodesic_distance(london, new_york)
+    h = geodesic_distance(london, new_york, method="haversine")
+    assert v == pytest.approx(5_589_857, rel=1e-5)
+    assert abs(v - h) / v < 0.005
+
+
+def test_geodesic_distance_invalid_method():
+    with pytest.raises(ValueError):
+        geodesic_distance((0, 0), (1, 1), method="euclid")
+
+
+def test_geodesic_distances_vectorized():
+    a = array.array("d", [0, 0, 0, 0])
+    b = array.array("d", [1, 0, 0, 1])
+    out = geodesic_distances(
+        memoryview(a).cast("B").cast("d", (2, 2)),
+        memoryview(b).cast("B").cast("d", (2, 2)),
+        method="haversine",
+    )
+    assert len(out) == 2
+    assert out[0] == pytest.approx(MERIDIAN_DEGREE_SPHERE, rel=1e-12)
+    assert out[1] == pytest.approx(MERIDIAN_DEGREE_SPHERE, rel=1e-12)
+
+
+def test_geodesic_distances_shape_mismatch():
+    a = memoryview(array.array("d", [0, 0, 1, 1])).cast("B").cast("d", (2, 2))
+    b = memoryview(array.array("d", [0, 0])).cast("B").cast("d", (1, 2))
+    with pytest.raises(ValueError):
+        geodesic_distances(a, b)
+
+
+def test_geodesic_length_linestring():
+    line = LineString([(0, 0), (1, 0), (2, 0)])
+    assert geodesic_length(line) == pytest.approx(2 * EQUATOR_DEGREE_WGS84, rel=1e-9)
+
+
+def test_geodesic_length_multilinestring_and_point():
+    g = Geometry("MULTILINESTRING((0 0, 1 0), (5 0, 6 0))", fmt="wkt")
+    assert geodesic_length(g) == pytest.approx(2 * EQUATOR_DEGREE_WGS84, rel=1e-9)
+    assert geodesic_length(Point(1, 1)) == 0.0
+
+
+def test_geodesic_area_one_degree_cell():
+    cell = Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)])
+    r = 6371007.1809
+    expected = r * r * math.radians(1) * math.sin(math.radians(1))
+    assert geodesic_area(cell) == pytest.approx(expected, rel=1e-9)
+
+
+def test_geodesic_area_orientation_and_holes():
+    ccw = Polygon([(0, 0), (2, 0), (2, 2), (0, 2), (0, 0)])
+    cw = Polygon([(0, 0), (0, 2), (2, 2), (2, 0), (0, 0)])
+    assert geodesic_area(ccw) == pytest.approx(geodesic_area(cw))
+    holed = Polygon(
+        [(0, 0), (2, 0), (2, 2), (0, 2), (0, 0)],
+        [[(0.5, 0.5), (1.5, 0.5), (1.5, 1.5), (0.5, 1.5), (0.5, 0.5)]],
+    )
+    assert geodesic_area(holed) < geodesic_area(ccw)
+    assert geodesic_area(LineString([(0, 0), (1, 1)])) == 0.0
+
+
+def test_geodesic_batch_forms_match_scalar():
+    geoms = [
+        Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]),
+        LineString([(0, 0), (3, 4)]),
+        Geometry("MULTIPOLYGON(((10 10, 11 10, 11 11, 10 11, 10 10)))", fmt="wkt"),
+    ]
+    lengths = geodesic_lengths(geoms)
+    areas = geodesic_areas(geoms)
+    assert list(lengths) == [geodesic_length(g) for g in geoms]
+    assert list(areas) == [geodesic_area(g) for g in geoms]
+    assert len(geodesic_areas([])) == 0
@@ -0,0 +1,102 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from togo import GeometryArray, Point, Polygon, box, from_wkt
+
+WKTS = [
+    "POINT (1 2)",
+    "LINESTRING (0 0, 1 1, 2 0)",
+    "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0), (2 2, 4 2, 4 4, 2 4, 2 2))",
+    "MULTIPOINT ((1 1), (2 2))",
+    "MULTILINESTRING ((0 0, 1 1), (2 2, 3 3, 4 2))",
+    "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)), ((5 5, 6 5, 6 6, 5 5)))",
+    "GEOMETRYCOLLECTION (POINT (1 1), GEOMETRYCOLLECTION (LINESTRING (0 0, 1 1)))",
+    "POINT EMPTY",
+    "LINESTRING EMPTY",
+    "POLYGON EMPTY",
+    "MULTIPOLYGON EMPTY",
+    "GEOMETRYCOLLECTION EMPTY",
+]
+
+
+def _geoms():
+    return [from_wkt(w) for w in WKTS]
+
+
+def test_round_trip_all_types():
+    geoms = _geoms()
+    arr = GeometryArray(geoms)
+    assert len(arr) == len(geoms)
+    for g, r in zip(geoms, arr):
+        assert r.to_wkt() == g.to_wkt()
+    assert arr[-1].is_empty
+    assert arr[0] is arr[0]
+    with pytest.raises(IndexError):
+        arr[len(geoms)]
+
+
+def test_accepts_geometry_classes_and_drops_z():
+    arr = GeometryArray(
+        [Point(1, 2), box(0, 0, 1, 1), Polygon([(0, 0), (2, 0), (2, 2)])]
+    )
+    assert arr[1].area == 1.0
+    assert arr[2].area == 2.0
+    z = GeometryArray([from_wkt("LINESTRING Z (0 0 5, 1 1 6)")])[0]
+    assert not z.has_z
+    assert z.to_wkt() == "LINESTRING(0 0,1 1)"
+
+
+def test_from_buffer_validates_header():
+    arr = GeometryArray(_geoms())
+    copy = GeometryArray.from_buffer(bytearray(arr.buffer))
+    assert copy.nbytes == arr.nbytes
+    assert copy[2].to_wkt() == arr[2].to_wkt()
+    with pytest.raises(ValueError):
+        GeometryArray.from_buffer(bytearray(64))
+    with pytest.raises(ValueError):
+        GeometryArray.from_buffer(bytearray(arr.buffer)[: arr.nbytes - 8])
+
+
+def test_corrupt_nodes_raise_value_error():
+    data = bytearray(GeometryArray([from_wkt("LINESTRING (0 0, 1 1)")]).buffer)
+    # header (40) + offsets (16), then the first node's type field
+    data[56] = 9
+    with pytest.raises(ValueError):
+        GeometryArray.from_buffer(data)[0]
+
+
+def test_pickle_without_shared_memory():
+    arr = GeometryArray(_geoms())
+    clone = pickle.loads(pickle.dumps(arr))
+    assert [g.to_wkt() for g in clone] == [g.to_wkt() for g in arr]
+
+
+def test_close_releases_buffer():
+    arr = GeometryArray([Point(0, 0)])
+    with arr:
+        assert arr[0].to_wkt() == "POINT(0 0)"
+    with pytest.raises(ValueError):
+        arr[0]
+
+
+def _worker_areas(shared):
+    with shared:
+        return [g.area for g in shared]
+
+
+def test_shared_memory_in_worker_processes():
+    geoms = [box(i, 0, i + 1 + i % 3, 2) for i in range(100)]
+    shared = GeometryArray(geoms).to_shared_memory()
+    try:
+        assert shared.shm_name
+        attached = GeometryArray.from_shared_memory(shared.shm_name)
+        assert attached[5].area == geoms[5].area
+        attached.close()
+        with ProcessPoolExecutor(2) as pool:
+            results = list(pool.map(_worker_areas, [shared, shared]))
+        assert results[0] == results[1] == [g.area for g in geoms]
+    finally:
+        shared.close()
+        shared.unlink()
@@ -0,0 +1,127 @@
+import multiprocessing
+
+import pytest
+
+from togo import GeometryIndex, Point, Polygon, box, from_wkt
+
+
+def _cells():
+    return [
+        box(i, j, i + 1.5, j + 1.5) for i in range(0, 40, 2) for j in range(0, 40, 2)
+    ]
+
+
+def _brute_force(geoms, query):
+    minx, miny, maxx, maxy = query
+    return [
+        i
+        for i, g in enumerate(geoms)
+        if not (
+            g.bounds[2] < minx
+            or g.bounds[3] < miny
+            or g.bounds[0] > maxx
+            or g.bounds[1] > maxy
+        )
+    ]
+
+
+def test_in_memory_queries():
+    cells = _cells()
+    index = GeometryIndex(cells)
+    assert len(index) == 400
+    assert index.bounds == (0.0, 0.0, 39.5, 39.5)
+    for q in [(0, 0, 3, 3), (10.2, 10.2, 10.3, 10.3), (-5, -5, 100, 100)]:
+        assert list(index.query(q)) == _brute_force(cells, q)
+    assert list(index.query_geom(Point(1.25, 1.25), predicate="within")) == [0]
+    assert index[0].equals(cells[0])
+
+
+def test_save_and_open_round_trip(tmp_path):
+    cells = _cells()
+    cells[5] = Polygon(
+        [(10, 10), (20, 10), (20, 20), (10, 20)],
+        holes=[[(12, 12), (18, 12), (18, 18), (12, 18)]],
+    )
+    path = tmp_path / "cells.idx"
+    GeometryIndex(cells).save(path)
+    mapped = GeometryIndex.open(path)
+    assert len(mapped) == len(cells)
+    assert "mapped" in repr(mapped)
+    assert mapped.bounds == GeometryIndex(cells).bounds
+    for q in [(0, 0, 3, 3), (15, 15, 16, 16), (-5, -5, 100, 100)]:
+        assert list(mapped.query(q)) == _brute_force(cells, q)
+    # Inside the hole of cells[5]: not within it, but within the overlapping cell
+    hits = list(mapped.query_geom(Point(15, 15), predicate="within"))
+    assert 5 not in hits
+    assert mapped[5].equals(cells[5])
+    assert mapped[-1].equals(cells[-1])
+    with pytest.raises(IndexError):
+        mapped[len(cells)]
+
+
+def test_resave_mapped_index(tmp_path):
+    cells = _cells()
+    first = tmp_path / "a.idx"
+    second = tmp_path / "b.idx"
+    GeometryIndex(cells).save(first)
+    GeometryIndex.open(first).save(second)
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_empty_index(tmp_path):
+    path = tmp_path / "empty.idx"
+    GeometryIndex([]).save(path)
+    mapped = GeometryIndex.open(path)
+    assert len(mapped) == 0
+    assert mapped.bounds is None
+    assert list(mapped.query((0, 0, 1, 1))) == []
+
+
+def test_mixed_geometry_types(tmp_path):
+    geoms = [
+        from_wkt("POINT (1 1)"),
+        from_wkt("LINESTRING (0 0, 5 5)"),
+        from_wkt(
+            "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 1, 0 0)), ((3 3, 4 3, 4 4, 3 4, 3 3)))"
+        ),
+    ]
+    path = tmp_path / "mixed.idx"
+    GeometryIndex(geoms).save(path)
+    mapped = GeometryIndex.open(path)
+    assert [mapped[i].geom_type for i in range(3)] == [
+        "Point",
+        "LineString",
+        "MultiPolygon",
+    ]
+    assert list(mapped.query_geom(box(2.5, 2.5, 3.5, 3.5))) == [1, 2]
+
+
+def test_invalid_files(tmp_path):
+    bad = tmp_path / "bad.idx"
+    bad.write_bytes(b"not an index file at all, definitely not" * 4)
+    with pytest.raises(ValueError):
+        GeometryIndex.open(bad)
+    short = tmp_path / "short.idx"
+    short.write_bytes(b"TOGO")
+    with pytest.raises(ValueError):
+        GeometryIndex.open(short)
+    path = tmp_path / "ok.idx"
+    GeometryIndex(_cells()).save(path)
+    truncated = tmp_path / "truncated.idx"
+    truncated.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(ValueError):
+        GeometryIndex.open(truncated)
+    with pytest.raises(ValueError):
+        GeometryIndex(_cells(), node_size=1)
+
+
+def _query_in_worker(path):
+    index = GeometryIndex.open(path)
+    return list(index.query_geom(Point(1.25, 1.25), predicate="within"))
+
+
+def test_open_in_worker_processes(tmp_path):
+    path = str(tmp_path / "shared.idx")
+    GeometryIndex(_cells()).save(path)
+    with multiprocessing.get_context("spawn").Pool(2) as pool:
+        assert pool.map(_query_in_worker, [path, path]) == [[0], [0]]
@@ -0,0 +1,81 @@
+import math
+
+import pytest
+
+from togo import Line, Poly, Ring
+
+
+def _circle(n, r=10.0):
+    pts = [
+        (r * math.cos(2 * math.pi * i / n), r * math.sin(2 * math.pi * i / n))
+        for i in range(n)
+    ]
+    return pts + [pts[0]]
+
+
+def _rows(view):
+    return [tuple(view[i, j] for j in range(4)) for i in range(view.shape[0])]
+
+
+# Index rects are stored in single precision, rounded outward.
+EPS = 1e-5
+
+
+def _contains(outer, inner):
+    return (
+        outer[0] <= inner[0] + EPS
+        and outer[1] <= inner[1] + EPS
+        and outer[2] >= inner[2] - EPS
+        and outer[3] >= inner[3] - EPS
+    )
+
+
+def test_ring_index_levels_form_a_hierarchy():
+    ring = Ring(_circle(2000))
+    levels = ring.index_num_levels
+    assert levels >= 1
+    assert ring.index_spread > 1
+    previous = None
+    for level in range(levels):
+        n = ring.index_level_num_rects(level)
+        rects = ring.index_level_rects(level)
+        assert rects.shape == (n, 4)
+        rows = _rows(rects)
+        rect = ring.rect()
+        for row in rows:
+            assert row[0] <= row[2] and row[1] <= row[3]
+            assert row[0] >= rect.min.x - EPS and row[3] <= rect.max.y + EPS
+        if previous is not None:
+            # Each rect is covered by some rect of the coarser level
+            assert len(rows) >= len(previous)
+            assert all(any(_contains(p, row) for p in previous) for row in rows)
+        previous = rows
+
+
+def test_line_index_levels():
+    line = Line([(i, math.sin(i / 10.0)) for i in range(3000)])
+    assert line.index_num_levels >= 1
+    top = line.index_level_rects(0)
+    assert top.shape[1] == 4
+    assert line.index_level_num_rects(0) == top.shape[0]
+
+
+def test_poly_uses_exterior_index():
+    ring = Ring(_circle(1500))
+    poly = Poly(ring)
+    assert poly.index_num_levels == ring.index_num_levels
+    assert poly.index_spread == ring.index_spread
+    assert _rows(poly.index_level_rects(0)) == _rows(ring.index_level_rects(0))
+
+
+def test_index_level_errors():
+    ring = Ring(_circle(2000))
+    with pytest.raises(IndexError):
+        ring.index_level_rects(ring.index_num_levels)
+    with pytest.raises(IndexError):
+        ring.index_level_num_rects(-1)
+    small = Ring([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)])
+    assert small.index_num_levels == 0
+    assert small.index_spread == 0
+    with pytest.raises(ValueError):
+        small.index_level_rects(0)
@@ -0,0 +1,116 @@
+import math
+
+import pytest
+
+import togo
+from togo import Line, Poly, Polygon, Ring, TGIndex, from_geojson, from_wkb, from_wkt
+
+
+def _circle(n, r=10.0):
+    pts = [
+        (r * math.cos(2 * math.pi * i / n), r * math.sin(2 * math.pi * i / n))
+        for i in range(n)
+    ]
+    return pts + [pts[0]]
+
+
+def _wkt(points):
+    return "POLYGON((" + ", ".join(f"{x} {y}" for x, y in points) + "))"
+
+
+@pytest.fixture
+def restore_policy():
+    policy = togo.get_auto_index_policy()
+    yield
+    togo.set_auto_index_policy(**policy)
+
+
+def test_ring_index_none_and_spread():
+    pts = _circle(1000)
+    assert Ring(pts).index_num_levels > 0
+    assert Ring(pts, index=TGIndex.NONE).index_num_levels == 0
+    assert Ring(pts, index_spread=32).index_spread == 32
+    assert Ring(pts, index=TGIndex.NATURAL, index_spread=8).index_spread == 8
+
+
+def test_line_index_selection():
+    pts = _circle(1000)[:-1]
+    assert Line(pts, index=TGIndex.NONE).index_num_levels == 0
+    assert Line(pts, index=TGIndex.NATURAL, index_spread=64).index_spread == 64
+
+
+def test_index_arguments_are_validated():
+    pts = _circle(100)
+    with pytest.raises(ValueError):
+        Ring(pts, index="sometimes")
+    with pytest.raises(ValueError):
+        Ring(pts, index=99)
+    with pytest.raises(ValueError):
+        Ring(pts, index_spread=1)
+    with pytest.raises(ValueError):
+        Line(pts, index_spread=5000)
+
+
+def test_poly_reindexes_exterior_and_holes():
+    exterior = Ring(_circle(1000, 10.0))
+    hole = Ring(_circle(1000, 5.0))
+    poly = Poly(exterior, [hole], index=TGIndex.NONE)
+    assert poly.index_num_levels == 0
+    assert poly.hole(0).index_num_levels == 0
+    # The caller's rings keep their own index.
+    assert exterior.index_num_levels > 0
+    assert poly.contains(togo.Point(7.5, 0.0))
+    assert not poly.contains(togo.Point(0.0, 0.0))
+
+
+def test_polygon_from_coordinates_with_spread():
+    poly = Polygon(
+        _circle(1000), [_circle(500, 5.0)], index=TGIndex.YSTRIPES, index_spread=32
+    )
+    assert poly.index_spread == 32
+    assert poly.hole(0).index_spread == 32
+    assert poly.area == pytest.approx(Polygon(_circle(1000), [_circle(500, 5.0)]).area)
+
+
+def test_auto_policy_uses_vertex_threshold(restore_policy):
+    togo.set_auto_index_policy(threshold=500, index=TGIndex.NATURAL, index_spread=16)
+    assert Ring(_circle(100), index="auto").index_num_levels == 0
+    big = Ring(_circle(1000), index="auto")
+    assert big.index_num_levels > 0
+    assert big.index_spread == 16
+    poly = Poly(Ring(_circle(1000)), [Ring(_circle(100, 5.0))], index="auto")
+    assert poly.index_num_levels > 0
+    assert poly.hole(0).index_num_levels == 0
+    assert togo.get_auto_index_policy() == {
+        "threshold": 500,
+        "index": TGIndex.NATURAL,
+        "index_spread": 16,
+    }
+
+
+def test_auto_policy_validation(restore_policy):
+    with pytest.raises(ValueError):
+        togo.set_auto_index_policy(threshold=-1)
+    with pytest.raises(ValueError):
+        togo.set_auto_index_policy(index_spread=1)
+
+
+def test_parsers_accept_index_arguments(restore_policy):
+    wkt = _wkt(_circle(1000))
+    assert from_wkt(wkt).exterior.index_num_levels > 0
+    assert from_wkt(wkt, index=TGIndex.NONE).exterior.index_num_levels == 0
+    geojson = from_wkt(wkt).to_geojson()
+    assert from_geojson(geojson, index_spread=64).exterior.index_spread == 64
+    wkb = from_wkt(wkt).to_wkb()
+    assert from_wkb(wkb, index=TGIndex.NONE).exterior.index_num_levels == 0
+
+    togo.set_auto_index_policy(threshold=500)
+    assert from_wkt(_wkt(_circle(100)), index="auto").exterior.index_num_levels == 0
+    assert from_wkt(wkt, index="auto").exterior.index_num_levels > 0
+
+
+def test_parsers_report_errors_with_index():
+    with pytest.raises(ValueError):
+        from_wkt("POLYGON((0 0, 1", index=TGIndex.NONE)
+    with pytest.raises(ValueError):
+        from_wkb(b"\x01\x02", index="auto")
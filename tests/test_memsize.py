@@ -0,0 +1,74 @@
+import sys
+
+from togo import Line, Point, Poly, Rect, Ring, Segment, box, from_wkt, memory_stats
+
+SQUARE = [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]
+
+
+def test_memsize_for_every_class():
+    ring = Ring(SQUARE)
+    line = Line(SQUARE)
+    poly = Poly(ring, [Ring([(2, 2), (4, 2), (4, 4), (2, 4)])])
+    assert ring.memsize >= 5 * 16
+    assert line.memsize >= 5 * 16
+    assert poly.memsize > ring.memsize
+    assert from_wkt("POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0))").memsize > 0
+    assert Point(1, 2).memsize == 0
+    assert Rect(Point(0, 0), Point(1, 1)).memsize == 0
+    assert Segment((0, 0), (1, 1)).memsize == 0
+
+
+def test_memsize_grows_with_vertices():
+    small = Ring([(i, i * i % 7) for i in range(10)])
+    large = Ring([(i, i * i % 7) for i in range(1000)])
+    assert large.memsize > small.memsize + 900 * 16
+
+
+def test_sizeof_includes_native_memory_and_caches():
+    ring = Ring(SQUARE)
+    base = sys.getsizeof(ring)
+    assert base > ring.memsize
+    ring.as_geometry()
+    assert sys.getsizeof(ring) == base
+    point = Point(1, 2)
+    before = sys.getsizeof(point)
+    point.as_geometry()
+    assert sys.getsizeof(point) > before
+    geom = box(0, 0, 1, 1)
+    assert sys.getsizeof(geom) >= geom.memsize
+
+
+def test_sizeof_does_not_double_count_shared_views():
+    coords = [(i, i * i % 7) for i in range(1000)] + [(0, 0)]
+    for obj in (Ring(coords), Line(coords), Poly(Ring(coords))):
+        before = sys.getsizeof(obj)
+        obj.as_geometry()
+        # The view clones the TG structure by refcount: no new native memory.
+        assert sys.getsizeof(obj) == before
+
+
+def test_sizeof_includes_cached_geo_interface():
+    coords = [(i, i * i % 7) for i in range(100)] + [(0, 0)]
+    for obj in (Poly(Ring(coords)), Poly(Ring(coords)).as_geometry()):
+        before = sys.getsizeof(obj)
+        geo = obj.__geo_interface__
+        # Each of the 101 coordinate pairs is a tuple of two floats.
+        assert sys.getsizeof(obj) - before > 101 * sys.getsizeof((0.0, 0.0))
+        assert sys.getsizeof(obj) - before >= sys.getsizeof(geo)
+
+
+def test_memory_stats_counts_live_objects():
+    before = memory_stats()
+    rings = [Ring(SQUARE) for _ in range(10)]
+    lines = [Line(SQUARE) for _ in range(5)]
+    geoms = [from_wkt("POINT (1 2)") for _ in range(3)]
+    during = memory_stats()
+    assert during["rings"] - before["rings"] == 10
+    assert during["lines"] - before["lines"] == 5
+    assert during["geometries"] - before["geometries"] == 3
+    assert during["native_bytes"] > before["native_bytes"]
+    del rings, lines, geoms
+    after = memory_stats()
+    assert after["rings"] == before["rings"]
+    assert after["lines"] == before["lines"]
+    assert after["geometries"] == before["geometries"]
@@ -0,0 +1,76 @@
+import pytest
+
+from togo import (
+    Geometry,
+    LineString,
+    Point,
+    Polygon,
+    buffer_meters,
+    from_meters_grid_many,
+    geodesic_distance,
+    to_meters_grid_many,
+)
+
+
+def _sample_geoms():
+    return [
+        Point(1.0, 2.0),
+        LineString([(1.0, 2.0), (1.001, 2.001)]),
+        Polygon([(1.0, 2.0), (1.01, 2.0), (1.01, 2.01), (1.0, 2.01), (1.0, 2.0)]),
+        Geometry.from_multipoint([]),
+    ]
+
+
+def _as_geometry(obj):
+    return obj if isinstance(obj, Geometry) else obj.as_geometry()
+
+
+def test_to_meters_grid_many_matches_single():
+    origin = Point(1.0, 2.0)
+    geoms = _sample_geoms()
+    projected = to_meters_grid_many(geoms, origin)
+    assert len(projected) == len(geoms)
+    for src, dst in zip(geoms, projected):
+        expected = _as_geometry(src).to_meters_grid(origin)
+        assert dst.to_wkb() == expected.to_wkb()
+
+
+@pytest.mark.parametrize("threads", [1, 3, None])
+def test_meters_grid_many_round_trip(threads):
+    origin = (1.0, 2.0)
+    geoms = _sample_geoms() * 5
+    back = from_meters_grid_many(
+        to_meters_grid_many(geoms, origin, threads=threads), origin
+    )
+    for src, dst in zip(geoms, back):
+        src_bounds = _as_geometry(src).bounds
+        for a, b in zip(src_bounds, dst.bounds):
+            assert a == pytest.approx(b, abs=1e-6)
+
+
+def test_meters_grid_many_empty_input_and_bad_threads():
+    assert to_meters_grid_many([], Point(0, 0)) == []
+    with pytest.raises(ValueError):
+        to_meters_grid_many(_sample_geoms(), Point(0, 0), threads=0)
+    with pytest.raises(TypeError):
+        to_meters_grid_many([None], Point(0, 0))
+
+
+def test_buffer_meters_point_radius():
+    center = Point(12.4964, 41.9028)
+    zone = buffer_meters(center, 500.0)
+    assert zone.geom_type == "Polygon"
+    assert zone.contains(center)
+    _, _, _, maxy = zone.bounds
+    # The buffer extends ~500 m north of the center
+    north = geodesic_distance(
+        (center.x, center.y), (center.x, maxy), method="haversine"
+    )
+    assert north == pytest.approx(500.0, rel=0.02)
+
+
+def test_buffer_meters_zero_distance_and_validation():
+    line = LineString([(0, 0), (0.01, 0.01)])
+    assert buffer_meters(line, 0).to_wkt() == line.as_geometry().to_wkt()
+    with pytest.raises(ValueError):
+        buffer_meters(line, 10.0, cap_style=7)
@@ -0,0 +1,90 @@
+import pytest
+
+from togo import (
+    Point,
+    Polygon,
+    box,
+    buffer_many,
+    difference_many,
+    from_wkt,
+    intersection_many,
+    simplify_many,
+    union_many,
+)
+
+
+def _boxes(n):
+    return [box(i, i % 7, i + 2, i % 7 + 2) for i in range(n)]
+
+
+@pytest.mark.parametrize("threads", [1, 4, None])
+def test_buffer_many_matches_buffer_in_order(threads):
+    geoms = [Point(i, -i) for i in range(50)] + _boxes(30)
+    results = buffer_many(geoms, 0.5, quad_segs=8, threads=threads)
+    assert len(results) == len(geoms)
+    for g, r in zip(geoms, results):
+        expected = g.buffer(0.5, quad_segs=8)
+        assert r.area == pytest.approx(expected.area)
+        assert r.bounds == pytest.approx(expected.bounds)
+
+
+def test_buffer_many_validation_and_zero_distance():
+    geoms = _boxes(3)
+    assert all(r.equals(g) for r, g in zip(buffer_many(geoms, 0), geoms))
+    with pytest.raises(ValueError):
+        buffer_many(geoms, 1.0, cap_style=9)
+    with pytest.raises(ValueError):
+        buffer_many(geoms, 1.0, threads=0)
+    with pytest.raises(TypeError):
+        buffer_many([object()], 1.0)
+    assert buffer_many([], 1.0) == []
+
+
+def test_simplify_many():
+    wavy = Polygon([(0, 0), (5, 0.01), (10, 0), (10, 10), (5, 10.01), (0, 10)])
+    results = simplify_many([wavy] * 20, 0.1, threads=3)
+    expected = wavy.simplify(0.1)
+    assert all(r.equals(expected) for r in results)
+    with pytest.raises(ValueError):
+        simplify_many([wavy], -1)
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_pairwise_overlays_match_methods(threads):
+    left = _boxes(40)
+    right = [box(i + 1, 0, i + 3, 5) for i in range(40)]
+    for func, method in (
+        (intersection_many, "intersection"),
+        (union_many, "union"),
+        (difference_many, "difference"),
+    ):
+        results = func(left, right, threads=threads)
+        assert len(results) == len(left)
+        for a, b, r in zip(left, right, results):
+            assert r.area == pytest.approx(getattr(a, method)(b).area)
+
+
+def test_overlays_broadcast_single_geometry():
+    clip = box(0, 0, 10, 10)
+    geoms = _boxes(20)
+    results = intersection_many(geoms, clip, threads=2)
+    for g, r in zip(geoms, results):
+        assert r.area == pytest.approx(g.intersection(clip).area)
+
+
+def test_overlays_empty_inputs_and_3d():
+    empty = from_wkt("POLYGON EMPTY")
+    square = box(0, 0, 1, 1)
+    assert intersection_many([empty], [square])[0].is_empty
+    assert union_many([empty], [square])[0].equals(square)
+    assert difference_many([square], [empty])[0].equals(square)
+    assert difference_many([empty], [square])[0].is_empty
+    z = from_wkt("POLYGON Z ((0 0 1, 2 0 1, 2 2 1, 0 2 1, 0 0 1))")
+    result = intersection_many([z], [square])[0]
+    assert result.area == pytest.approx(1.0)
+    assert not result.has_z
+
+
+def test_pairwise_length_mismatch():
+    with pytest.raises(ValueError):
+        union_many(_boxes(3), _boxes(2))
@@ -0,0 +1,107 @@
+import array
+import math
+
+import pytest
+
+from togo import Point, PointIndex, Polygon, Rect
+
+
+def _scatter(n):
+    xs = array.array("d", [(i * 7.31) % 100.0 for i in range(n)])
+    ys = array.array("d", [(i * 3.77) % 50.0 for i in range(n)])
+    return xs, ys
+
+
+@pytest.mark.parametrize("cell_size", [None, 0.5, 40.0])
+def test_query_rect_matches_brute_force(cell_size):
+    xs, ys = _scatter(5000)
+    index = PointIndex(xs, ys, cell_size=cell_size)
+    assert len(index) == 5000
+    for q in [
+        (0, 0, 10, 10),
+        (42.5, 12, 57, 13),
+        (-10, -10, 500, 500),
+        (200, 200, 300, 300),
+    ]:
+        expected = [
+            i for i in range(5000) if q[0] <= xs[i] <= q[2] and q[1] <= ys[i] <= q[3]
+        ]
+        result = index.query_rect(q)
+        assert result.typecode == "q"
+        assert list(result) == expected
+
+
+def test_query_rect_accepts_rect():
+    index = PointIndex(array.array("d", [1.0, 5.0]), array.array("d", [1.0, 5.0]))
+    assert list(index.query_rect(Rect(Point(0, 0), Point(2, 2)))) == [0]
+
+
+def test_query_radius():
+    xs, ys = _scatter(3000)
+    index = PointIndex(xs, ys)
+    for cx, cy, r in [(50, 25, 5), (0, 0, 12.5), (99, 49, 0.0)]:
+        expected = [i for i in range(3000) if math.hypot(xs[i] - cx, ys[i] - cy) <= r]
+        assert list(index.query_radius((cx, cy), r)) == expected
+    assert list(index.query_radius(Point(50, 25), 5)) == list(
+        index.query_radius((50, 25), 5)
+    )
+    with pytest.raises(ValueError):
+        index.query_radius((0, 0), -1)
+
+
+def test_query_polygon():
+    xs, ys = _scatter(3000)
+    index = PointIndex(xs, ys)
+    tri = Polygon([(10, 5), (60, 5), (35, 45)])
+    expected = [i for i in range(3000) if tri.intersects(Point(xs[i], ys[i]))]
+    assert expected
+    assert list(index.query_polygon(tri)) == expected
+
+
+def test_nan_points_are_skipped():
+    xs = array.array("d", [0.0, float("nan"), 2.0])
+    ys = array.array("d", [0.0, 1.0, 2.0])
+    index = PointIndex(xs, ys)
+    assert len(index) == 3
+    assert list(index.query_rect((-1, -1, 3, 3))) == [0, 2]
+    assert index.bounds == (0.0, 0.0, 2.0, 2.0)
+
+
+def test_infinite_points_are_skipped():
+    xs = array.array("d", [0.0, float("inf"), 2.0, 1.0])
+    ys = array.array("d", [0.0, 1.0, 2.0, -float("inf")])
+    index = PointIndex(xs, ys)
+    assert list(index.query_rect((-1, -1, 3, 3))) == [0, 2]
+    assert index.bounds == (0.0, 0.0, 2.0, 2.0)
+    with pytest.raises(ValueError):
+        PointIndex(array.array("d", [-1e308, 1e308]), array.array("d", [0.0, 0.0]))
+
+
+def test_degenerate_extent_caps_grid():
+    index = PointIndex(
+        array.array("d", [0, 1e9]), array.array("d", [0, 0]), cell_size=1e-9
+    )
+    assert list(index.query_rect((-1, -1, 1, 1))) == [0]
+    assert list(index.query_rect((1e9 - 1, -1, 1e9 + 1, 1))) == [1]
+    # At most 4 * 2 + 16 cells across the 1e9-wide extent.
+    assert index.cell_size >= 1e9 / 24
+
+
+def test_empty_and_invalid_input():
+    empty = PointIndex(array.array("d"), array.array("d"))
+    assert len(empty) == 0
+    assert empty.bounds is None
+    assert list(empty.query_rect((0, 0, 1, 1))) == []
+    with pytest.raises(ValueError):
+        PointIndex(array.array("d", [1.0]), array.array("d"))
+    with pytest.raises(ValueError):
+        PointIndex(array.array("d", [1.0]), array.array("d", [1.0]), cell_size=0)
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    xs = np.arange(100, dtype=np.float64)
+    ys = np.zeros(100)
+    index = PointIndex(xs, ys)
+    assert list(index.query_rect((10, -1, 12, 1))) == [10, 11, 12]
+    assert np.asarray(index.query_radius((50, 0), 1)).tolist() == [49, 50, 51]
@@ -0,0 +1,93 @@
+import array
+
+import pytest
+
+from togo import Point, Rect, RectArray, box, from_wkt
+
+
+def _rect(minx, miny, maxx, maxy):
+    return Rect(Point(minx, miny), Point(maxx, maxy))
+
+
+@pytest.fixture
+def rects():
+    return RectArray([(0, 0, 2, 2), _rect(5, 5, 6, 8), (1, -3, 4, 1)])
+
+
+def test_construction_and_buffers(rects):
+    assert len(rects) == 3
+    assert list(rects.minx) == [0.0, 5.0, 1.0]
+    assert list(rects.maxy) == [2.0, 8.0, 1.0]
+    assert rects.minx.format == "d" and rects.minx.readonly
+    r = rects[-1]
+    assert (r.min.x, r.min.y, r.max.x, r.max.y) == (1.0, -3.0, 4.0, 1.0)
+    with pytest.raises(IndexError):
+        rects[3]
+
+    flat = array.array("d", [0, 0, 2, 2, 5, 5, 6, 8, 1, -3, 4, 1])
+    from_buffer = RectArray(memoryview(flat).cast("B").cast("d", (3, 4)))
+    from_arrays = RectArray.from_arrays(rects.minx, rects.miny, rects.maxx, rects.maxy)
+    for other in (from_buffer, from_arrays):
+        assert list(other.minx) == list(rects.minx)
+        assert list(other.maxy) == list(rects.maxy)
+    with pytest.raises(ValueError):
+        RectArray.from_arrays(array.array("d", [0]), rects.miny, rects.maxx, rects.maxy)
+    with pytest.raises(TypeError):
+        RectArray(["not a rect"])
+
+
+def test_columns_cannot_resize_the_array(rects):
+    column = rects.maxy
+    with pytest.raises(TypeError):
+        column[0] = 99.0
+    with pytest.raises(AttributeError):
+        column.pop()
+    with pytest.raises(TypeError):
+        del column[:]
+    assert len(rects) == 3 and list(rects.maxy) == [2.0, 8.0, 1.0]
+    assert rects.union().max.y == 8.0
+
+
+def test_area_and_union(rects):
+    assert list(rects.area()) == [4.0, 3.0, 12.0]
+    total = rects.union()
+    assert (total.min.x, total.min.y, total.max.x, total.max.y) == (0.0, -3.0, 6.0, 8.0)
+    with pytest.raises(ValueError):
+        RectArray().union()
+
+
+def test_intersects_and_contains_broadcast(rects):
+    assert list(rects.intersects((1.5, 0.5, 3, 3))) == [1, 0, 1]
+    assert list(rects.intersects(Point(2, 2))) == [1, 0, 0]
+    assert list(rects.contains(_rect(0.5, 0.5, 1, 1))) == [1, 0, 0]
+    assert list(rects.contains(Point(5, 8))) == [0, 1, 0]
+
+
+def test_elementwise_ops(rects):
+    other = RectArray([(1, 1, 3, 3), (0, 0, 1, 1), (2, -1, 3, 0)])
+    assert list(rects.intersects(other)) == [1, 0, 1]
+    assert list(rects.contains(other)) == [0, 0, 1]
+    grown = rects.expand(other)
+    assert list(grown.maxx) == [3.0, 6.0, 4.0]
+    assert list(grown.minx) == [0.0, 0.0, 1.0]
+    with pytest.raises(ValueError):
+        rects.intersects(RectArray([(0, 0, 1, 1)]))
+
+
+def test_expand_broadcast(rects):
+    grown = rects.expand(Point(10, -10))
+    assert list(grown.maxx) == [10.0, 10.0, 10.0]
+    assert list(grown.miny) == [-10.0, -10.0, -10.0]
+    assert list(rects.maxx) == [2.0, 6.0, 4.0]
+
+
+def test_bounds_of_geometries():
+    geoms = [
+        from_wkt("POINT (1 2)"),
+        from_wkt("LINESTRING (0 0, 3 -1)"),
+        box(2, 3, 7, 9),
+    ]
+    rects = RectArray.bounds_of(geoms)
+    for i, g in enumerate(geoms):
+        assert (rects.minx[i], rects.miny[i], rects.maxx[i], rects.maxy[i]) == g.bounds
+    assert len(RectArray.bounds_of([])) == 0
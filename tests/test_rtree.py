@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from togo import Point, Polygon, Rect, RTree, box
+
+
+def _boxes(n):
+    return {
+        i: box((i * 7) % 100, (i * 13) % 100, (i * 7) % 100 + 2, (i * 13) % 100 + 2)
+        for i in range(n)
+    }
+
+
+def _brute_force(items, query):
+    minx, miny, maxx, maxy = query
+    return sorted(
+        i
+        for i, g in items.items()
+        if not (
+            g.bounds[2] < minx
+            or g.bounds[3] < miny
+            or g.bounds[0] > maxx
+            or g.bounds[1] > maxy
+        )
+    )
+
+
+def test_insert_and_query_matches_brute_force():
+    items = _boxes(2000)
+    tree = RTree(items.items())
+    assert len(tree) == 2000
+    for query in [
+        (0, 0, 10, 10),
+        (50, 50, 60, 75),
+        (-5, -5, 200, 200),
+        (500, 500, 501, 501),
+    ]:
+        result = tree.query(query)
+        assert result.typecode == "q"
+        assert list(result) == _brute_force(items, query)
+
+
+def test_query_accepts_rect():
+    tree = RTree([(1, box(0, 0, 1, 1)), (2, box(5, 5, 6, 6))])
+    assert list(tree.query(Rect(Point(-1, -1), Point(2, 2)))) == [1]
+
+
+def test_delete_and_update():
+    items = _boxes(500)
+    tree = RTree(items.items())
+    for i in range(0, 500, 2):
+        tree.delete(i)
+        del items[i]
+    assert len(tree) == 250
+    assert 0 not in tree and 1 in tree
+    assert list(tree.query((-5, -5, 200, 200))) == sorted(items)
+    tree.update(1, box(1000, 1000, 1001, 1001))
+    items[1] = box(1000, 1000, 1001, 1001)
+    assert list(tree.query((999, 999, 1002, 1002))) == [1]
+    assert list(tree.query((0, 0, 50, 50))) == _brute_force(items, (0, 0, 50, 50))
+    for i in list(items):
+        tree.delete(i)
+    assert len(tree) == 0
+    assert tree.bounds is None
+    assert list(tree.query((-5, -5, 2000, 2000))) == []
+
+
+def test_errors():
+    tree = RTree()
+    tree.insert(1, box(0, 0, 1, 1))
+    with pytest.raises(ValueError):
+        tree.insert(1, box(0, 0, 1, 1))
+    with pytest.raises(KeyError):
+        tree.delete(2)
+    with pytest.raises(KeyError):
+        tree.update(2, box(0, 0, 1, 1))
+    with pytest.raises(TypeError):
+        tree.insert(3, None)
+    with pytest.raises(TypeError):
+        tree.query("nope")
+    with pytest.raises(ValueError):
+        tree.query_geom(Point(0, 0), predicate="disjoint")
+
+
+def test_query_geom_predicates():
+    fences = {
+        1: Polygon([(0, 0), (10, 0), (10, 10), (0, 10)]),
+        2: Polygon([(5, 5), (15, 5), (15, 15), (5, 15)]),
+        3: Polygon([(20, 20), (30, 20), (30, 30), (20, 30)]),
+    }
+    tree = RTree(fences.items())
+    assert list(tree.query_geom(Point(7, 7), predicate="within")) == [1, 2]
+    assert list(tree.query_geom(Point(2, 2), predicate="within")) == [1]
+    assert list(tree.query_geom(Point(18, 18))) == []
+    assert list(tree.query_geom(box(-1, -1, 31, 31), predicate="contains")) == [1, 2, 3]
+    assert tree.get(3) is fences[3]
+    assert tree.bounds == (0.0, 0.0, 30.0, 30.0)
+
+
+def test_concurrent_readers_with_writer():
+    items = _boxes(1000)
+    tree = RTree(items.items())
+    errors = []
+    stop = threading.Event()
+
+    def reader():
+        try:
+            while not stop.is_set():
+                result = list(tree.query((-5, -5, 200, 200)))
+                # The writer only moves ids 1000+ in and out
+                assert set(range(1000)) <= set(result)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for t in readers:
+        t.start()
+    for round_ in range(200):
+        tree.insert(1000 + round_, box(round_ % 100, 0, round_ % 100 + 1, 1))
+        if round_ % 3 == 0:
+            tree.delete(1000 + round_)
+    stop.set()
+    for t in readers:
+        t.join()
+    assert not errors
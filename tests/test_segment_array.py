@@ -0,0 +1,86 @@
+import array
+import random
+
+import pytest
+
+from togo import Segment, SegmentArray, from_wkt
+
+
+def _random_rows(n, seed, span=100.0, step=5.0):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        x = rng.uniform(0, span)
+        y = rng.uniform(0, span)
+        rows.append((x, y, x + rng.uniform(-step, step), y + rng.uniform(-step, step)))
+    return rows
+
+
+def _buffer(rows):
+    flat = array.array("d", [v for row in rows for v in row])
+    return memoryview(flat).cast("B").cast("d", (len(rows), 4))
+
+
+def test_construction_from_sequences_and_buffers():
+    rows = [(0.0, 0.0, 1.0, 1.0), (2.0, 3.0, 4.0, 1.0)]
+    from_segments = SegmentArray([Segment((0, 0), (1, 1)), ((2, 3), (4, 1))])
+    from_buffer = SegmentArray(_buffer(rows))
+    assert len(from_segments) == len(from_buffer) == 2
+    for arr in (from_segments, from_buffer):
+        assert arr.coords.shape == (2, 4)
+        assert arr[1].a.x == 2.0 and arr[-1].b.y == 1.0
+    with pytest.raises(IndexError):
+        from_buffer[2]
+    with pytest.raises(ValueError):
+        SegmentArray(
+            memoryview(array.array("d", [0.0] * 6)).cast("B").cast("d", (2, 3))
+        )
+    assert len(SegmentArray([])) == 0
+
+
+def test_rect_is_vectorized_envelope():
+    rects = SegmentArray([(3, 4, 1, 0), (0, 0, 2, 5)]).rect()
+    assert rects.shape == (2, 4)
+    assert tuple(rects[0, j] for j in range(4)) == (1.0, 0.0, 3.0, 4.0)
+    assert tuple(rects[1, j] for j in range(4)) == (0.0, 0.0, 2.0, 5.0)
+
+
+def test_intersects_matches_brute_force():
+    a_rows = _random_rows(300, 1)
+    b_rows = _random_rows(200, 2)
+    a = SegmentArray(_buffer(a_rows))
+    b = SegmentArray(b_rows)
+    expected = [
+        (i, j)
+        for i, ra in enumerate(a_rows)
+        for j, rb in enumerate(b_rows)
+        if Segment(ra[:2], ra[2:]).intersects(Segment(rb[:2], rb[2:]))
+    ]
+    assert expected
+    left, right = a.intersects(b)
+    assert list(zip(left, right)) == expected
+    left, right = b.intersects(a)
+    assert sorted(zip(right, left)) == expected
+
+
+def test_intersects_touching_and_empty():
+    a = SegmentArray([(0, 0, 1, 0)])
+    b = SegmentArray([(1, 0, 1, 1), (2, 0, 3, 0)])
+    left, right = a.intersects(b)
+    assert list(left) == [0] and list(right) == [0]
+    left, right = a.intersects([])
+    assert len(left) == len(right) == 0
+
+
+@pytest.mark.parametrize("threads", [1, 3])
+def test_intersects_geom_mask(threads):
+    poly = from_wkt("POLYGON ((10 10, 20 10, 20 20, 10 20, 10 10))")
+    rows = _random_rows(500, 3, span=30.0)
+    mask = SegmentArray(rows).intersects_geom(poly, threads=threads)
+    assert mask.typecode == "B"
+    expected = [
+        int(poly.intersects(from_wkt(f"LINESTRING ({r[0]} {r[1]}, {r[2]} {r[3]})")))
+        for r in rows
+    ]
+    assert list(mask) == expected
+    assert 0 < sum(mask) < len(rows)
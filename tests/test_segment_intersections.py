@@ -0,0 +1,98 @@
+import math
+
+import pytest
+
+from togo import (
+    Line,
+    LineString,
+    Ring,
+    Segment,
+    TGIndex,
+    from_wkt,
+    segment_intersections,
+)
+
+
+def _circle(n, r=10.0, cx=0.0, cy=0.0):
+    pts = [
+        (cx + r * math.cos(2 * math.pi * i / n), cy + r * math.sin(2 * math.pi * i / n))
+        for i in range(n)
+    ]
+    return pts + [pts[0]]
+
+
+def _brute_force(a_pts, b_pts):
+    pairs = []
+    for i in range(len(a_pts) - 1):
+        sa = Segment(a_pts[i], a_pts[i + 1])
+        for j in range(len(b_pts) - 1):
+            if sa.intersects(Segment(b_pts[j], b_pts[j + 1])):
+                pairs.append((i, j))
+    return pairs
+
+
+def test_line_crossing_ring():
+    ring = Ring([(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)])
+    road = Line([(-5, 5), (15, 5)])
+    a_idx, b_idx, points = segment_intersections(road, ring)
+    assert list(a_idx) == [0, 0]
+    assert list(b_idx) == [1, 3]
+    assert points.shape == (2, 2)
+    assert (points[0, 0], points[0, 1]) == pytest.approx((10.0, 5.0))
+    assert (points[1, 0], points[1, 1]) == pytest.approx((0.0, 5.0))
+
+
+def test_ring_ring_matches_brute_force_with_and_without_index():
+    a_pts = _circle(400, 10.0)
+    b_pts = _circle(300, 10.0, cx=5.0, cy=1.0)
+    expected = _brute_force(a_pts, b_pts)
+    assert expected
+    for index in (TGIndex.NONE, TGIndex.NATURAL, TGIndex.YSTRIPES):
+        a_idx, b_idx, points = segment_intersections(
+            Ring(a_pts, index=index), Ring(b_pts, index=index)
+        )
+        assert list(zip(a_idx, b_idx)) == expected
+        for k, (i, j) in enumerate(expected):
+            x, y = points[k, 0], points[k, 1]
+            assert (
+                min(a_pts[i][0], a_pts[i + 1][0]) - 1e-9
+                <= x
+                <= max(a_pts[i][0], a_pts[i + 1][0]) + 1e-9
+            )
+            assert (
+                min(b_pts[j][1], b_pts[j + 1][1]) - 1e-9
+                <= y
+                <= max(b_pts[j][1], b_pts[j + 1][1]) + 1e-9
+            )
+
+
+def test_ring_line_argument_order_is_preserved():
+    ring_pts = _circle(200)
+    line_pts = [(-20.0, -3.0), (20.0, 4.0), (0.0, 20.0)]
+    expected = _brute_force(ring_pts, line_pts)
+    a_idx, b_idx, _ = segment_intersections(Ring(ring_pts), Line(line_pts))
+    assert list(zip(a_idx, b_idx)) == expected
+    a_idx, b_idx, _ = segment_intersections(Line(line_pts), Ring(ring_pts))
+    assert list(zip(a_idx, b_idx)) == [
+        (j, i) for i, j in sorted(expected, key=lambda p: (p[1], p[0]))
+    ]
+
+
+def test_linestring_geometries_and_collinear_overlap():
+    a = from_wkt("LINESTRING (0 0, 10 0)")
+    b = LineString([(5, 0), (15, 0), (15, 5)])
+    a_idx, b_idx, points = segment_intersections(a, b)
+    assert list(a_idx) == [0]
+    assert list(b_idx) == [0]
+    assert math.isnan(points[0, 0]) and math.isnan(points[0, 1])
+
+
+def test_no_intersections_and_bad_input():
+    a_idx, b_idx, points = segment_intersections(
+        Line([(0, 0), (1, 1)]), Line([(5, 5), (6, 7)])
+    )
+    assert len(a_idx) == len(b_idx) == len(points) == 0
+    with pytest.raises(TypeError):
+        segment_intersections(from_wkt("POINT (1 1)"), Line([(0, 0), (1, 1)]))
+    with pytest.raises(TypeError):
+        segment_intersections([(0, 0), (1, 1)], Line([(0, 0), (1, 1)]))
@@ -0,0 +1,99 @@
+import pytest
+
+from togo import Point, Polygon, box, sjoin, sjoin_iter
+
+
+def _brute_force(left, right, predicate):
+    pairs = []
+    for i, a in enumerate(left):
+        for j, b in enumerate(right):
+            if getattr(a, predicate)(b):
+                pairs.append((i, j))
+    return pairs
+
+
+def _pairs(result):
+    left_idx, right_idx = result
+    assert len(left_idx) == len(right_idx)
+    return list(zip(left_idx, right_idx))
+
+
+def _points(n):
+    # Deterministic scatter over [0, 10) x [0, 10)
+    return [Point((i * 7.31) % 10.0, (i * 3.77) % 10.0) for i in range(n)]
+
+
+def _cells():
+    return [
+        box(i * 2, j * 2, i * 2 + 2.5, j * 2 + 2.5) for i in range(5) for j in range(5)
+    ]
+
+
+@pytest.mark.parametrize("predicate", ["intersects", "within", "covered_by", "touches"])
+def test_points_in_polygons_matches_brute_force(predicate):
+    left = _points(300)
+    right = _cells()
+    method = "coveredby" if predicate == "covered_by" else predicate
+    expected = _brute_force(left, right, method)
+    assert _pairs(sjoin(left, right, predicate=predicate)) == expected
+
+
+def test_polygons_contain_points():
+    left = _cells()
+    right = _points(200)
+    expected = _brute_force(left, right, "contains")
+    assert expected
+    assert _pairs(sjoin(left, right, predicate="contains")) == expected
+
+
+def test_default_predicate_and_result_type():
+    left_idx, right_idx = sjoin([Point(1, 1), Point(50, 50)], [box(0, 0, 2, 2)])
+    assert left_idx.typecode == "q"
+    assert list(left_idx) == [0]
+    assert list(right_idx) == [0]
+
+
+@pytest.mark.parametrize("threads", [2, 5, None])
+def test_threads_give_identical_results(threads):
+    left = _points(1000)
+    right = _cells()
+    assert _pairs(sjoin(left, right, threads=threads)) == _pairs(sjoin(left, right))
+
+
+def test_sjoin_iter_concatenates_to_sjoin():
+    left = _points(500)
+    right = _cells()
+    chunks = list(sjoin_iter(left, right, chunk_size=64, threads=2))
+    assert len(chunks) == 8
+    pairs = [p for chunk in chunks for p in _pairs(chunk)]
+    assert pairs == _pairs(sjoin(left, right))
+
+
+def test_single_and_empty_sides():
+    poly = Polygon([(0, 0), (4, 0), (4, 4), (0, 4)])
+    assert _pairs(sjoin([Point(1, 1)], [poly])) == [(0, 0)]
+    assert _pairs(sjoin([], [poly])) == []
+    assert _pairs(sjoin([Point(1, 1)], [])) == []
+    assert list(sjoin_iter([], [poly])) == []
+
+
+def test_nan_and_infinite_points_are_indexed_safely():
+    nan = float("nan")
+    inf = float("inf")
+    points = _points(100) + [Point(nan, nan), Point(inf, 1.0), Point(nan, 2.0)]
+    cells = _cells()
+    expected = _brute_force(cells, points, "contains")
+    assert _pairs(sjoin(cells, points, predicate="contains")) == expected
+    expected = _brute_force(points, cells, "intersects")
+    assert _pairs(sjoin(points, cells)) == expected
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        sjoin([Point(0, 0)], [Point(0, 0)], predicate="disjoint")
+    with pytest.raises(ValueError):
+        sjoin([Point(0, 0)], [Point(0, 0)], threads=0)
+    with pytest.raises(ValueError):
+        sjoin_iter([Point(0, 0)], [Point(0, 0)], chunk_size=0)
+    with pytest.raises(TypeError):
+        sjoin([None], [Point(0, 0)])
@@ -0,0 +1,98 @@
+import sys
+
+import pytest
+
+from togo import (
+    Point,
+    SlowOperation,
+    box,
+    buffer_many,
+    from_wkt,
+    get_slow_operation_hook,
+    instrumentation_enabled,
+    set_slow_operation_hook,
+    stats,
+)
+
+WKT = "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0), (2 2, 3 2, 3 3, 2 2))"
+
+
+@pytest.fixture
+def reports():
+    seen = []
+    set_slow_operation_hook(seen.append, threshold=0)
+    yield seen
+    set_slow_operation_hook(None)
+
+
+def test_hook_reports_operation_vertices_and_memsize(reports):
+    geom = from_wkt(WKT)
+    assert geom.intersects(Point(1, 1))
+    by_name = {r.operation: r for r in reports}
+    parsed, pred = by_name["parse_wkt"], by_name["intersects"]
+    assert isinstance(parsed, SlowOperation)
+    assert parsed.seconds >= 0
+    assert parsed.vertices == (9,)
+    assert parsed.memsize == (geom.memsize,)
+    assert pred.vertices == (9, 1)
+
+
+def test_hook_reports_geos_inputs(reports):
+    box(0, 0, 2, 2).buffer(1.0)
+    buffer_ops = [r for r in reports if r.operation == "buffer"]
+    assert (
+        buffer_ops
+        and buffer_ops[0].vertices == (5,)
+        and buffer_ops[0].memsize == (None,)
+    )
+    reports.clear()
+    buffer_many([box(0, 0, 1, 1)] * 8, 0.5, threads=2)
+    assert sum(r.operation == "buffer" for r in reports) == 8
+
+
+def test_threshold_filters_and_counters_stay_off():
+    seen = []
+    set_slow_operation_hook(seen.append, threshold=60)
+    try:
+        from_wkt(WKT).intersects(Point(1, 1))
+        assert seen == []
+        assert not instrumentation_enabled()
+        assert stats() == {}
+        assert get_slow_operation_hook() == (seen.append, 60.0)
+    finally:
+        set_slow_operation_hook(None)
+    assert get_slow_operation_hook() is None
+
+
+def test_hook_errors_are_unraisable(monkeypatch):
+    caught = []
+    monkeypatch.setattr(sys, "unraisablehook", caught.append)
+
+    def boom(op):
+        raise RuntimeError("boom")
+
+    set_slow_operation_hook(boom, threshold=0)
+    try:
+        assert from_wkt("POINT (1 2)").x == 1
+    finally:
+        set_slow_operation_hook(None)
+    assert caught and isinstance(caught[0].exc_value, RuntimeError)
+
+
+def test_validation():
+    with pytest.raises(TypeError):
+        set_slow_operation_hook(42)
+    for threshold in (-1, float("inf"), float("nan")):
+        with pytest.raises(ValueError):
+            set_slow_operation_hook(print, threshold=threshold)
+    assert get_slow_operation_hook() is None
+
+
+def test_huge_threshold_saturates():
+    seen = []
+    set_slow_operation_hook(seen.append, threshold=1e300)
+    try:
+        from_wkt(WKT).buffer(1.0)
+    finally:
+        set_slow_operation_hook(None)
+    assert seen == []
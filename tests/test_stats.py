@@ -0,0 +1,98 @@
+import pytest
+
+from togo import (
+    Point,
+    box,
+    buffer_many,
+    entry_stats,
+    from_wkb,
+    from_wkt,
+    instrumentation_enabled,
+    reset_stats,
+    set_instrumentation,
+    stats,
+    stats_prometheus,
+    to_web_mercator,
+    transform,
+)
+
+WKT = "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0))"
+
+
+@pytest.fixture
+def instrumented():
+    reset_stats()
+    set_instrumentation(True)
+    yield
+    set_instrumentation(False)
+    reset_stats()
+
+
+def test_disabled_by_default_records_nothing():
+    assert not instrumentation_enabled()
+    reset_stats()
+    from_wkt(WKT).intersects(Point(1, 1))
+    from_wkt(WKT).buffer(1.0)
+    assert stats() == {}
+    assert entry_stats() == {}
+
+
+def test_parse_write_and_predicates(instrumented):
+    geom = from_wkt(WKT)
+    wkb = geom.to_wkb()
+    from_wkb(wkb)
+    assert geom.intersects(Point(1, 1))
+    assert geom.contains(box(1, 1, 2, 2))
+    snap = stats()
+    assert snap["parse_wkt"]["calls"] == 1
+    assert snap["parse_wkt"]["bytes"] == len(WKT)
+    assert snap["parse_wkb"]["bytes"] == len(wkb)
+    assert snap["write_wkb"]["bytes"] >= len(wkb)
+    assert snap["intersects"]["calls"] >= 1
+    assert snap["contains"]["calls"] >= 1
+    assert snap["coerce_geometry"]["calls"] >= 2
+    assert all(v["ns"] >= 0 for v in snap.values())
+
+
+def test_geos_stages_counted_from_worker_threads(instrumented):
+    geoms = [box(i, 0, i + 1, 1) for i in range(20)]
+    buffer_many(geoms, 0.5, threads=4)
+    snap = stats()
+    assert snap["buffer"]["calls"] == 20
+    assert snap["tg_geom_to_geos"]["calls"] == 20
+    assert snap["tg_geom_to_geos"]["bytes"] > 0
+    assert snap["tg_geom_from_geos"]["calls"] == 20
+    assert snap["buffer"]["ns"] > 0
+
+
+def test_reset_and_prometheus_export(instrumented):
+    from_wkt(WKT)
+    text = stats_prometheus()
+    assert "# TYPE togo_op_calls_total counter" in text
+    assert 'togo_op_calls_total{op="parse_wkt"} 1' in text
+    assert 'togo_op_seconds_total{op="parse_wkt"}' in text
+    assert stats(reset=True)["parse_wkt"]["calls"] == 1
+    assert stats() == {}
+
+
+def test_entry_points_are_counted_separately(instrumented):
+    geom = from_wkt(WKT)
+    geom.buffer(1.0)
+    geom.buffer(2.0)
+    buffer_many([geom], 1.0)
+    transform(lambda x, y: (y, x), geom)
+    to_web_mercator(geom)
+    assert geom.__geo_interface__["type"] == "Polygon"
+    entries = entry_stats()
+    assert entries["Geometry.buffer"] == 2
+    assert entries["buffer_many"] == 1
+    assert entries["transform"] == 1
+    assert entries["to_web_mercator"] == 1
+    assert entries["Geometry.__geo_interface__"] == 1
+    # The native stage does not tell the three buffer calls apart.
+    assert stats()["buffer"]["calls"] == 3
+    text = stats_prometheus()
+    assert 'togo_entry_calls_total{entry="Geometry.buffer"} 2' in text
+    stats(reset=True)
+    assert entry_stats(reset=True)["transform"] == 1
+    assert entry_stats() == {}
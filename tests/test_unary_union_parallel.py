@@ -0,0 +1,63 @@
+import pytest
+
+from togo import Point, Polygon, box, unary_union
+
+
+def _grid(n, size=1.0, overlap=0.25):
+    """n x n grid of overlapping squares, shuffled deterministically."""
+    cells = [
+        box(i * size, j * size, (i + 1) * size + overlap, (j + 1) * size + overlap)
+        for i in range(n)
+        for j in range(n)
+    ]
+    return cells[::3] + cells[1::3] + cells[2::3]
+
+
+@pytest.mark.parametrize("threads", [2, 4, None])
+def test_parallel_matches_serial(threads):
+    cells = _grid(20)
+    serial = unary_union(cells)
+    parallel = unary_union(cells, threads=threads, group_size=16)
+    assert parallel.geom_type == "Polygon"
+    assert parallel.area == pytest.approx(serial.area)
+    assert parallel.bounds == pytest.approx(serial.bounds)
+
+
+def test_parallel_disjoint_groups():
+    cells = [box(i * 3, 0, i * 3 + 1, 1) for i in range(50)]
+    result = unary_union(cells, threads=4, group_size=8)
+    assert result.geom_type == "MultiPolygon"
+    assert len(result.geoms) == 50
+    assert result.area == pytest.approx(50.0)
+
+
+def test_parallel_odd_group_count():
+    # 7 groups exercises the odd tail of the tree merge
+    cells = _grid(7)
+    result = unary_union(cells, threads=3, group_size=7)
+    assert result.area == pytest.approx(unary_union(cells).area)
+
+
+def test_parallel_mixed_inputs():
+    geoms = [Polygon([(0, 0), (2, 0), (2, 2), (0, 2)]), Point(5, 5), (6, 6)]
+    geoms += [box(i, 0, i + 1.5, 1) for i in range(10)]
+    result = unary_union(geoms, threads=2, group_size=4)
+    assert result.intersects(Point(5, 5))
+    assert result.intersects(Point(6, 6))
+    assert result.intersects(Point(9, 0.5))
+
+
+def test_small_input_uses_single_union():
+    cells = _grid(3)
+    result = unary_union(cells, threads=4)
+    assert result.area == pytest.approx(unary_union(cells).area)
+
+
+def test_parallel_argument_validation():
+    cells = _grid(3)
+    with pytest.raises(ValueError):
+        unary_union(cells, threads=0)
+    with pytest.raises(ValueError):
+        unary_union(cells, threads=2, group_size=1)
+    with pytest.raises(ValueError):
+        unary_union([], threads=2)
@@ -0,0 +1,147 @@
+import ctypes
+import math
+
+import pytest
+
+from togo import (
+    Geometry,
+    Point,
+    from_web_mercator,
+    from_web_mercator_coords,
+    to_tile_pixels,
+    to_tile_pixels_coords,
+    to_web_mercator,
+    to_web_mercator_coords,
+)
+import array
+
+
+R = 6378137.0
+
+
+def _mercator(lon, lat):
+    x = math.radians(lon) * R
+    y = math.log(math.tan(math.pi / 4 + math.radians(lat) / 2)) * R
+    return x, y
+
+
+def _coords(pairs):
+    flat = array.array("d", [v for p in pairs for v in p])
+    return memoryview(flat).cast("B").cast("d", (len(pairs), 2))
+
+
+def test_point_to_web_mercator():
+    g = to_web_mercator(Point(12.5, 41.9))
+    x, y = _mercator(12.5, 41.9)
+    assert g.geom_type == "Point"
+    assert g.x == pytest.approx(x)
+    assert g.y == pytest.approx(y)
+
+
+def test_web_mercator_extent():
+    g = to_web_mercator(Point(180, 85.0511287798066))
+    assert g.x == pytest.approx(20037508.342789244)
+    assert g.y == pytest.approx(20037508.342789244)
+
+
+def test_latitude_is_clamped():
+    g = to_web_mercator(Point(0, 90))
+    assert math.isfinite(g.y)
+    assert g.y == pytest.approx(20037508.342789244)
+
+
+@pytest.mark.parametrize(
+    "wkt",
+    [
+        "POINT (10 20)",
+        "LINESTRING (0 0, 10 10, 20 -5)",
+        "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0), (2 2, 4 2, 4 4, 2 4, 2 2))",
+        "MULTIPOINT ((1 1), (-30 45))",
+        "MULTILINESTRING ((0 0, 1 1), (5 5, 6 7))",
+        "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 1, 0 0)), ((5 5, 6 5, 6 6, 5 6, 5 5)))",
+        "GEOMETRYCOLLECTION (POINT (1 2), LINESTRING (0 0, 3 3))",
+    ],
+)
+def test_round_trip_all_types(wkt):
+    g = Geometry(wkt, fmt="wkt")
+    projected = to_web_mercator(g)
+    assert projected.geom_type == g.geom_type
+    back = from_web_mercator(projected)
+    assert back.geom_type == g.geom_type
+    assert back.num_points == g.num_points
+    assert back.bounds == pytest.approx(g.bounds, abs=1e-9)
+
+
+def test_polygon_keeps_holes():
+    g = Geometry(
+        "POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0), (2 2, 4 2, 4 4, 2 4, 2 2))",
+        fmt="wkt",
+    )
+    projected = to_web_mercator(g)
+    assert len(projected.interiors) == 1
+    x, y = _mercator(10, 10)
+    assert projected.bounds[2] == pytest.approx(x)
+    assert projected.bounds[3] == pytest.approx(y)
+
+
+def test_empty_geometry():
+    g = Geometry("POLYGON EMPTY", fmt="wkt")
+    assert to_web_mercator(g).is_empty
+
+
+def test_tile_pixels():
+    # Zoom 0 covers the world with a single tile
+    g = to_tile_pixels(Point(0, 0), 0, 0, 0)
+    assert g.x == pytest.approx(128.0)
+    assert g.y == pytest.approx(128.0)
+    g = to_tile_pixels(Point(-180, 85.0511287798066), 0, 0, 0)
+    assert g.x == pytest.approx(0.0, abs=1e-9)
+    assert g.y == pytest.approx(0.0, abs=1e-6)
+    # Zoom 1, bottom-right tile with a vector-tile extent
+    g = to_tile_pixels(Point(90, -45), 1, 1, 1, extent=4096)
+    assert 0 <= g.x <= 4096
+    assert 0 <= g.y <= 4096
+    assert g.x == pytest.approx(2048.0)
+
+
+def test_tile_pixels_validation():
+    with pytest.raises(ValueError):
+        to_tile_pixels(Point(0, 0), -1, 0, 0)
+    with pytest.raises(ValueError):
+        to_tile_pixels(Point(0, 0), 0, 0, 0, extent=0)
+
+
+def test_coords_variants_match_geometry():
+    pairs = [(0.0, 0.0), (12.5, 41.9), (-73.98, 40.75)]
+    out = to_web_mercator_coords(_coords(pairs))
+    assert out.shape == (3, 2)
+    for i, (lon, lat) in enumerate(pairs):
+        x, y = _mercator(lon, lat)
+        assert out[i, 0] == pytest.approx(x)
+        assert out[i, 1] == pytest.approx(y)
+    back = from_web_mercator_coords(out)
+    for i, (lon, lat) in enumerate(pairs):
+        assert back[i, 0] == pytest.approx(lon)
+        assert back[i, 1] == pytest.approx(lat)
+    px = to_tile_pixels_coords(_coords(pairs), 3, 4, 3)
+    for i, (lon, lat) in enumerate(pairs):
+        g = to_tile_pixels(Point(lon, lat), 3, 4, 3)
+        assert px[i, 0] == pytest.approx(g.x)
+        assert px[i, 1] == pytest.approx(g.y)
+
+
+def test_coords_shape_validation():
+    flat = array.array("d", [1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        to_web_mercator_coords(memoryview(flat).cast("B").cast("d", (1, 3)))
+
+
+def test_coords_empty_input():
+    empty = memoryview((ctypes.c_double * 2 * 0)())
+    assert empty.shape == (0, 2)
+    for out in (
+        to_web_mercator_coords(empty),
+        from_web_mercator_coords(empty),
+        to_tile_pixels_coords(empty, 0, 0, 0),
+    ):
+        assert len(out) == 0
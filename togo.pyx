@@ -1,5 +1,5 @@
 # cython: language_level=3
-cdef extern from "tg.h":
+cdef extern from "tg.h" nogil:
     cdef struct tg_geom:
         pass
     cdef struct tg_point:
@@ -29,10 +29,17 @@ cdef extern from "tg.h":
     # Constructors
     tg_geom *tg_geom_clone(const tg_geom *geom)
     tg_geom *tg_geom_copy(const tg_geom *geom)
-    tg_geom *tg_parse_wkt(const char *wkt)
-    tg_geom *tg_parse_geojson(const char *geojson)
-    tg_geom *tg_parse_wkb(const unsigned char *wkb, size_t len)
-    tg_geom *tg_parse_hex(const char *hex)
+    tg_geom *tg_parse_wkt "togo_timed_parse_wkt"(const char *wkt)
+    tg_geom *tg_parse_geojson "togo_timed_parse_geojson"(const char *geojson)
+    tg_geom *tg_parse_wkb "togo_timed_parse_wkb"(const unsigned char *wkb, size_t len)
+    tg_geom *tg_parse_hex "togo_timed_parse_hex"(const char *hex)
+    tg_geom *tg_parse_wktn_ix "togo_timed_parse_wktn_ix"(const char *wkt, size_t len, tg_index ix)
+    tg_geom *tg_parse_geojsonn_ix "togo_timed_parse_geojsonn_ix"(
+        const char *geojson, size_t len, tg_index ix
+    )
+    tg_geom *tg_parse_wkb_ix "togo_timed_parse_wkb_ix"(
+        const unsigned char *wkb, size_t len, tg_index ix
+    )
     void tg_geom_free(tg_geom *geom)
     const char *tg_geom_error(const tg_geom *geom)
 
@@ -55,20 +62,21 @@ cdef extern from "tg.h":
     int tg_geom_num_geometries(const tg_geom *geom)
 
     # Predicates
-    int tg_geom_equals(const tg_geom *a, const tg_geom *b)
-    int tg_geom_disjoint(const tg_geom *a, const tg_geom *b)
-    int tg_geom_contains(const tg_geom *a, const tg_geom *b)
-    int tg_geom_within(const tg_geom *a, const tg_geom *b)
-    int tg_geom_covers(const tg_geom *a, const tg_geom *b)
-    int tg_geom_coveredby(const tg_geom *a, const tg_geom *b)
-    int tg_geom_touches(const tg_geom *a, const tg_geom *b)
-    int tg_geom_intersects(const tg_geom *a, const tg_geom *b)
+    int tg_geom_equals "togo_timed_equals"(const tg_geom *a, const tg_geom *b)
+    int tg_geom_disjoint "togo_timed_disjoint"(const tg_geom *a, const tg_geom *b)
+    int tg_geom_contains "togo_timed_contains"(const tg_geom *a, const tg_geom *b)
+    int tg_geom_within "togo_timed_within"(const tg_geom *a, const tg_geom *b)
+    int tg_geom_covers "togo_timed_covers"(const tg_geom *a, const tg_geom *b)
+    int tg_geom_coveredby "togo_timed_coveredby"(const tg_geom *a, const tg_geom *b)
+    int tg_geom_touches "togo_timed_touches"(const tg_geom *a, const tg_geom *b)
+    int tg_geom_intersects "togo_timed_intersects"(const tg_geom *a, const tg_geom *b)
+    int tg_geom_intersects_xy(const tg_geom *a, double x, double y)
 
     # Writing
-    size_t tg_geom_wkt(const tg_geom *geom, char *dst, size_t n)
-    size_t tg_geom_geojson(const tg_geom *geom, char *dst, size_t n)
-    size_t tg_geom_wkb(const tg_geom *geom, unsigned char *dst, size_t n)
-    size_t tg_geom_hex(const tg_geom *geom, char *dst, size_t n)
+    size_t tg_geom_wkt "togo_timed_wkt"(const tg_geom *geom, char *dst, size_t n)
+    size_t tg_geom_geojson "togo_timed_geojson"(const tg_geom *geom, char *dst, size_t n)
+    size_t tg_geom_wkb "togo_timed_wkb"(const tg_geom *geom, unsigned char *dst, size_t n)
+    size_t tg_geom_hex "togo_timed_hex"(const tg_geom *geom, char *dst, size_t n)
     size_t tg_geom_geobin(const tg_geom *geom, unsigned char *dst, size_t n)
 
     # --- Point functions ---
@@ -114,12 +122,12 @@ cdef extern from "tg.h":
     )
     void tg_ring_line_search(
         const tg_ring *a, const tg_line *b,
-        bint (*iter)(tg_segment aseg, int aidx, tg_segment bseg, int bidx, void *udata),
+        bool (*iter)(tg_segment aseg, int aidx, tg_segment bseg, int bidx, void *udata),
         void *udata
     )
     void tg_ring_ring_search(
         const tg_ring *a, const tg_ring *b,
-        bint (*iter)(tg_segment aseg, int aidx, tg_segment bseg, int bidx, void *udata),
+        bool (*iter)(tg_segment aseg, int aidx, tg_segment bseg, int bidx, void *udata),
         void *udata
     )
     double tg_ring_area(const tg_ring *ring)
@@ -152,7 +160,7 @@ cdef extern from "tg.h":
     )
     void tg_line_line_search(
         const tg_line *a, const tg_line *b,
-        bint (*iter)(tg_segment aseg, int aidx, tg_segment bseg, int bidx, void *udata),
+        bool (*iter)(tg_segment aseg, int aidx, tg_segment bseg, int bidx, void *udata),
         void *udata
     )
     double tg_line_length(const tg_line *line)
@@ -186,6 +194,9 @@ cdef extern from "tg.h":
     tg_geom *tg_geom_new_multilinestring(const tg_line *const lines[], int nlines)
     tg_geom *tg_geom_new_multipolygon(const tg_poly *const polys[], int npolys)
     tg_geom *tg_geom_new_geometrycollection(const tg_geom *const geoms[], int ngeoms)
+    tg_geom *tg_geom_new_point_empty()
+    tg_geom *tg_geom_new_linestring_empty()
+    tg_geom *tg_geom_new_polygon_empty()
     tg_geom *tg_geom_new_multipoint_empty()
     tg_geom *tg_geom_new_multilinestring_empty()
     tg_geom *tg_geom_new_multipolygon_empty()
@@ -199,7 +210,279 @@ cdef extern from "tg.h":
     const tg_line *tg_geom_line_at(const tg_geom *geom, int index)
     const tg_poly *tg_geom_poly_at(const tg_geom *geom, int index)
 
-cdef extern from "geos_c.h":
+# Defined in tg.c but not exported by tg.h: packs a per-call spread into the
+# upper bits of a tg_index so the *_ix constructors honour it.
+cdef extern from *:
+    """
+    enum tg_index tg_index_with_spread(enum tg_index ix, int spread);
+    """
+    tg_index tg_index_with_spread(tg_index ix, int spread) nogil
+
+# Allocator installed into TG at import (see "Allocators and arenas" below).
+# Every block carries a 16-byte header recording its size and owner, so frees
+# always reach the allocator that made the block, whatever is selected now.
+cdef extern from *:
+    """
+    #include <pthread.h>
+    #include <stdlib.h>
+    #include <string.h>
+
+    #define TOGO_ALIGN(n) (((n) + 15) & ~(size_t)15)
+    #define TOGO_OWNER_MALLOC ((void *)0)
+    #define TOGO_OWNER_PYMEM ((void *)1)
+
+    typedef struct togo_block { size_t size; void *owner; } togo_block;
+    #define TOGO_BLOCK_HDR TOGO_ALIGN(sizeof(togo_block))
+
+    typedef struct togo_arena_chunk {
+        struct togo_arena_chunk *next;
+        size_t size;
+        size_t used;
+    } togo_arena_chunk;
+    #define TOGO_CHUNK_HDR TOGO_ALIGN(sizeof(togo_arena_chunk))
+
+    typedef struct togo_arena {
+        togo_arena_chunk *chunks;
+        size_t chunk_size;
+        size_t reserved;
+        size_t refs;  /* live blocks, the open handle and the thread stack */
+        int closed;  /* closed from another thread, still on its own stack */
+        int stacked;  /* still on its thread's arena stack */
+        struct togo_arena *prev;
+    } togo_arena;
+
+    typedef struct togo_alloc_stats {
+        size_t live_bytes;
+        size_t live_blocks;
+        size_t peak_bytes;
+        size_t allocs;
+        size_t frees;
+        size_t reallocs;
+    } togo_alloc_stats;
+
+    static togo_alloc_stats togo_stats;
+    static int togo_backend = 0;  /* 0: malloc, 1: PyMem_RawMalloc */
+    static __thread togo_arena *togo_current_arena = NULL;
+    static pthread_key_t togo_arena_key;  /* mirrors togo_current_arena */
+    static pthread_once_t togo_arena_key_once = PTHREAD_ONCE_INIT;
+
+    static void togo_note_peak(size_t live) {
+        size_t peak = __atomic_load_n(&togo_stats.peak_bytes, __ATOMIC_RELAXED);
+        while (live > peak && !__atomic_compare_exchange_n(&togo_stats.peak_bytes,
+                &peak, live, 1, __ATOMIC_RELAXED, __ATOMIC_RELAXED)) {
+        }
+    }
+
+    static void *togo_block_init(togo_block *b, size_t size, void *owner) {
+        b->size = size;
+        b->owner = owner;
+        __atomic_add_fetch(&togo_stats.allocs, 1, __ATOMIC_RELAXED);
+        __atomic_add_fetch(&togo_stats.live_blocks, 1, __ATOMIC_RELAXED);
+        togo_note_peak(__atomic_add_fetch(&togo_stats.live_bytes, size, __ATOMIC_RELAXED));
+        return (char *)b + TOGO_BLOCK_HDR;
+    }
+
+    static void togo_arena_release(togo_arena *a) {
+        togo_arena_chunk *chunk, *next;
+        if (__atomic_sub_fetch(&a->refs, 1, __ATOMIC_ACQ_REL) != 0) {
+            return;
+        }
+        for (chunk = a->chunks; chunk; chunk = next) {
+            next = chunk->next;
+            free(chunk);
+        }
+        free(a);
+    }
+
+    static void togo_arena_set_current(togo_arena *a) {
+        togo_current_arena = a;
+        pthread_setspecific(togo_arena_key, a);
+    }
+
+    static void togo_arena_unstack(togo_arena *a) {
+        __atomic_store_n(&a->stacked, 0, __ATOMIC_RELEASE);
+        togo_arena_release(a);
+    }
+
+    /* Thread exit: drop every arena the thread left on its stack. */
+    static void togo_arena_thread_exit(void *head) {
+        togo_arena *a = (togo_arena *)head, *prev;
+        togo_current_arena = NULL;
+        for (; a; a = prev) {
+            prev = a->prev;
+            togo_arena_unstack(a);
+        }
+    }
+
+    static void togo_arena_key_init(void) {
+        pthread_key_create(&togo_arena_key, togo_arena_thread_exit);
+    }
+
+    static void *togo_arena_alloc(togo_arena *a, size_t nbytes) {
+        togo_arena_chunk *chunk = a->chunks;
+        void *p;
+        nbytes = TOGO_ALIGN(nbytes);
+        if (!chunk || chunk->size - chunk->used < nbytes) {
+            size_t size = nbytes > a->chunk_size ? nbytes : a->chunk_size;
+            togo_arena_chunk *fresh = (togo_arena_chunk *)malloc(TOGO_CHUNK_HDR + size);
+            if (!fresh) {
+                return NULL;
+            }
+            fresh->size = size;
+            fresh->used = 0;
+            a->reserved += size;
+            /* Oversized blocks get a dedicated chunk behind the current one. */
+            if (chunk && size > a->chunk_size) {
+                fresh->next = chunk->next;
+                chunk->next = fresh;
+            } else {
+                fresh->next = chunk;
+                a->chunks = fresh;
+            }
+            chunk = fresh;
+        }
+        p = (char *)chunk + TOGO_CHUNK_HDR + chunk->used;
+        chunk->used += nbytes;
+        __atomic_add_fetch(&a->refs, 1, __ATOMIC_RELAXED);
+        return p;
+    }
+
+    /* Innermost open arena of this thread. Arenas closed from another thread
+       are dropped here, since only their own thread can unlink them. */
+    static togo_arena *togo_arena_current(void) {
+        togo_arena *a = togo_current_arena;
+        while (a && __atomic_load_n(&a->closed, __ATOMIC_ACQUIRE)) {
+            togo_arena_set_current(a->prev);
+            togo_arena_unstack(a);
+            a = togo_current_arena;
+        }
+        return a;
+    }
+
+    static void *togo_malloc(size_t size) {
+        togo_arena *a = togo_arena_current();
+        togo_block *b;
+        if (a) {
+            b = (togo_block *)togo_arena_alloc(a, TOGO_BLOCK_HDR + size);
+            return b ? togo_block_init(b, size, a) : NULL;
+        }
+        if (__atomic_load_n(&togo_backend, __ATOMIC_RELAXED) == 1) {
+            b = (togo_block *)PyMem_RawMalloc(TOGO_BLOCK_HDR + size);
+            return b ? togo_block_init(b, size, TOGO_OWNER_PYMEM) : NULL;
+        }
+        b = (togo_block *)malloc(TOGO_BLOCK_HDR + size);
+        return b ? togo_block_init(b, size, TOGO_OWNER_MALLOC) : NULL;
+    }
+
+    static void togo_free(void *ptr) {
+        togo_block *b;
+        if (!ptr) {
+            return;
+        }
+        b = (togo_block *)((char *)ptr - TOGO_BLOCK_HDR);
+        __atomic_add_fetch(&togo_stats.frees, 1, __ATOMIC_RELAXED);
+        __atomic_sub_fetch(&togo_stats.live_blocks, 1, __ATOMIC_RELAXED);
+        __atomic_sub_fetch(&togo_stats.live_bytes, b->size, __ATOMIC_RELAXED);
+        if (b->owner == TOGO_OWNER_MALLOC) {
+            free(b);
+        } else if (b->owner == TOGO_OWNER_PYMEM) {
+            PyMem_RawFree(b);
+        } else {
+            togo_arena_release((togo_arena *)b->owner);
+        }
+    }
+
+    static void *togo_realloc(void *ptr, size_t size) {
+        togo_block *b, *grown;
+        size_t old;
+        void *fresh;
+        if (!ptr) {
+            return togo_malloc(size);
+        }
+        b = (togo_block *)((char *)ptr - TOGO_BLOCK_HDR);
+        old = b->size;
+        if (b->owner == TOGO_OWNER_MALLOC || b->owner == TOGO_OWNER_PYMEM) {
+            grown = (togo_block *)(b->owner == TOGO_OWNER_MALLOC
+                ? realloc(b, TOGO_BLOCK_HDR + size)
+                : PyMem_RawRealloc(b, TOGO_BLOCK_HDR + size));
+            if (!grown) {
+                return NULL;
+            }
+            grown->size = size;
+            __atomic_add_fetch(&togo_stats.reallocs, 1, __ATOMIC_RELAXED);
+            togo_note_peak(
+                __atomic_add_fetch(&togo_stats.live_bytes, size - old, __ATOMIC_RELAXED));
+            return (char *)grown + TOGO_BLOCK_HDR;
+        }
+        /* Arena blocks cannot grow in place: move to a fresh block. */
+        fresh = togo_malloc(size);
+        if (!fresh) {
+            return NULL;
+        }
+        memcpy(fresh, ptr, old < size ? old : size);
+        togo_free(ptr);
+        return fresh;
+    }
+
+    static togo_arena *togo_arena_push(size_t chunk_size) {
+        togo_arena *a;
+        pthread_once(&togo_arena_key_once, togo_arena_key_init);
+        a = (togo_arena *)calloc(1, sizeof(togo_arena));
+        if (!a) {
+            return NULL;
+        }
+        a->chunk_size = chunk_size;
+        a->refs = 2;
+        a->stacked = 1;
+        a->prev = togo_current_arena;
+        togo_arena_set_current(a);
+        return a;
+    }
+
+    /* Close an arena: 0 if it was innermost on this thread, 1 if it was
+       unlinked from deeper in this thread's stack, -1 if it belongs to another
+       thread (it is then dropped at that thread's next allocation, or when
+       that thread exits). */
+    static int togo_arena_close(togo_arena *a) {
+        togo_arena **link = &togo_current_arena;
+        int depth = 0;
+        while (*link && *link != a) {
+            link = &(*link)->prev;
+            depth++;
+        }
+        if (!*link) {
+            __atomic_store_n(&a->closed, 1, __ATOMIC_RELEASE);
+            togo_arena_release(a);
+            return -1;
+        }
+        *link = a->prev;
+        pthread_setspecific(togo_arena_key, togo_current_arena);
+        togo_arena_unstack(a);
+        togo_arena_release(a);
+        return depth ? 1 : 0;
+    }
+    """
+    ctypedef struct togo_arena:
+        size_t reserved
+        size_t refs
+        int stacked
+    ctypedef struct togo_alloc_stats:
+        size_t live_bytes
+        size_t live_blocks
+        size_t peak_bytes
+        size_t allocs
+        size_t frees
+        size_t reallocs
+    togo_alloc_stats togo_stats
+    int togo_backend
+    void *togo_malloc(size_t size) nogil
+    void *togo_realloc(void *ptr, size_t size) nogil
+    void togo_free(void *ptr) nogil
+    togo_arena *togo_arena_push(size_t chunk_size) nogil
+    int togo_arena_close(togo_arena *a) nogil
+    togo_arena *togo_arena_current() nogil
+
+cdef extern from "geos_c.h" nogil:
     ctypedef void *GEOSContextHandle_t
     ctypedef void *GEOSGeometry
     ctypedef void *GEOSCoordSequence
@@ -208,19 +491,22 @@ cdef extern from "geos_c.h":
     void GEOSGeom_destroy_r(GEOSContextHandle_t handle, GEOSGeometry *g)
     void GEOSCoordSeq_destroy_r(GEOSContextHandle_t handle, GEOSCoordSequence *seq)
     GEOSGeometry *GEOSUnaryUnion(const GEOSGeometry *g)
-    GEOSGeometry *GEOSUnaryUnion_r(GEOSContextHandle_t handle, const GEOSGeometry *g)
-    GEOSGeometry *GEOSBufferWithStyle_r(
+    GEOSGeometry *GEOSUnaryUnion_r "togo_timed_GEOSUnaryUnion_r"(
+        GEOSContextHandle_t handle, const GEOSGeometry *g
+    )
+    GEOSGeometry *GEOSBufferWithStyle_r "togo_timed_GEOSBufferWithStyle_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g, double width,
         int quadSegs, int endCapStyle, int joinStyle, double mitreLimit
     )
-    char GEOSisValid_r(GEOSContextHandle_t handle, const GEOSGeometry *g)
-    GEOSGeometry *GEOSSimplify_r(
+    char GEOSisValid_r "togo_timed_GEOSisValid_r"(GEOSContextHandle_t handle, const GEOSGeometry *g)
+    int GEOSGetNumCoordinates_r(GEOSContextHandle_t handle, const GEOSGeometry *g)
+    GEOSGeometry *GEOSSimplify_r "togo_timed_GEOSSimplify_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g, double tolerance
     )
-    GEOSGeometry *GEOSTopologyPreserveSimplify_r(
+    GEOSGeometry *GEOSTopologyPreserveSimplify_r "togo_timed_GEOSTopologyPreserveSimplify_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g, double tolerance
     )
-    GEOSCoordSequence *GEOSNearestPoints_r(
+    GEOSCoordSequence *GEOSNearestPoints_r "togo_timed_GEOSNearestPoints_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g1, const GEOSGeometry *g2
     )
     int GEOSCoordSeq_getSize_r(
@@ -230,35 +516,293 @@ cdef extern from "geos_c.h":
         GEOSContextHandle_t handle, const GEOSCoordSequence *seq, unsigned int i,
         double *x, double *y
     )
-    GEOSGeometry *GEOSGetCentroid_r(
+    GEOSGeometry *GEOSGetCentroid_r "togo_timed_GEOSGetCentroid_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g
     )
-    GEOSGeometry *GEOSConvexHull_r(
+    GEOSGeometry *GEOSConvexHull_r "togo_timed_GEOSConvexHull_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g
     )
-    GEOSGeometry *GEOSIntersection_r(
+    GEOSGeometry *GEOSIntersection_r "togo_timed_GEOSIntersection_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g1, const GEOSGeometry *g2
     )
-    GEOSGeometry *GEOSUnion_r(
+    GEOSGeometry *GEOSUnion_r "togo_timed_GEOSUnion_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g1, const GEOSGeometry *g2
     )
-    GEOSGeometry *GEOSDifference_r(
+    GEOSGeometry *GEOSDifference_r "togo_timed_GEOSDifference_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *g1, const GEOSGeometry *g2
     )
-    double GEOSProject_r(
+    double GEOSProject_r "togo_timed_GEOSProject_r"(
         GEOSContextHandle_t handle, const GEOSGeometry *line, const GEOSGeometry *point
     )
 
-cdef extern from "tgx.h":
-    GEOSGeometry *tg_geom_to_geos(GEOSContextHandle_t handle, const tg_geom *geom)
-    tg_geom *tg_geom_from_geos(GEOSContextHandle_t handle, GEOSGeometry *geom)
+cdef extern from "tgx.h" nogil:
+    GEOSGeometry *tg_geom_to_geos "togo_timed_to_geos"(
+        GEOSContextHandle_t handle, const tg_geom *geom
+    )
+    tg_geom *tg_geom_from_geos "togo_timed_from_geos"(
+        GEOSContextHandle_t handle, GEOSGeometry *geom
+    )
     tg_geom *tg_geom_to_meters_grid(const tg_geom *geom, tg_point origin)
     tg_geom *tg_geom_from_meters_grid(const tg_geom *geom, tg_point origin)
 
 
+cimport cython
 from libc.limits cimport INT_MAX
-from libc.stdlib cimport malloc, free
+from libc.stdint cimport uint32_t, uint64_t
+from libc.stdlib cimport malloc, calloc, realloc, free, qsort
+from libc.string cimport memcmp
+from libc.math cimport (
+    sin, cos, tan, atan, atan2, sqrt, fabs, exp, log, ceil, isfinite, M_PI, NAN, INFINITY
+)
+from cpython cimport array
+from cpython.buffer cimport PyObject_CheckBuffer
+
+# Instrumentation. The tg.h, tgx.h and geos_c.h declarations above give the
+# instrumented entry points a C name of togo_timed_*, so every call site (also
+# inside nogil kernels and worker threads) goes through these wrappers. When
+# disabled they cost one branch; building with -DTOGO_INSTRUMENT=0 compiles
+# them down to direct calls.
+cdef extern from *:
+    """
+    #include <string.h>
+    #include <time.h>
+    #include <stdint.h>
+
+    #ifndef TOGO_INSTRUMENT
+    #define TOGO_INSTRUMENT 1
+    #endif
+
+    enum {
+        TOGO_ST_TO_GEOS, TOGO_ST_FROM_GEOS, TOGO_ST_COERCE,
+        TOGO_ST_PARSE_WKT, TOGO_ST_PARSE_GEOJSON, TOGO_ST_PARSE_WKB, TOGO_ST_PARSE_HEX,
+        TOGO_ST_WRITE_WKT, TOGO_ST_WRITE_GEOJSON, TOGO_ST_WRITE_WKB, TOGO_ST_WRITE_HEX,
+        TOGO_ST_EQUALS, TOGO_ST_DISJOINT, TOGO_ST_CONTAINS, TOGO_ST_WITHIN,
+        TOGO_ST_COVERS, TOGO_ST_COVEREDBY, TOGO_ST_TOUCHES, TOGO_ST_INTERSECTS,
+        TOGO_ST_BUFFER, TOGO_ST_SIMPLIFY, TOGO_ST_SIMPLIFY_PRESERVE,
+        TOGO_ST_INTERSECTION, TOGO_ST_UNION, TOGO_ST_DIFFERENCE, TOGO_ST_UNARY_UNION,
+        TOGO_ST_CONVEX_HULL, TOGO_ST_CENTROID, TOGO_ST_IS_VALID,
+        TOGO_ST_NEAREST_POINTS, TOGO_ST_PROJECT,
+        TOGO_ST_COUNT
+    };
+
+    typedef struct togo_op_stat { uint64_t calls, ns, bytes; } togo_op_stat;
+    static togo_op_stat togo_op_stats[TOGO_ST_COUNT];
+
+    /* Inputs of an operation, only looked at when it turns out to be slow. */
+    enum { TOGO_SUBJECT_NONE, TOGO_SUBJECT_TG, TOGO_SUBJECT_GEOS };
+    typedef struct togo_subject {
+        int kind;
+        GEOSContextHandle_t ctx;
+        const void *a;
+        const void *b;
+    } togo_subject;
+    #define TOGO_NONE ((togo_subject){TOGO_SUBJECT_NONE, NULL, NULL, NULL})
+    #define TOGO_TG(a, b) ((togo_subject){TOGO_SUBJECT_TG, NULL, (a), (b)})
+    #define TOGO_GEOS(h, a, b) ((togo_subject){TOGO_SUBJECT_GEOS, (h), (a), (b)})
+
+    /* Bit 0: counters, bit 1: slow-operation hook. */
+    #define TOGO_FLAG_COUNTERS 1
+    #define TOGO_FLAG_SLOW 2
+    #if TOGO_INSTRUMENT
+    static int togo_instrument = 0;
+    #else
+    #define togo_instrument 0
+    #endif
+    static uint64_t togo_slow_ns = 0;
+    static void (*togo_slow_hook)(int stage, uint64_t ns, const togo_subject *subject) = NULL;
+
+    static int togo_set_flag(int flag, int on) {
+    #if TOGO_INSTRUMENT
+        togo_instrument = on ? (togo_instrument | flag) : (togo_instrument & ~flag);
+        return 1;
+    #else
+        return on == 0;
+    #endif
+    }
+
+    static uint64_t togo_now_ns(void) {
+        struct timespec ts;
+        clock_gettime(CLOCK_MONOTONIC, &ts);
+        return (uint64_t)ts.tv_sec * 1000000000u + (uint64_t)ts.tv_nsec;
+    }
+
+    static void togo_record(int stage, uint64_t t0, uint64_t nbytes, togo_subject subject) {
+        uint64_t ns = togo_now_ns() - t0;
+        int flags = togo_instrument;
+        if (flags & TOGO_FLAG_COUNTERS) {
+            togo_op_stat *st = &togo_op_stats[stage];
+            __atomic_add_fetch(&st->calls, 1, __ATOMIC_RELAXED);
+            __atomic_add_fetch(&st->ns, ns, __ATOMIC_RELAXED);
+            __atomic_add_fetch(&st->bytes, nbytes, __ATOMIC_RELAXED);
+        }
+        if ((flags & TOGO_FLAG_SLOW) && ns >= togo_slow_ns && togo_slow_hook) {
+            togo_slow_hook(stage, ns, &subject);
+        }
+    }
+
+    /* Body of a wrapper: time `call`, then record `nbytes` and the inputs in
+       `subject` (both may use the result `r`). */
+    #define TOGO_TIMED(ret_t, stage, call, nbytes, subject) \
+        ret_t r; uint64_t t0; \
+        if (!togo_instrument) return call; \
+        t0 = togo_now_ns(); \
+        r = call; \
+        togo_record(stage, t0, (uint64_t)(nbytes), subject); \
+        return r
+
+    static struct tg_geom *togo_timed_parse_wkt(const char *s) {
+        TOGO_TIMED(struct tg_geom *, TOGO_ST_PARSE_WKT, tg_parse_wkt(s), strlen(s),
+            TOGO_TG(r, NULL));
+    }
+    static struct tg_geom *togo_timed_parse_geojson(const char *s) {
+        TOGO_TIMED(struct tg_geom *, TOGO_ST_PARSE_GEOJSON, tg_parse_geojson(s), strlen(s),
+            TOGO_TG(r, NULL));
+    }
+    static struct tg_geom *togo_timed_parse_wkb(const uint8_t *s, size_t n) {
+        TOGO_TIMED(struct tg_geom *, TOGO_ST_PARSE_WKB, tg_parse_wkb(s, n), n, TOGO_TG(r, NULL));
+    }
+    static struct tg_geom *togo_timed_parse_hex(const char *s) {
+        TOGO_TIMED(struct tg_geom *, TOGO_ST_PARSE_HEX, tg_parse_hex(s), strlen(s),
+            TOGO_TG(r, NULL));
+    }
+    static struct tg_geom *togo_timed_parse_wktn_ix(const char *s, size_t n, enum tg_index ix) {
+        TOGO_TIMED(struct tg_geom *, TOGO_ST_PARSE_WKT, tg_parse_wktn_ix(s, n, ix), n,
+            TOGO_TG(r, NULL));
+    }
+    static struct tg_geom *togo_timed_parse_geojsonn_ix(const char *s, size_t n,
+        enum tg_index ix)
+    {
+        TOGO_TIMED(struct tg_geom *, TOGO_ST_PARSE_GEOJSON, tg_parse_geojsonn_ix(s, n, ix), n,
+            TOGO_TG(r, NULL));
+    }
+    static struct tg_geom *togo_timed_parse_wkb_ix(const uint8_t *s, size_t n, enum tg_index ix) {
+        TOGO_TIMED(struct tg_geom *, TOGO_ST_PARSE_WKB, tg_parse_wkb_ix(s, n, ix), n,
+            TOGO_TG(r, NULL));
+    }
+
+    #define TOGO_TIMED_WRITER(name, stage, dst_t) \
+        static size_t togo_timed_##name(const struct tg_geom *g, dst_t *dst, size_t n) { \
+            TOGO_TIMED(size_t, stage, tg_geom_##name(g, dst, n), r, TOGO_TG(g, NULL)); \
+        }
+    TOGO_TIMED_WRITER(wkt, TOGO_ST_WRITE_WKT, char)
+    TOGO_TIMED_WRITER(geojson, TOGO_ST_WRITE_GEOJSON, char)
+    TOGO_TIMED_WRITER(wkb, TOGO_ST_WRITE_WKB, uint8_t)
+    TOGO_TIMED_WRITER(hex, TOGO_ST_WRITE_HEX, char)
+
+    #define TOGO_TIMED_PREDICATE(name, stage) \
+        static bool togo_timed_##name(const struct tg_geom *a, const struct tg_geom *b) { \
+            TOGO_TIMED(bool, stage, tg_geom_##name(a, b), 0, TOGO_TG(a, b)); \
+        }
+    TOGO_TIMED_PREDICATE(equals, TOGO_ST_EQUALS)
+    TOGO_TIMED_PREDICATE(disjoint, TOGO_ST_DISJOINT)
+    TOGO_TIMED_PREDICATE(contains, TOGO_ST_CONTAINS)
+    TOGO_TIMED_PREDICATE(within, TOGO_ST_WITHIN)
+    TOGO_TIMED_PREDICATE(covers, TOGO_ST_COVERS)
+    TOGO_TIMED_PREDICATE(coveredby, TOGO_ST_COVEREDBY)
+    TOGO_TIMED_PREDICATE(touches, TOGO_ST_TOUCHES)
+    TOGO_TIMED_PREDICATE(intersects, TOGO_ST_INTERSECTS)
+
+    static GEOSGeometry *togo_timed_to_geos(GEOSContextHandle_t h, const struct tg_geom *g) {
+        TOGO_TIMED(GEOSGeometry *, TOGO_ST_TO_GEOS, tg_geom_to_geos(h, g), tg_geom_memsize(g),
+            TOGO_TG(g, NULL));
+    }
+    static struct tg_geom *togo_timed_from_geos(GEOSContextHandle_t h, GEOSGeometry *g) {
+        TOGO_TIMED(struct tg_geom *, TOGO_ST_FROM_GEOS, tg_geom_from_geos(h, g),
+            r ? tg_geom_memsize(r) : 0, TOGO_GEOS(h, g, NULL));
+    }
+
+    #define TOGO_TIMED_GEOS1(ret_t, name, stage) \
+        static ret_t togo_timed_##name(GEOSContextHandle_t h, const GEOSGeometry *g) { \
+            TOGO_TIMED(ret_t, stage, name(h, g), 0, TOGO_GEOS(h, g, NULL)); \
+        }
+    #define TOGO_TIMED_GEOS2(ret_t, name, stage) \
+        static ret_t togo_timed_##name(GEOSContextHandle_t h, const GEOSGeometry *a, \
+            const GEOSGeometry *b) \
+        { \
+            TOGO_TIMED(ret_t, stage, name(h, a, b), 0, TOGO_GEOS(h, a, b)); \
+        }
+    TOGO_TIMED_GEOS1(GEOSGeometry *, GEOSUnaryUnion_r, TOGO_ST_UNARY_UNION)
+    TOGO_TIMED_GEOS1(GEOSGeometry *, GEOSConvexHull_r, TOGO_ST_CONVEX_HULL)
+    TOGO_TIMED_GEOS1(GEOSGeometry *, GEOSGetCentroid_r, TOGO_ST_CENTROID)
+    TOGO_TIMED_GEOS1(char, GEOSisValid_r, TOGO_ST_IS_VALID)
+    TOGO_TIMED_GEOS2(GEOSGeometry *, GEOSIntersection_r, TOGO_ST_INTERSECTION)
+    TOGO_TIMED_GEOS2(GEOSGeometry *, GEOSUnion_r, TOGO_ST_UNION)
+    TOGO_TIMED_GEOS2(GEOSGeometry *, GEOSDifference_r, TOGO_ST_DIFFERENCE)
+    TOGO_TIMED_GEOS2(GEOSCoordSequence *, GEOSNearestPoints_r, TOGO_ST_NEAREST_POINTS)
+    TOGO_TIMED_GEOS2(double, GEOSProject_r, TOGO_ST_PROJECT)
+
+    static GEOSGeometry *togo_timed_GEOSBufferWithStyle_r(GEOSContextHandle_t h,
+        const GEOSGeometry *g, double width, int quadsegs, int cap, int join, double mitre)
+    {
+        TOGO_TIMED(GEOSGeometry *, TOGO_ST_BUFFER,
+            GEOSBufferWithStyle_r(h, g, width, quadsegs, cap, join, mitre), 0,
+            TOGO_GEOS(h, g, NULL));
+    }
+    static GEOSGeometry *togo_timed_GEOSSimplify_r(GEOSContextHandle_t h,
+        const GEOSGeometry *g, double tolerance)
+    {
+        TOGO_TIMED(GEOSGeometry *, TOGO_ST_SIMPLIFY, GEOSSimplify_r(h, g, tolerance), 0,
+            TOGO_GEOS(h, g, NULL));
+    }
+    static GEOSGeometry *togo_timed_GEOSTopologyPreserveSimplify_r(GEOSContextHandle_t h,
+        const GEOSGeometry *g, double tolerance)
+    {
+        TOGO_TIMED(GEOSGeometry *, TOGO_ST_SIMPLIFY_PRESERVE,
+            GEOSTopologyPreserveSimplify_r(h, g, tolerance), 0, TOGO_GEOS(h, g, NULL));
+    }
+    """
+    ctypedef struct togo_op_stat:
+        uint64_t calls
+        uint64_t ns
+        uint64_t bytes
+    ctypedef struct togo_subject:
+        int kind
+        GEOSContextHandle_t ctx
+        const void *a
+        const void *b
+    togo_op_stat togo_op_stats[]
+    int togo_instrument
+    uint64_t togo_slow_ns
+    void (*togo_slow_hook)(int stage, uint64_t ns, const togo_subject *subject) noexcept nogil
+    int TOGO_ST_COERCE
+    int TOGO_ST_COUNT
+    int TOGO_FLAG_COUNTERS
+    int TOGO_FLAG_SLOW
+    int TOGO_SUBJECT_TG
+    int TOGO_SUBJECT_GEOS
+    togo_subject TOGO_NONE
+    int togo_set_flag(int flag, int on) nogil
+    uint64_t togo_now_ns() nogil
+    void togo_record(int stage, uint64_t t0, uint64_t nbytes, togo_subject subject) nogil
+import array as _array
+import functools as _functools
 import json as _json
+import mmap as _mmap
+import os as _os
+import struct as _struct
+import sys as _sys
+import threading as _threading
+import types as _types
+import weakref as _weakref
+from collections import OrderedDict as _OrderedDict, namedtuple as _namedtuple
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from multiprocessing import shared_memory as _shared_memory
+
+
+cdef array.array _DOUBLE_ARRAY_TEMPLATE = _array.array("d")
+cdef array.array _INT64_ARRAY_TEMPLATE = _array.array("q")
+cdef array.array _BOOL_ARRAY_TEMPLATE = _array.array("B")
+
+# Must run before anything is allocated through TG.
+tg_env_set_allocator(togo_malloc, togo_realloc, togo_free)
+
+# Calls per public entry point while instrumentation is on (see entry_stats()).
+cdef dict _entry_calls = {}
+
+
+cdef inline void _count_entry(str name):
+    if togo_instrument & TOGO_FLAG_COUNTERS:
+        _entry_calls[name] = _entry_calls.get(name, 0) + 1
 
 
 cdef Geometry _geometry_from_ptr(tg_geom *ptr):
@@ -394,6 +938,17 @@ cdef list _ring_points_as_tuples_from_ptr(const tg_ring *ring):
 
 
 cdef Geometry _coerce_geometry_or_raise(object obj, str arg_name, bint allow_point_tuple=False):
+    cdef uint64_t t0
+    if not togo_instrument:
+        return _coerce_geometry_impl(obj, arg_name, allow_point_tuple)
+    t0 = togo_now_ns()
+    try:
+        return _coerce_geometry_impl(obj, arg_name, allow_point_tuple)
+    finally:
+        togo_record(TOGO_ST_COERCE, t0, 0, TOGO_NONE)
+
+
+cdef Geometry _coerce_geometry_impl(object obj, str arg_name, bint allow_point_tuple):
     cdef Geometry g
     cdef object maybe_geom
     cdef object wkb_obj
@@ -428,6 +983,345 @@ cdef Geometry _coerce_geometry_or_raise(object obj, str arg_name, bint allow_poi
     raise TypeError(f"{arg_name} must be a Geometry instance")
 
 
+cdef array.array _new_double_array(Py_ssize_t n):
+    """Allocate an uninitialized array('d') of length n."""
+    return array.clone(_DOUBLE_ARRAY_TEMPLATE, n, zero=False)
+
+
+cdef object _double_rows(array.array data, Py_ssize_t n, Py_ssize_t k):
+    """View a flat array('d') of n * k values as an (n, k) memoryview.
+
+    memoryview cannot cast to a shape containing 0, so an empty result is
+    returned as the flat (zero-length) view.
+    """
+    if n == 0:
+        return memoryview(data)
+    return memoryview(data).cast("B").cast("d", (n, k))
+
+
+cdef array.array _new_int64_array(Py_ssize_t n):
+    """Allocate an uninitialized array('q') of length n."""
+    return array.clone(_INT64_ARRAY_TEMPLATE, n, zero=False)
+
+
+cdef array.array _new_bool_array(Py_ssize_t n):
+    """Allocate a zeroed array('B') of length n used as a boolean mask."""
+    return array.clone(_BOOL_ARRAY_TEMPLATE, n, zero=True)
+
+
+cdef int _index_level_num_rects(const tg_ring *ring, const tg_line *line, int level) except -1:
+    """Validated rect count of a ring (or, when ring is NULL, line) index level."""
+    cdef int levels = (
+        tg_ring_index_num_levels(ring) if ring != NULL else tg_line_index_num_levels(line)
+    )
+    if levels == 0:
+        raise ValueError("geometry has no index")
+    if level < 0 or level >= levels:
+        raise IndexError(f"index level {level} out of range (0..{levels - 1})")
+    if ring != NULL:
+        return tg_ring_index_level_num_rects(ring, level)
+    return tg_line_index_level_num_rects(line, level)
+
+
+cdef object _index_level_rects(const tg_ring *ring, const tg_line *line, int level):
+    cdef int n = _index_level_num_rects(ring, line, level)
+    cdef int i
+    cdef tg_rect r
+    cdef array.array out = _new_double_array(<Py_ssize_t>n * 4)
+    cdef double *dst = out.data.as_doubles
+    for i in range(n):
+        if ring != NULL:
+            r = tg_ring_index_level_rect(ring, level, i)
+        else:
+            r = tg_line_index_level_rect(line, level, i)
+        dst[4 * i] = r.min.x
+        dst[4 * i + 1] = r.min.y
+        dst[4 * i + 2] = r.max.x
+        dst[4 * i + 3] = r.max.y
+    return _double_rows(out, n, 4)
+
+
+cdef list _coerce_geometry_list(object geoms, str arg_name):
+    """Coerce a sequence of geometry-like objects into initialized Geometry values."""
+    cdef list result = []
+    cdef Geometry g
+    for obj in geoms:
+        g = _coerce_geometry_or_raise(obj, arg_name)
+        if g.geom == NULL:
+            raise ValueError(f"{arg_name} contains an uninitialized geometry")
+        result.append(g)
+    return result
+
+
+cdef const tg_geom **_geom_ptr_array(list coerced) except NULL:
+    """Borrow the tg_geom pointers of a list of Geometry (caller frees the array)."""
+    cdef Py_ssize_t n = len(coerced)
+    cdef Py_ssize_t i
+    cdef const tg_geom **arr = <const tg_geom **>malloc(
+        (<size_t>(n if n > 0 else 1)) * sizeof(tg_geom *)
+    )
+    if arr == NULL:
+        raise MemoryError("Failed to allocate geometry pointer array")
+    for i in range(n):
+        arr[i] = (<Geometry>coerced[i]).geom
+    return arr
+
+
+cdef int _resolve_threads(object threads) except -1:
+    """Validate a ``threads`` argument; None means one thread per CPU."""
+    cdef int n
+    if threads is None:
+        return _os.cpu_count() or 1
+    n = threads
+    if n < 1:
+        raise ValueError("threads must be >= 1")
+    return n
+
+
+def _run_chunked(Py_ssize_t n, int threads, work, int chunks_per_thread=1):
+    """Call work(start, stop) over [0, n) split into contiguous chunks.
+
+    ``work`` is expected to release the GIL for its inner loop so that the
+    chunks run in parallel on the thread pool. Uneven workloads can ask for
+    several smaller chunks per thread so idle workers pick up the slack.
+    """
+    cdef Py_ssize_t step, start, nchunks
+    if threads <= 1 or n < 2:
+        work(0, n)
+        return
+    if threads > n:
+        threads = <int>n
+    nchunks = min(n, <Py_ssize_t>threads * max(chunks_per_thread, 1))
+    step = (n + nchunks - 1) // nchunks
+    with _ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [
+            pool.submit(work, start, min(start + step, n)) for start in range(0, n, step)
+        ]
+        for future in futures:
+            future.result()
+
+
+cdef size_t _hull_point_count(const tg_geom *geom) noexcept nogil:
+    """Number of vertices relevant to the convex hull (holes are ignored)."""
+    cdef int t = tg_geom_typeof(geom)
+    cdef int i, n
+    cdef size_t total = 0
+    if t == 1:
+        return 0 if tg_geom_is_empty(geom) != 0 else 1
+    if t == 2:
+        return <size_t>tg_line_num_points(tg_geom_line(geom))
+    if t == 3:
+        return <size_t>tg_ring_num_points(tg_poly_exterior(tg_geom_poly(geom)))
+    if t == 4:
+        return <size_t>tg_geom_num_points(geom)
+    if t == 5:
+        n = tg_geom_num_lines(geom)
+        for i in range(n):
+            total += <size_t>tg_line_num_points(tg_geom_line_at(geom, i))
+        return total
+    if t == 6:
+        n = tg_geom_num_polys(geom)
+        for i in range(n):
+            total += <size_t>tg_ring_num_points(tg_poly_exterior(tg_geom_poly_at(geom, i)))
+        return total
+    if t == 7:
+        n = tg_geom_num_geometries(geom)
+        for i in range(n):
+            total += _hull_point_count(tg_geom_geometry_at(geom, i))
+        return total
+    return 0
+
+
+cdef size_t _copy_points(tg_point *dst, const tg_point *src, int n) noexcept nogil:
+    cdef int i
+    for i in range(n):
+        dst[i] = src[i]
+    return <size_t>(n if n > 0 else 0)
+
+
+cdef size_t _hull_collect_points(const tg_geom *geom, tg_point *dst) noexcept nogil:
+    """Copy hull-relevant vertices into dst, returning the number written."""
+    cdef int t = tg_geom_typeof(geom)
+    cdef int i, n
+    cdef const tg_line *ln
+    cdef const tg_ring *ring
+    cdef size_t k = 0
+    if t == 1:
+        if tg_geom_is_empty(geom) != 0:
+            return 0
+        dst[0] = tg_geom_point(geom)
+        return 1
+    if t == 2:
+        ln = tg_geom_line(geom)
+        return _copy_points(dst, tg_line_points(ln), tg_line_num_points(ln))
+    if t == 3:
+        ring = tg_poly_exterior(tg_geom_poly(geom))
+        return _copy_points(dst, tg_ring_points(ring), tg_ring_num_points(ring))
+    if t == 4:
+        n = tg_geom_num_points(geom)
+        for i in range(n):
+            dst[i] = tg_geom_point_at(geom, i)
+        return <size_t>n
+    if t == 5:
+        n = tg_geom_num_lines(geom)
+        for i in range(n):
+            ln = tg_geom_line_at(geom, i)
+            k += _copy_points(dst + k, tg_line_points(ln), tg_line_num_points(ln))
+        return k
+    if t == 6:
+        n = tg_geom_num_polys(geom)
+        for i in range(n):
+            ring = tg_poly_exterior(tg_geom_poly_at(geom, i))
+            k += _copy_points(dst + k, tg_ring_points(ring), tg_ring_num_points(ring))
+        return k
+    if t == 7:
+        n = tg_geom_num_geometries(geom)
+        for i in range(n):
+            k += _hull_collect_points(tg_geom_geometry_at(geom, i), dst + k)
+        return k
+    return 0
+
+
+cdef int _cmp_point_xy(const void *a, const void *b) noexcept nogil:
+    cdef const tg_point *pa = <const tg_point *>a
+    cdef const tg_point *pb = <const tg_point *>b
+    if pa.x < pb.x:
+        return -1
+    if pa.x > pb.x:
+        return 1
+    if pa.y < pb.y:
+        return -1
+    if pa.y > pb.y:
+        return 1
+    return 0
+
+
+cdef inline double _cross(tg_point o, tg_point a, tg_point b) noexcept nogil:
+    return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
+
+
+cdef size_t _monotone_chain(tg_point *pts, size_t n, tg_point *hull) noexcept nogil:
+    """Andrew's monotone chain over pts (sorted in place).
+
+    Writes a closed counter-clockwise ring into hull (which must hold n + 1
+    points) and returns its length, or the number of distinct hull vertices
+    when the input is degenerate (fewer than 3).
+    """
+    cdef size_t i, k = 0, lower
+    if n == 0:
+        return 0
+    qsort(pts, n, sizeof(tg_point), _cmp_point_xy)
+    for i in range(n):
+        while k >= 2 and _cross(hull[k - 2], hull[k - 1], pts[i]) <= 0:
+            k -= 1
+        hull[k] = pts[i]
+        k += 1
+    lower = k + 1
+    i = n - 1
+    while i > 0:
+        i -= 1
+        while k >= lower and _cross(hull[k - 2], hull[k - 1], pts[i]) <= 0:
+            k -= 1
+        hull[k] = pts[i]
+        k += 1
+    # k now includes the closing point (hull[k - 1] == hull[0]).
+    if k < 4:
+        return k - 1 if k > 1 else k
+    return k
+
+
+cdef size_t _hull_orient(const tg_point *ring, size_t m, bint ccw, tg_point *out) noexcept nogil:
+    """Copy the closed convex ring of m points into out in GEOS hull order.
+
+    GEOS emits hulls clockwise, starting at the lowest (then leftmost)
+    vertex, without collinear or repeated vertices; ccw tells whether ring
+    currently runs counter-clockwise. Returns the closed length of out.
+    """
+    cdef size_t k = m - 1, i, j, start = 0
+    for i in range(1, k):
+        if ring[i].y < ring[start].y or (ring[i].y == ring[start].y and ring[i].x < ring[start].x):
+            start = i
+    for i in range(k):
+        out[i] = ring[(start + k - i) % k] if ccw else ring[(start + i) % k]
+    # out[0] is an extreme point, so it is always a corner and stays put.
+    j = 1
+    for i in range(1, k):
+        if _cross(out[j - 1], out[i], out[i + 1] if i + 1 < k else out[0]) != 0:
+            out[j] = out[i]
+            j += 1
+    out[j] = out[0]
+    return j + 1
+
+
+cdef tg_geom *_polygon_from_points(const tg_point *pts, int n) noexcept nogil:
+    cdef tg_ring *ring = tg_ring_new(pts, n)
+    cdef tg_poly *poly
+    cdef tg_geom *g
+    if ring == NULL:
+        return NULL
+    poly = tg_poly_new(ring, NULL, 0)
+    tg_ring_free(ring)
+    if poly == NULL:
+        return NULL
+    g = tg_geom_new_polygon(poly)
+    tg_poly_free(poly)
+    return g
+
+
+cdef tg_geom *_native_convex_hull(const tg_geom *geom) except? NULL:
+    """Compute the convex hull of geom in TG without a GEOS round-trip.
+
+    Returns NULL when the hull is degenerate (empty, a single point or
+    collinear input) so the caller can defer to GEOS for those results.
+    """
+    cdef const tg_ring *ext
+    cdef tg_point *pts
+    cdef tg_point *hull
+    cdef size_t n, m
+    cdef tg_geom *result = NULL
+
+    # A polygon whose exterior TG already flagged as convex is its own hull.
+    if tg_geom_typeof(geom) == 3 and tg_geom_is_empty(geom) == 0:
+        ext = tg_poly_exterior(tg_geom_poly(geom))
+        if ext != NULL and tg_ring_num_points(ext) >= 4 and tg_ring_convex(ext):
+            m = tg_ring_num_points(ext)
+            hull = <tg_point *>malloc(m * sizeof(tg_point))
+            if hull == NULL:
+                raise MemoryError("Failed to allocate points for convex hull")
+            m = _hull_orient(tg_ring_points(ext), m, not tg_ring_clockwise(ext), hull)
+            if m >= 4:
+                result = _polygon_from_points(hull, <int>m)
+            free(hull)
+            if m >= 4:
+                if result == NULL:
+                    raise MemoryError("Failed to create convex hull polygon")
+                return result
+
+    n = _hull_point_count(geom)
+    if n < 3:
+        return NULL
+    if n >= <size_t>INT_MAX or n > ((<size_t>-1) // sizeof(tg_point)) // 2:
+        raise OverflowError("geometry has too many points for convex hull")
+    pts = <tg_point *>malloc((n + 1) * sizeof(tg_point))
+    hull = <tg_point *>malloc((n + 1) * sizeof(tg_point))
+    if pts == NULL or hull == NULL:
+        free(pts)
+        free(hull)
+        raise MemoryError("Failed to allocate points for convex hull")
+    with nogil:
+        n = _hull_collect_points(geom, pts)
+        m = _monotone_chain(pts, n, hull)
+        if m >= 4:
+            # pts is no longer needed and holds at least m points.
+            m = _hull_orient(hull, m, True, pts)
+            result = _polygon_from_points(pts, <int>m)
+    free(pts)
+    free(hull)
+    if m >= 4 and result == NULL:
+        raise MemoryError("Failed to create convex hull polygon")
+    return result
+
+
 def _restore_geometry_as(cls, bytes wkb_bytes):
     """Rebuild Geometry (or Geometry subclass) from WKB for pickling."""
     cdef Geometry geom = from_wkb(wkb_bytes)
@@ -446,11 +1340,204 @@ def _restore_poly_as(cls, exterior_coords, hole_coords):
     return cls(exterior_coords, hole_coords)
 
 
+# Live wrapper objects that own (or borrow) TG structures; see memory_stats().
+cdef Py_ssize_t _live_geometries = 0
+cdef Py_ssize_t _live_rings = 0
+cdef Py_ssize_t _live_lines = 0
+cdef Py_ssize_t _live_polys = 0
+
+
+cdef size_t _cache_overhead(object cached, size_t shared):
+    """
+    Native bytes a cached Geometry adds on top of ``shared`` bytes that it
+    references from its owner (TG clones rings, lines and polys by refcount).
+    """
+    cdef size_t size
+    if not isinstance(cached, Geometry) or (<Geometry>cached).geom == NULL:
+        return 0
+    size = tg_geom_memsize((<Geometry>cached).geom)
+    return size - shared if size > shared else 0
+
+
+# Wrapper caches: Point/Rect/Ring/Line/Poly keep their as_geometry() view and
+# Geometry/Poly their __geo_interface__ dict. The policy decides how new
+# entries are held: "on" (strongly, on the object), "off" (not at all),
+# "weak" (as_geometry views through a weakref; dicts are not cached) or
+# "lru" (strongly, but evicted oldest-first beyond a global byte budget).
+_CACHE_MODES = ("on", "off", "weak", "lru")
+cdef int _CACHE_ON = 0
+cdef int _CACHE_OFF = 1
+cdef int _CACHE_WEAK = 2
+cdef int _CACHE_LRU = 3
+cdef int _SLOT_GEOMETRY = 0
+cdef int _SLOT_GEO_INTERFACE = 1
+cdef int _cache_mode = _CACHE_ON
+cdef Py_ssize_t _cache_max_bytes = 0
+cdef Py_ssize_t _cache_bytes = 0
+# (id(owner), slot) -> (borrowed owner address, nbytes). Owners drop their
+# entries in __dealloc__, so every stored address refers to a live object.
+cdef object _cache_lru = _OrderedDict()
+
+
+cdef size_t _owner_memsize(object owner):
+    if isinstance(owner, Ring):
+        return tg_ring_memsize((<Ring>owner).ring)
+    if isinstance(owner, Line):
+        return tg_line_memsize((<Line>owner).line)
+    if isinstance(owner, Poly):
+        return tg_poly_memsize((<Poly>owner).poly)
+    return 0
+
+
+cdef Py_ssize_t _deep_sizeof(object value):
+    """Size of a GeoJSON-like tree of dicts, lists, tuples and scalars."""
+    cdef Py_ssize_t size = _sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in (<dict>value).items():
+            size += _deep_sizeof(k) + _deep_sizeof(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            size += _deep_sizeof(v)
+    return size
+
+
+cdef Py_ssize_t _cached_dict_size(object cached):
+    """Size of a cached __geo_interface__ dict (0 for an empty or weak slot)."""
+    return _deep_sizeof(cached) if isinstance(cached, dict) else 0
+
+
+cdef void _cache_slot_clear(object owner, int slot):
+    if slot == _SLOT_GEO_INTERFACE:
+        if isinstance(owner, Geometry):
+            (<Geometry>owner)._cached_geo_interface = None
+        else:
+            (<Poly>owner)._cached_geo_interface = None
+    elif isinstance(owner, Point):
+        (<Point>owner)._cached_geometry = None
+    elif isinstance(owner, Rect):
+        (<Rect>owner)._cached_geometry = None
+    elif isinstance(owner, Ring):
+        (<Ring>owner)._cached_geometry = None
+    elif isinstance(owner, Line):
+        (<Line>owner)._cached_geometry = None
+    elif isinstance(owner, Poly):
+        (<Poly>owner)._cached_geometry = None
+
+
+cdef void _cache_evict(Py_ssize_t budget):
+    """Drop least recently used entries until at most ``budget`` bytes remain."""
+    global _cache_bytes
+    cdef Py_ssize_t address
+    while _cache_lru and _cache_bytes > budget:
+        key, entry = _cache_lru.popitem(last=False)
+        address, nbytes = entry
+        _cache_bytes -= nbytes
+        _cache_slot_clear(<object><void *>address, key[1])
+
+
+cdef void _cache_forget(object owner) noexcept:
+    """Remove an owner's LRU entries; called from __dealloc__."""
+    global _cache_bytes
+    cdef Py_ssize_t ident = id(owner)
+    for slot in (_SLOT_GEOMETRY, _SLOT_GEO_INTERFACE):
+        entry = _cache_lru.pop((ident, slot), None)
+        if entry is not None:
+            _cache_bytes -= entry[1]
+
+
+cdef object _cache_lookup(object owner, int slot, object held):
+    """Return the object cached in a slot holding ``held``, or None."""
+    if held is None:
+        return None
+    if type(held) is _weakref.ref:
+        return held()
+    if _cache_mode == _CACHE_LRU and _cache_lru:
+        key = (id(owner), slot)
+        if key in _cache_lru:
+            _cache_lru.move_to_end(key)
+    return held
+
+
+cdef object _cache_store(object owner, int slot, object value):
+    """Return what ``owner`` should keep in its cache slot for ``value``."""
+    global _cache_bytes
+    cdef Py_ssize_t nbytes
+    if _cache_mode == _CACHE_ON:
+        return value
+    if _cache_mode == _CACHE_WEAK:
+        return _weakref.ref(value) if slot == _SLOT_GEOMETRY else None
+    if _cache_mode == _CACHE_LRU:
+        if slot == _SLOT_GEOMETRY:
+            nbytes = object.__sizeof__(value) + _cache_overhead(value, _owner_memsize(owner))
+        else:
+            nbytes = _deep_sizeof(value)
+        if nbytes > _cache_max_bytes:
+            return None
+        key = (id(owner), slot)
+        entry = _cache_lru.pop(key, None)
+        if entry is not None:
+            _cache_bytes -= entry[1]
+        _cache_evict(_cache_max_bytes - nbytes)
+        _cache_lru[key] = (<Py_ssize_t><void *>owner, nbytes)
+        _cache_bytes += nbytes
+        return value
+    return None
+
+
+def set_cache_policy(mode: str = "on", max_bytes=None) -> None:
+    """
+    Choose how wrapper objects cache their ``as_geometry()`` view and
+    ``__geo_interface__`` dict.
+
+    Parameters:
+    -----------
+    mode : str
+        ``"on"`` (default): cache on the object for its lifetime.
+        ``"off"``: never cache; every call rebuilds (views share the TG
+        structure, so this costs a wrapper, not a copy of the coordinates).
+        ``"weak"``: reuse an ``as_geometry()`` view only while something
+        else keeps it alive; ``__geo_interface__`` dicts are not cached.
+        ``"lru"``: cache, but evict least recently used entries once their
+        estimated size exceeds ``max_bytes``.
+    max_bytes : int, optional
+        Byte budget for ``"lru"`` (required for that mode).
+
+    The policy applies to entries created afterwards; switching away from
+    ``"lru"`` drops the entries it was tracking.
+    """
+    global _cache_mode, _cache_max_bytes
+    if mode not in _CACHE_MODES:
+        raise ValueError(f"mode must be one of {_CACHE_MODES}")
+    if mode == "lru":
+        if max_bytes is None:
+            raise ValueError("max_bytes is required for the 'lru' cache policy")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+    elif max_bytes is not None:
+        raise ValueError("max_bytes only applies to the 'lru' cache policy")
+    _cache_mode = _CACHE_MODES.index(mode)
+    _cache_max_bytes = max_bytes or 0
+    _cache_evict(_cache_max_bytes)
+
+
+def get_cache_policy() -> dict:
+    """Current cache policy with the LRU entry count and estimated bytes."""
+    return {
+        "mode": _CACHE_MODES[_cache_mode],
+        "max_bytes": _cache_max_bytes if _cache_mode == _CACHE_LRU else None,
+        "entries": len(_cache_lru),
+        "bytes": _cache_bytes,
+    }
+
+
 cdef class Geometry:
     cdef tg_geom *geom
     cdef object _cached_geo_interface
+    cdef object __weakref__
 
     def __cinit__(self, data=None, fmt: str = "geojson"):
+        global _live_geometries
+        _live_geometries += 1
         self.geom = NULL
         self._cached_geo_interface = None
         if data is not None and not isinstance(data, str):
@@ -583,8 +1670,15 @@ cdef class Geometry:
 
     @property
     def memsize(self) -> int:
+        """Bytes of native memory held by the underlying TG geometry."""
         return tg_geom_memsize(self.geom)
 
+    def __sizeof__(self):
+        return (
+            object.__sizeof__(self) + tg_geom_memsize(self.geom)
+            + _cached_dict_size(self._cached_geo_interface)
+        )
+
     @property
     def num_points(self) -> int:
         return tg_geom_num_points(self.geom)
@@ -845,6 +1939,10 @@ cdef class Geometry:
         return _geometry_from_ptr(tg_geom_new_linestring(line._get_c_line()))
 
     def __dealloc__(self):
+        global _live_geometries
+        _live_geometries -= 1
+        if _cache_lru:
+            _cache_forget(self)
         if self.geom:
             tg_geom_free(self.geom)
 
@@ -1116,8 +2214,10 @@ cdef class Geometry:
     @property
     def __geo_interface__(self) -> dict:
         """Returns GeoJSON-like dict for Shapely compatibility"""
-        if self._cached_geo_interface is not None:
-            return _clone_geo_interface_payload(self._cached_geo_interface)
+        _count_entry("Geometry.__geo_interface__")
+        cached = _cache_lookup(self, _SLOT_GEO_INTERFACE, self._cached_geo_interface)
+        if cached is not None:
+            return _clone_geo_interface_payload(cached)
 
         if self.geom == NULL:
             return {}
@@ -1135,7 +2235,7 @@ cdef class Geometry:
 
         try:
             res = _json.loads(p_buf[:n].decode("utf-8"))
-            self._cached_geo_interface = res
+            self._cached_geo_interface = _cache_store(self, _SLOT_GEO_INTERFACE, res)
             return _clone_geo_interface_payload(res)
         finally:
             if allocated:
@@ -1717,6 +2817,7 @@ cdef class Geometry:
         Geometry
             A new Geometry representing the buffered shape
         """
+        _count_entry("Geometry.buffer")
         if distance == 0:
             return self
 
@@ -1781,6 +2882,7 @@ cdef class Geometry:
         Geometry
             A new Geometry representing the simplified shape
         """
+        _count_entry("Geometry.simplify")
         if tolerance < 0:
             raise ValueError("tolerance must be >= 0")
 
@@ -1899,6 +3001,11 @@ cdef class Geometry:
         """
         self._ensure_initialized("this")
 
+        # Non-degenerate hulls are computed natively; GEOS handles the rest.
+        cdef tg_geom *native = _native_convex_hull(self.geom)
+        if native != NULL:
+            return _geometry_from_ptr(native)
+
         cdef GEOSContextHandle_t ctx = GEOS_init_r()
         if ctx == NULL:
             raise RuntimeError("Failed to initialize GEOS context")
@@ -1962,6 +3069,7 @@ cdef class Geometry:
         >>> print(result.geom_type)
         Polygon
         """
+        _count_entry("Geometry.intersection")
         cdef GEOSContextHandle_t ctx
         cdef GEOSGeometry *g1_geos
         cdef GEOSGeometry *g2_geos
@@ -2034,6 +3142,7 @@ cdef class Geometry:
 
     def union(self, other) -> Geometry:
         """Return the geometric union of this geometry with another."""
+        _count_entry("Geometry.union")
         cdef GEOSContextHandle_t ctx
         cdef GEOSGeometry *g1_geos
         cdef GEOSGeometry *g2_geos
@@ -2112,6 +3221,7 @@ cdef class Geometry:
 
     def difference(self, other) -> Geometry:
         """Return the geometric difference of this geometry and another."""
+        _count_entry("Geometry.difference")
         cdef GEOSContextHandle_t ctx
         cdef GEOSGeometry *g1_geos
         cdef GEOSGeometry *g2_geos
@@ -2425,6 +3535,10 @@ cdef class Point:
         self.pt.y = y
         self._cached_geometry = None
 
+    def __dealloc__(self):
+        if _cache_lru:
+            _cache_forget(self)
+
     def __str__(self):
         return f"Point({self.pt.x}, {self.pt.y})"
 
@@ -2473,11 +3587,21 @@ cdef class Point:
     cdef tg_point _get_c_point(self) noexcept:
         return self.pt
 
+    @property
+    def memsize(self) -> int:
+        """Bytes of native memory held (always 0: the point is stored inline)."""
+        return 0
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + _cache_overhead(self._cached_geometry, 0)
+
     def as_geometry(self) -> Geometry:
-        # Cache geometry result since Point is immutable
-        if self._cached_geometry is None:
-            self._cached_geometry = self._as_geometry()
-        return self._cached_geometry
+        # Cache geometry result since Point is immutable (subject to set_cache_policy)
+        cached = _cache_lookup(self, _SLOT_GEOMETRY, self._cached_geometry)
+        if cached is None:
+            cached = self._as_geometry()
+            self._cached_geometry = _cache_store(self, _SLOT_GEOMETRY, cached)
+        return cached
 
     cdef Geometry _as_geometry(self):
         return _geometry_from_ptr(tg_geom_new_point(self.pt))
@@ -2724,6 +3848,10 @@ cdef class Rect:
         self.rect.max = max_pt.pt
         self._cached_geometry = None
 
+    def __dealloc__(self):
+        if _cache_lru:
+            _cache_forget(self)
+
     def __str__(self):
         return (
             f"Rect(min=({self.rect.min.x}, {self.rect.min.y}), "
@@ -2771,11 +3899,21 @@ cdef class Rect:
         else:
             raise TypeError("intersects expects Rect or Point")
 
+    @property
+    def memsize(self) -> int:
+        """Bytes of native memory held (always 0: the rect is stored inline)."""
+        return 0
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + _cache_overhead(self._cached_geometry, 0)
+
     def as_geometry(self) -> Geometry:
-        # Cache geometry result since Rect is immutable
-        if self._cached_geometry is None:
-            self._cached_geometry = self._as_geometry()
-        return self._cached_geometry
+        # Cache geometry result since Rect is immutable (subject to set_cache_policy)
+        cached = _cache_lookup(self, _SLOT_GEOMETRY, self._cached_geometry)
+        if cached is None:
+            cached = self._as_geometry()
+            self._cached_geometry = _cache_store(self, _SLOT_GEOMETRY, cached)
+        return cached
 
     cdef Geometry _as_geometry(self):
         minx, miny = self.rect.min.x, self.rect.min.y
@@ -2797,7 +3935,7 @@ cdef class Ring:
     cdef bint owns_pointer
     cdef object _cached_geometry
 
-    def __init__(self, points):
+    def __init__(self, points, index=None, index_spread=None):
         if not isinstance(points, list):
             points = list(points)
         cdef int n = _checked_c_count(points, "points")
@@ -2822,6 +3960,7 @@ cdef class Ring:
 
         if (<size_t>(<unsigned int>n)) > ((<size_t>-1) // sizeof(tg_point)):
             raise OverflowError("points is too large")
+        cdef int ix = _resolve_index(index, index_spread, <size_t>n)
         cdef tg_point *pts = <tg_point *>malloc((<size_t>(<unsigned int>n)) * sizeof(tg_point))
         if not pts:
             raise MemoryError("Failed to allocate points for Ring")
@@ -2842,7 +3981,7 @@ cdef class Ring:
                 x, y = _coerce_xy(points[i], "points")
                 pts[i].x = x
                 pts[i].y = y
-            self.ring = tg_ring_new(pts, n)
+            self.ring = tg_ring_new_ix(pts, n, <tg_index>ix)
         finally:
             free(pts)
         if not self.ring:
@@ -2901,10 +4040,30 @@ cdef class Ring:
     cdef tg_ring *_get_c_ring(self) noexcept:
         return self.ring
 
+    def __cinit__(self, *args, **kwargs):
+        global _live_rings
+        _live_rings += 1
+
     def __dealloc__(self):
+        global _live_rings
+        _live_rings -= 1
+        if _cache_lru:
+            _cache_forget(self)
         if self.ring and self.owns_pointer:
             tg_ring_free(self.ring)
 
+    @property
+    def memsize(self) -> int:
+        """Bytes of native memory held by the ring (points and index)."""
+        return tg_ring_memsize(self.ring)
+
+    def __sizeof__(self):
+        cdef size_t own = tg_ring_memsize(self.ring)
+        return (
+            object.__sizeof__(self) + (own if self.owns_pointer else 0)
+            + _cache_overhead(self._cached_geometry, own)
+        )
+
     @property
     def num_points(self) -> int:
         return tg_ring_num_points(self.ring)
@@ -2929,6 +4088,25 @@ cdef class Ring:
         cdef tg_rect r = tg_ring_rect(self.ring)
         return Rect(Point(r.min.x, r.min.y), Point(r.max.x, r.max.y))
 
+    @property
+    def index_spread(self) -> int:
+        """Spread of the ring's natural index (0 when the ring is not indexed)."""
+        return tg_ring_index_spread(self.ring)
+
+    @property
+    def index_num_levels(self) -> int:
+        """Number of levels in the ring's natural index (0 when not indexed)."""
+        return tg_ring_index_num_levels(self.ring)
+
+    def index_level_num_rects(self, int level) -> int:
+        """Number of rectangles at the given index level (0 is the root level)."""
+        return _index_level_num_rects(self.ring, NULL, level)
+
+    def index_level_rects(self, int level):
+        """Rectangles at the given index level as an (N, 4) float64 memoryview of
+        (minx, miny, maxx, maxy) rows."""
+        return _index_level_rects(self.ring, NULL, level)
+
     @property
     def is_convex(self) -> bool:
         return tg_ring_convex(self.ring)
@@ -2938,17 +4116,16 @@ cdef class Ring:
         return tg_ring_clockwise(self.ring)
 
     def as_geometry(self) -> Geometry:
-        # Cache geometry result since Ring is immutable
-        if self._cached_geometry is None:
-            self._cached_geometry = self._as_geometry()
-        return self._cached_geometry
+        # Cache geometry result since Ring is immutable (subject to set_cache_policy)
+        cached = _cache_lookup(self, _SLOT_GEOMETRY, self._cached_geometry)
+        if cached is None:
+            cached = self._as_geometry()
+            self._cached_geometry = _cache_store(self, _SLOT_GEOMETRY, cached)
+        return cached
 
     cdef Geometry _as_geometry(self):
-        cdef tg_poly *p = tg_poly_new(self.ring, NULL, 0)
-        if not p:
-            raise ValueError("Failed to create Poly from Ring")
-        cdef tg_geom *g = tg_geom_new_polygon(<const tg_poly *>p)
-        tg_poly_free(p)
+        # TG rings upcast to polygons, so the view shares this ring by refcount.
+        cdef tg_geom *g = tg_geom_new_polygon(<const tg_poly *>self.ring)
         if not g:
             raise ValueError("Failed to create Geometry from Ring")
         return _geometry_from_ptr(g)
@@ -3211,7 +4388,7 @@ cdef class Line:
     cdef bint owns_pointer
     cdef object _cached_geometry
 
-    def __init__(self, points):
+    def __init__(self, points, index=None, index_spread=None):
         if not isinstance(points, list):
             points = list(points)
         cdef int n = _checked_c_count(points, "points")
@@ -3220,6 +4397,7 @@ cdef class Line:
         cdef double y
         if (<size_t>(<unsigned int>n)) > ((<size_t>-1) // sizeof(tg_point)):
             raise OverflowError("points is too large")
+        cdef int ix = _resolve_index(index, index_spread, <size_t>n)
         cdef tg_point *pts = <tg_point *>malloc((<size_t>(<unsigned int>n)) * sizeof(tg_point))
         if not pts:
             raise MemoryError("Failed to allocate points for Line")
@@ -3228,7 +4406,7 @@ cdef class Line:
                 x, y = _coerce_xy(points[i], "points")
                 pts[i].x = x
                 pts[i].y = y
-            self.line = tg_line_new(pts, n)
+            self.line = tg_line_new_ix(pts, n, <tg_index>ix)
         finally:
             free(pts)
         if not self.line:
@@ -3236,10 +4414,30 @@ cdef class Line:
         self.owns_pointer = True
         self._cached_geometry = None
 
+    def __cinit__(self, *args, **kwargs):
+        global _live_lines
+        _live_lines += 1
+
     def __dealloc__(self):
+        global _live_lines
+        _live_lines -= 1
+        if _cache_lru:
+            _cache_forget(self)
         if self.line and self.owns_pointer:
             tg_line_free(self.line)
 
+    @property
+    def memsize(self) -> int:
+        """Bytes of native memory held by the line (points and index)."""
+        return tg_line_memsize(self.line)
+
+    def __sizeof__(self):
+        cdef size_t own = tg_line_memsize(self.line)
+        return (
+            object.__sizeof__(self) + (own if self.owns_pointer else 0)
+            + _cache_overhead(self._cached_geometry, own)
+        )
+
     def __str__(self):
         try:
             n = tg_line_num_points(self.line)
@@ -3295,14 +4493,35 @@ cdef class Line:
         cdef tg_rect r = tg_line_rect(self.line)
         return Rect(Point(r.min.x, r.min.y), Point(r.max.x, r.max.y))
 
+    @property
+    def index_spread(self) -> int:
+        """Spread of the line's natural index (0 when the line is not indexed)."""
+        return tg_line_index_spread(self.line)
+
+    @property
+    def index_num_levels(self) -> int:
+        """Number of levels in the line's natural index (0 when not indexed)."""
+        return tg_line_index_num_levels(self.line)
+
+    def index_level_num_rects(self, int level) -> int:
+        """Number of rectangles at the given index level (0 is the root level)."""
+        return _index_level_num_rects(NULL, self.line, level)
+
+    def index_level_rects(self, int level):
+        """Rectangles at the given index level as an (N, 4) float64 memoryview of
+        (minx, miny, maxx, maxy) rows."""
+        return _index_level_rects(NULL, self.line, level)
+
     def is_clockwise(self) -> bool:
         return tg_line_clockwise(self.line)
 
     def as_geometry(self) -> Geometry:
-        # Cache geometry result since Line is immutable
-        if self._cached_geometry is None:
-            self._cached_geometry = self._as_geometry()
-        return self._cached_geometry
+        # Cache geometry result since Line is immutable (subject to set_cache_policy)
+        cached = _cache_lookup(self, _SLOT_GEOMETRY, self._cached_geometry)
+        if cached is None:
+            cached = self._as_geometry()
+            self._cached_geometry = _cache_store(self, _SLOT_GEOMETRY, cached)
+        return cached
 
     cdef Geometry _as_geometry(self):
         cdef tg_geom *g = tg_geom_new_linestring(self.line)
@@ -3626,18 +4845,24 @@ cdef class Poly:
     cdef object _cached_geometry
     cdef object _cached_geo_interface
 
-    def __init__(self, exterior, holes=None):
+    def __init__(self, exterior, holes=None, index=None, index_spread=None):
         cdef int nholes = 0
         cdef int i
         cdef tg_ring **hole_ptrs = NULL
         cdef tg_ring **holes_arr = NULL
         cdef tg_ring *ext_ring
         cdef tg_ring *hole_ptr
+        cdef bint reindex = index is not None or index_spread is not None
         if not isinstance(exterior, Ring):
             raise TypeError("exterior must be a Ring")
         ext_ring = (<Ring>exterior)._get_c_ring()
         if ext_ring == NULL:
             raise ValueError("exterior Ring is not initialized")
+        if reindex:
+            # Rings carry their own index, so an explicit choice means
+            # rebuilding each ring with it before the polygon takes a reference.
+            exterior = _reindexed_ring(ext_ring, index, index_spread)
+            ext_ring = (<Ring>exterior).ring
         # Handle holes
         if holes is None or len(holes) == 0:
             nholes = 0
@@ -3651,6 +4876,7 @@ cdef class Poly:
             )
             if not hole_ptrs:
                 raise MemoryError("Failed to allocate holes array")
+            reindexed = []
             try:
                 for i in range(nholes):
                     if not isinstance(holes[i], Ring):
@@ -3658,6 +4884,9 @@ cdef class Poly:
                     hole_ptr = (<Ring>holes[i])._get_c_ring()
                     if hole_ptr == NULL:
                         raise ValueError(f"hole {i} Ring is not initialized")
+                    if reindex:
+                        reindexed.append(_reindexed_ring(hole_ptr, index, index_spread))
+                        hole_ptr = (<Ring>reindexed[i]).ring
                     hole_ptrs[i] = hole_ptr
             except Exception:
                 free(hole_ptrs)
@@ -3672,10 +4901,31 @@ cdef class Poly:
         self._cached_geometry = None
         self._cached_geo_interface = None
 
+    def __cinit__(self, *args, **kwargs):
+        global _live_polys
+        _live_polys += 1
+
     def __dealloc__(self):
+        global _live_polys
+        _live_polys -= 1
+        if _cache_lru:
+            _cache_forget(self)
         if self.poly and self.owns_pointer:
             tg_poly_free(self.poly)
 
+    @property
+    def memsize(self) -> int:
+        """Bytes of native memory held by the polygon and its rings."""
+        return tg_poly_memsize(self.poly)
+
+    def __sizeof__(self):
+        cdef size_t own = tg_poly_memsize(self.poly)
+        return (
+            object.__sizeof__(self) + (own if self.owns_pointer else 0)
+            + _cache_overhead(self._cached_geometry, own)
+            + _cached_dict_size(self._cached_geo_interface)
+        )
+
     def __str__(self):
         try:
             ext_n = tg_poly_num_holes(self.poly)  # temporarily store holes count
@@ -3733,6 +4983,25 @@ cdef class Poly:
     def num_holes(self) -> int:
         return tg_poly_num_holes(self.poly)
 
+    @property
+    def index_spread(self) -> int:
+        """Spread of the exterior ring's natural index (0 when not indexed)."""
+        return tg_ring_index_spread(tg_poly_exterior(self.poly))
+
+    @property
+    def index_num_levels(self) -> int:
+        """Number of levels in the exterior ring's natural index (0 when not indexed)."""
+        return tg_ring_index_num_levels(tg_poly_exterior(self.poly))
+
+    def index_level_num_rects(self, int level) -> int:
+        """Number of rectangles at the given exterior index level (0 is the root level)."""
+        return _index_level_num_rects(tg_poly_exterior(self.poly), NULL, level)
+
+    def index_level_rects(self, int level):
+        """Exterior ring index rectangles at the given level as an (N, 4) float64
+        memoryview of (minx, miny, maxx, maxy) rows."""
+        return _index_level_rects(tg_poly_exterior(self.poly), NULL, level)
+
     @staticmethod
     cdef Poly _from_c_poly(tg_poly *ptr):
         if ptr == NULL:
@@ -3759,10 +5028,12 @@ cdef class Poly:
         return tg_poly_clockwise(self.poly)
 
     def as_geometry(self) -> Geometry:
-        # Cache geometry result since Poly is immutable
-        if self._cached_geometry is None:
-            self._cached_geometry = self._as_geometry()
-        return self._cached_geometry
+        # Cache geometry result since Poly is immutable (subject to set_cache_policy)
+        cached = _cache_lookup(self, _SLOT_GEOMETRY, self._cached_geometry)
+        if cached is None:
+            cached = self._as_geometry()
+            self._cached_geometry = _cache_store(self, _SLOT_GEOMETRY, cached)
+        return cached
 
     cdef Geometry _as_geometry(self):
         cdef tg_geom *g = tg_geom_new_polygon(self.poly)
@@ -3847,8 +5118,10 @@ cdef class Poly:
     @property
     def __geo_interface__(self) -> dict:
         """Returns GeoJSON-like dict for Shapely compatibility"""
-        if self._cached_geo_interface is not None:
-            return _clone_geo_interface_payload(self._cached_geo_interface)
+        _count_entry("Poly.__geo_interface__")
+        cached = _cache_lookup(self, _SLOT_GEO_INTERFACE, self._cached_geo_interface)
+        if cached is not None:
+            return _clone_geo_interface_payload(cached)
 
         if self.poly == NULL:
             return {}
@@ -3857,7 +5130,7 @@ cdef class Poly:
         cdef int nholes = tg_poly_num_holes(self.poly)
         ext_coords = _ring_points_as_tuples_from_ptr(tg_poly_exterior(self.poly))
         if nholes == 0:
-            self._cached_geo_interface = {
+            res = {
                 "type": "Polygon",
                 "coordinates": [ext_coords],
             }
@@ -3865,12 +5138,12 @@ cdef class Poly:
             hole_coords = []
             for i in range(nholes):
                 hole_coords.append(_ring_points_as_tuples_from_ptr(tg_poly_hole_at(self.poly, i)))
-            self._cached_geo_interface = {
+            res = {
                 "type": "Polygon",
                 "coordinates": [ext_coords] + hole_coords,
             }
-
-        return _clone_geo_interface_payload(self._cached_geo_interface)
+        self._cached_geo_interface = _cache_store(self, _SLOT_GEO_INTERFACE, res)
+        return _clone_geo_interface_payload(res)
 
     def buffer(self, distance: float, quad_segs: int = 16,
                cap_style: int = 1, join_style: int = 1,
@@ -4132,6 +5405,11 @@ cdef class Segment:
     def __repr__(self):
         return self.__str__()
 
+    @property
+    def memsize(self) -> int:
+        """Bytes of native memory held (always 0: the segment is stored inline)."""
+        return 0
+
     def rect(self) -> tuple:
         cdef tg_rect r = tg_segment_rect(self.seg)
         return ((r.min.x, r.min.y), (r.max.x, r.max.y))
@@ -4181,6 +5459,156 @@ def set_polygon_indexing_mode(ix: TGIndex) -> None:
     tg_env_set_index(ix)
 
 
+_auto_index_policy = {"threshold": 256, "index": TGIndex.YSTRIPES, "index_spread": None}
+
+
+def set_auto_index_policy(
+    threshold: int = 256,
+    index: TGIndex = TGIndex.YSTRIPES,
+    index_spread: Optional[int] = None,
+) -> None:
+    """
+    Configure what ``index="auto"`` resolves to.
+
+    Rings and lines with at least ``threshold`` vertices are built with
+    ``index`` (and ``index_spread`` when given); smaller ones are left
+    unindexed, trading a little search speed for memory. Parsers apply the
+    threshold to the largest ring or line of the parsed geometry.
+
+    Parameters:
+    -----------
+    threshold : int
+        Minimum vertex count for a ring or line to be indexed.
+    index : TGIndex
+        Index used for rings and lines at or above the threshold.
+    index_spread : int, optional
+        Spread used with ``index``; None keeps the global default.
+    """
+    cdef long long n = threshold
+    if n < 0:
+        raise ValueError("threshold must be >= 0")
+    index = TGIndex(index)
+    if index_spread is not None:
+        _check_index_spread(index_spread)
+    _auto_index_policy.update(threshold=n, index=index, index_spread=index_spread)
+
+
+def get_auto_index_policy() -> dict:
+    """Return the current ``index="auto"`` policy as a dict."""
+    return dict(_auto_index_policy)
+
+
+cdef int _check_index_spread(object index_spread) except -1:
+    cdef int spread = index_spread
+    if spread < 2 or spread > 4096:
+        raise ValueError("index_spread must be between 2 and 4096")
+    return spread
+
+
+cdef int _resolve_index(object index, object index_spread, size_t npoints) except -1:
+    """
+    Translate the ``index=`` / ``index_spread=`` arguments into the tg_index
+    value passed to TG's ``*_ix`` constructors. ``npoints`` is the vertex count
+    the ``"auto"`` policy is evaluated against.
+    """
+    cdef int ix
+    if isinstance(index, str):
+        if index != "auto":
+            raise ValueError(f"index must be a TGIndex value or 'auto', got {index!r}")
+        if npoints < <size_t>_auto_index_policy["threshold"]:
+            return TG_NONE
+        index = _auto_index_policy["index"]
+        if index_spread is None:
+            index_spread = _auto_index_policy["index_spread"]
+    ix = TG_DEFAULT if index is None else int(TGIndex(index))
+    if index_spread is not None:
+        ix = tg_index_with_spread(<tg_index>ix, _check_index_spread(index_spread))
+    return ix
+
+
+cdef Ring _reindexed_ring(const tg_ring *ring, object index, object index_spread):
+    """Copy ``ring`` into a new owned Ring built with the requested index."""
+    cdef int n = tg_ring_num_points(ring)
+    cdef int ix = _resolve_index(index, index_spread, <size_t>n)
+    cdef tg_ring *out = tg_ring_new_ix(tg_ring_points(ring), n, <tg_index>ix)
+    cdef Ring r
+    if out == NULL:
+        raise MemoryError("Failed to re-index Ring")
+    r = Ring.__new__(Ring)
+    r.ring = out
+    r.owns_pointer = True
+    r._cached_geometry = None
+    return r
+
+
+cdef int _max_series_points(const tg_geom *geom) noexcept nogil:
+    """Vertex count of the largest ring or line in ``geom``."""
+    cdef int t = tg_geom_typeof(geom)
+    cdef int i, j, n
+    cdef int best = 0
+    cdef const tg_poly *poly
+    if t == 2:
+        return tg_line_num_points(tg_geom_line(geom))
+    if t == 3 or t == 6:
+        n = 1 if t == 3 else tg_geom_num_polys(geom)
+        for i in range(n):
+            poly = tg_geom_poly(geom) if t == 3 else tg_geom_poly_at(geom, i)
+            best = max(best, tg_ring_num_points(tg_poly_exterior(poly)))
+            for j in range(tg_poly_num_holes(poly)):
+                best = max(best, tg_ring_num_points(tg_poly_hole_at(poly, j)))
+        return best
+    if t == 5:
+        for i in range(tg_geom_num_lines(geom)):
+            best = max(best, tg_line_num_points(tg_geom_line_at(geom, i)))
+        return best
+    if t == 7:
+        for i in range(tg_geom_num_geometries(geom)):
+            best = max(best, _max_series_points(tg_geom_geometry_at(geom, i)))
+        return best
+    return 0
+
+
+cdef tg_geom *_parse_ix(int fmt, const unsigned char *data, size_t n, int ix) noexcept nogil:
+    if fmt == 0:
+        return tg_parse_wktn_ix(<const char *>data, n, <tg_index>ix)
+    if fmt == 1:
+        return tg_parse_geojsonn_ix(<const char *>data, n, <tg_index>ix)
+    return tg_parse_wkb_ix(data, n, <tg_index>ix)
+
+
+cdef object _parse_indexed(
+    int fmt, const unsigned char[::1] data, object index, object index_spread
+):
+    """
+    Parse WKT (0), GeoJSON (1) or WKB (2) with an explicit index choice.
+    For ``index="auto"`` the input is parsed with the policy's index and
+    reparsed unindexed when its largest ring or line is under the threshold;
+    reparsing is cheap precisely because such inputs are small.
+    """
+    cdef size_t n = data.shape[0]
+    cdef const unsigned char *ptr = &data[0] if n > 0 else NULL
+    cdef int ix = _resolve_index(index, index_spread, <size_t>-1)
+    cdef tg_geom *g
+    cdef const char *err
+    with nogil:
+        g = _parse_ix(fmt, ptr, n, ix)
+    if g == NULL:
+        raise MemoryError("Failed to parse geometry")
+    err = tg_geom_error(g)
+    if err != NULL:
+        msg = err.decode("utf-8")
+        tg_geom_free(g)
+        raise ValueError(msg)
+    if isinstance(index, str) and ix != TG_NONE:
+        if _max_series_points(g) < _auto_index_policy["threshold"]:
+            tg_geom_free(g)
+            with nogil:
+                g = _parse_ix(fmt, ptr, n, TG_NONE)
+            if g == NULL:
+                raise MemoryError("Failed to parse geometry")
+    return _geometry_from_ptr_concrete(g)
+
+
 # Shapely-compatible aliases
 LineString = Line
 
@@ -4217,7 +5645,9 @@ class Polygon(Poly):
     def __init__(
         self,
         exterior: Union[Ring, Sequence[Tuple[float, float]]],
-        holes: Optional[Sequence[Union[Ring, Sequence[Tuple[float, float]]]]] = None
+        holes: Optional[Sequence[Union[Ring, Sequence[Tuple[float, float]]]]] = None,
+        index=None,
+        index_spread: Optional[int] = None,
     ) -> None:
         """Initialize Polygon from exterior ring and optional holes.
 
@@ -4227,17 +5657,29 @@ class Polygon(Poly):
             The exterior ring. If a list, will be converted to Ring.
         holes : list of Ring or list of coordinate lists, optional
             List of hole rings. Each hole will be converted to Ring if needed.
+        index : TGIndex or "auto", optional
+            Index for every ring of this polygon. None uses the global default.
+        index_spread : int, optional
+            Index spread (2..4096) for every ring. None uses the global default.
         """
+        # Rings built here are re-indexed by Poly, so skip indexing them twice.
+        ring_index = None
+        if index is not None or index_spread is not None:
+            ring_index = TGIndex.NONE
+
         # Convert exterior to Ring if needed
         if not isinstance(exterior, Ring):
-            exterior = Ring(exterior)
+            exterior = Ring(exterior, index=ring_index)
 
         # Convert holes to Ring objects if needed
         if holes:
-            holes = [Ring(h) if not isinstance(h, Ring) else h for h in holes]
+            holes = [
+                Ring(h, index=ring_index) if not isinstance(h, Ring) else h
+                for h in holes
+            ]
 
         # Call parent Poly.__init__
-        super().__init__(exterior, holes)
+        super().__init__(exterior, holes, index=index, index_spread=index_spread)
 
     @classmethod
     def from_bounds(cls, minx, miny, maxx, maxy):
@@ -4366,13 +5808,268 @@ BaseGeometry = (
 )
 
 
-def unary_union(geoms) -> Geometry:
+# --- Partitioned (parallel) unary union ---
+
+cdef struct _HilbertItem:
+    uint64_t key
+    Py_ssize_t index
+
+
+cdef uint64_t _hilbert_key(uint32_t x, uint32_t y) noexcept nogil:
+    """Distance of cell (x, y) along the Hilbert curve of a 65536 x 65536 grid."""
+    cdef uint64_t d = 0
+    cdef uint32_t s = 32768
+    cdef uint32_t rx, ry, t
+    while s > 0:
+        rx = 1 if (x & s) != 0 else 0
+        ry = 1 if (y & s) != 0 else 0
+        d += (<uint64_t>s) * s * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x = 65535 - x
+                y = 65535 - y
+            t = x
+            x = y
+            y = t
+        s >>= 1
+    return d
+
+
+cdef inline uint32_t _hilbert_cell(double v) noexcept nogil:
+    """Grid cell of a coordinate normalized to [0, 1] (non-finite maps to 0)."""
+    if not isfinite(v) or v <= 0.0:
+        return 0
+    if v >= 1.0:
+        return 65535
+    return <uint32_t>(v * 65535.0)
+
+
+cdef int _cmp_hilbert_item(const void *a, const void *b) noexcept nogil:
+    cdef const _HilbertItem *ia = <const _HilbertItem *>a
+    cdef const _HilbertItem *ib = <const _HilbertItem *>b
+    if ia.key != ib.key:
+        return -1 if ia.key < ib.key else 1
+    if ia.index != ib.index:
+        return -1 if ia.index < ib.index else 1
+    return 0
+
+
+cdef void _hilbert_sort(const tg_geom **geoms, Py_ssize_t n, const tg_geom **out) noexcept nogil:
+    """Write geoms to out ordered by the Hilbert key of their envelope centers.
+
+    Falls back to the input order if the scratch buffer cannot be allocated.
+    """
+    cdef _HilbertItem *items = <_HilbertItem *>malloc(
+        (<size_t>(n if n > 0 else 1)) * sizeof(_HilbertItem)
+    )
+    cdef Py_ssize_t i
+    cdef tg_rect r
+    cdef tg_rect total = tg_geom_rect(geoms[0])
+    cdef double w, h, cx, cy
+    if items == NULL:
+        for i in range(n):
+            out[i] = geoms[i]
+        return
+    for i in range(1, n):
+        total = tg_rect_expand(total, tg_geom_rect(geoms[i]))
+    w = total.max.x - total.min.x
+    h = total.max.y - total.min.y
+    if w <= 0:
+        w = 1.0
+    if h <= 0:
+        h = 1.0
+    for i in range(n):
+        r = tg_geom_rect(geoms[i])
+        cx = ((r.min.x + r.max.x) / 2.0 - total.min.x) / w
+        cy = ((r.min.y + r.max.y) / 2.0 - total.min.y) / h
+        items[i].key = _hilbert_key(_hilbert_cell(cx), _hilbert_cell(cy))
+        items[i].index = i
+    qsort(items, <size_t>n, sizeof(_HilbertItem), _cmp_hilbert_item)
+    for i in range(n):
+        out[i] = geoms[items[i].index]
+    free(items)
+
+
+cdef tg_geom *_geos_union_ptrs(
+    GEOSContextHandle_t ctx, const tg_geom **geoms, int n, int *stage
+) noexcept nogil:
+    """Union n TG geometries with GEOS and convert the result back to TG.
+
+    On failure returns NULL and sets stage: 1 collection, 2 TG->GEOS, 3 union,
+    4 GEOS->TG.
+    """
+    cdef tg_geom *gc = tg_geom_new_geometrycollection(geoms, n)
+    cdef GEOSGeometry *g
+    cdef GEOSGeometry *u
+    cdef GEOSGeometry *nxt
+    cdef GEOSGeometry *tmp
+    cdef tg_geom *out
+    cdef int i
+    if gc == NULL:
+        stage[0] = 1
+        return NULL
+    g = tg_geom_to_geos(ctx, gc)
+    tg_geom_free(gc)
+    if g != NULL:
+        u = GEOSUnaryUnion_r(ctx, g)
+        GEOSGeom_destroy_r(ctx, g)
+    else:
+        # Same fallback as Geometry.unary_union: pairwise unions of the members.
+        u = NULL
+        for i in range(n):
+            nxt = tg_geom_to_geos(ctx, geoms[i])
+            if nxt == NULL:
+                if u != NULL:
+                    GEOSGeom_destroy_r(ctx, u)
+                stage[0] = 2
+                return NULL
+            if u == NULL:
+                u = nxt
+                continue
+            tmp = GEOSUnion_r(ctx, u, nxt)
+            GEOSGeom_destroy_r(ctx, nxt)
+            GEOSGeom_destroy_r(ctx, u)
+            if tmp == NULL:
+                stage[0] = 3
+                return NULL
+            u = tmp
+    if u == NULL:
+        stage[0] = 3
+        return NULL
+    out = tg_geom_from_geos(ctx, u)
+    GEOSGeom_destroy_r(ctx, u)
+    if out == NULL:
+        stage[0] = 4
+    return out
+
+
+cdef int _union_batches(
+    const tg_geom **src, const Py_ssize_t *offsets, Py_ssize_t nbatches,
+    tg_geom **out, int threads
+) except -1:
+    """Union src[offsets[k]:offsets[k + 1]] into out[k] for every batch k.
+
+    Batches are spread over ``threads`` workers, each with its own GEOS
+    context. ``out`` must be zeroed; on error every result is freed.
+    """
+    cdef Py_ssize_t k
+    cdef int stage = 0
+    cdef int *stages = <int *>calloc(<size_t>(nbatches if nbatches > 0 else 1), sizeof(int))
+    if stages == NULL:
+        raise MemoryError("Failed to allocate unary_union work buffers")
+
+    def work(Py_ssize_t start, Py_ssize_t stop):
+        cdef Py_ssize_t j
+        cdef GEOSContextHandle_t ctx = GEOS_init_r()
+        if ctx == NULL:
+            raise RuntimeError("Failed to initialize GEOS context")
+        with nogil:
+            for j in range(start, stop):
+                out[j] = _geos_union_ptrs(
+                    ctx, src + offsets[j], <int>(offsets[j + 1] - offsets[j]), &stages[j]
+                )
+        GEOS_finish_r(ctx)
+
+    try:
+        _run_chunked(nbatches, threads, work)
+        for k in range(nbatches):
+            stage = stages[k]
+            if stage == 1:
+                raise MemoryError("Failed to create GeometryCollection for unary_union")
+            if stage == 2:
+                raise RuntimeError("Failed to convert TG geometry to GEOS in unary_union")
+            if stage == 3:
+                raise RuntimeError("GEOSUnaryUnion failed")
+            if stage == 4:
+                raise RuntimeError("Failed to convert GEOS geometry to TG")
+            if tg_geom_error(out[k]) != NULL:
+                err_msg = tg_geom_error(out[k]).decode("utf-8")
+                raise RuntimeError(f"unary_union: TGX conversion error: {err_msg}")
+    except BaseException:
+        for k in range(nbatches):
+            if out[k] != NULL:
+                tg_geom_free(out[k])
+                out[k] = NULL
+        raise
+    finally:
+        free(stages)
+    return 0
+
+
+cdef object _partitioned_unary_union(list geoms, int threads, Py_ssize_t group_size):
+    cdef list coerced = []
+    cdef Geometry g
+    for obj in geoms:
+        g = _coerce_geometry_or_raise(obj, "geoms", allow_point_tuple=True)
+        if g.geom == NULL:
+            raise ValueError("geoms contains an uninitialized geometry")
+        if tg_geom_dims(g.geom) > 2:
+            g = force_2d(g)
+        coerced.append(g)
+    cdef Py_ssize_t n = len(coerced)
+    cdef Py_ssize_t ngroups = (n + group_size - 1) // group_size
+    cdef Py_ssize_t count, nbatches, k
+    cdef const tg_geom **ptrs = _geom_ptr_array(coerced)
+    cdef const tg_geom **ordered = <const tg_geom **>malloc(<size_t>n * sizeof(tg_geom *))
+    cdef Py_ssize_t *offsets = <Py_ssize_t *>malloc(<size_t>(ngroups + 1) * sizeof(Py_ssize_t))
+    cdef tg_geom **level = <tg_geom **>calloc(<size_t>ngroups, sizeof(tg_geom *))
+    cdef tg_geom **merged = <tg_geom **>calloc(<size_t>ngroups, sizeof(tg_geom *))
+    cdef tg_geom **swap
+    cdef tg_geom *result
+    try:
+        if ordered == NULL or offsets == NULL or level == NULL or merged == NULL:
+            raise MemoryError("Failed to allocate unary_union work buffers")
+        with nogil:
+            _hilbert_sort(ptrs, n, ordered)
+        # Phase 1: union spatially coherent groups in parallel.
+        for k in range(ngroups):
+            offsets[k] = k * group_size
+        offsets[ngroups] = n
+        _union_batches(ordered, offsets, ngroups, level, threads)
+        # Phase 2: balanced pairwise merge; an odd tail joins the last pair.
+        count = ngroups
+        while count > 1:
+            nbatches = count // 2
+            for k in range(nbatches):
+                offsets[k] = 2 * k
+            offsets[nbatches] = count
+            _union_batches(<const tg_geom **>level, offsets, nbatches, merged, threads)
+            for k in range(count):
+                tg_geom_free(level[k])
+                level[k] = NULL
+            swap = level
+            level = merged
+            merged = swap
+            count = nbatches
+        result = level[0]
+        level[0] = NULL
+    finally:
+        if level != NULL:
+            for k in range(ngroups):
+                if level[k] != NULL:
+                    tg_geom_free(level[k])
+        free(level)
+        free(merged)
+        free(offsets)
+        free(ordered)
+        free(ptrs)
+    return _geometry_from_ptr_concrete(result)
+
+
+def unary_union(geoms, threads=1, group_size: int = 256) -> Geometry:
     """Return the unary union of a sequence of geometries using GEOS (Shapely-compatible).
 
     Parameters:
     -----------
     geoms : sequence of Geometry, Point, Line, Ring, Poly, Polygon, or other geometry types
         The geometries to union together
+    threads : int or None
+        Worker threads (default: 1; None uses one per CPU). With more than one
+        thread the inputs are sorted along a Hilbert curve of their envelopes,
+        unioned in groups of ``group_size`` in parallel with the GIL released,
+        and the partial results are merged in a balanced tree.
+    group_size : int
+        Number of geometries per group for the parallel path (default: 256)
 
     Returns:
     --------
@@ -4382,13 +6079,19 @@ def unary_union(geoms) -> Geometry:
     Raises:
     -------
     ValueError
-        If geoms is empty
+        If geoms is empty, or threads/group_size are invalid
     RuntimeError
         If the union operation fails
     """
+    _count_entry("unary_union")
     if not isinstance(geoms, list):
         geoms = list(geoms)
-    return Geometry.unary_union(geoms)
+    cdef int nthreads = _resolve_threads(threads)
+    if group_size < 2 or group_size > INT_MAX:
+        raise ValueError("group_size must be between 2 and INT_MAX")
+    if nthreads == 1 or len(geoms) <= group_size:
+        return Geometry.unary_union(geoms)
+    return _partitioned_unary_union(geoms, nthreads, group_size)
 
 
 def shape(obj):
@@ -4442,18 +6145,34 @@ def box(minx, miny, maxx, maxy, ccw=True) -> Polygon:
 
 
 # Shapely-compatible module-level functions
-def from_wkt(wkt_string: str) -> Geometry:
-    """Create a Geometry from a WKT string (Shapely-compatible)"""
+def from_wkt(wkt_string: str, index=None, index_spread=None) -> Geometry:
+    """Create a Geometry from a WKT string (Shapely-compatible)
+
+    ``index`` (a TGIndex or ``"auto"``) and ``index_spread`` select the
+    polygon/line index for this geometry instead of the global default.
+    """
+    if index is not None or index_spread is not None:
+        return _parse_indexed(0, wkt_string.encode("utf-8"), index, index_spread)
     return _materialize_concrete_geometry(Geometry(wkt_string, fmt="wkt"))
 
 
-def from_geojson(geojson_string: str) -> Geometry:
-    """Create a Geometry from a GeoJSON string (Shapely-compatible)"""
+def from_geojson(geojson_string: str, index=None, index_spread=None) -> Geometry:
+    """Create a Geometry from a GeoJSON string (Shapely-compatible)
+
+    ``index`` (a TGIndex or ``"auto"``) and ``index_spread`` select the
+    polygon/line index for this geometry instead of the global default.
+    """
+    if index is not None or index_spread is not None:
+        return _parse_indexed(1, geojson_string.encode("utf-8"), index, index_spread)
     return _materialize_concrete_geometry(Geometry(geojson_string, fmt="geojson"))
 
 
-def from_wkb(wkb_bytes: bytes) -> Geometry:
-    """Create a Geometry from WKB bytes (Shapely-compatible)"""
+def from_wkb(wkb_bytes: bytes, index=None, index_spread=None) -> Geometry:
+    """Create a Geometry from WKB bytes (Shapely-compatible)
+
+    ``index`` (a TGIndex or ``"auto"``) and ``index_spread`` select the
+    polygon/line index for this geometry instead of the global default.
+    """
     cdef tg_geom *g
     cdef size_t wkb_len = len(wkb_bytes)
     cdef const unsigned char *wkb_ptr
@@ -4462,6 +6181,8 @@ def from_wkb(wkb_bytes: bytes) -> Geometry:
 
     if wkb_len == 0:
         raise ValueError("ParseError: empty WKB")
+    if index is not None or index_spread is not None:
+        return _parse_indexed(2, wkb_view, index, index_spread)
 
     wkb_ptr = &wkb_view[0]
     g = tg_parse_wkb(wkb_ptr, wkb_len)
@@ -4540,6 +6261,7 @@ def transform(func, geometry) -> Geometry:
     >>> point = Point(0, 0)
     >>> transformed = transform(translate, point)
     """
+    _count_entry("transform")
     # Convert to Geometry if needed
     if hasattr(geometry, "as_geometry"):
         geom = geometry.as_geometry()
@@ -5117,6 +6839,4987 @@ def convex_hull(geom):
     return g.convex_hull
 
 
+# --- Geodesic measurements on lon/lat (EPSG:4326) coordinates ---
+
+# WGS84 ellipsoid parameters
+cdef double _WGS84_A = 6378137.0
+cdef double _WGS84_F = 1.0 / 298.257223563
+cdef double _WGS84_B = 6378137.0 * (1.0 - 1.0 / 298.257223563)
+# IUGG mean radius (haversine) and WGS84 authalic radius (spherical area)
+cdef double _EARTH_MEAN_RADIUS = 6371008.8
+cdef double _EARTH_AUTHALIC_RADIUS = 6371007.1809
+cdef double _DEG2RAD = M_PI / 180.0
+
+cdef enum _GeodesicMethod:
+    _GEODESIC_HAVERSINE = 0
+    _GEODESIC_VINCENTY = 1
+
+
+cdef int _geodesic_method(str method) except -1:
+    if method == "vincenty":
+        return _GEODESIC_VINCENTY
+    if method == "haversine":
+        return _GEODESIC_HAVERSINE
+    raise ValueError("method must be 'vincenty' or 'haversine'")
+
+
+cdef double _haversine(double lon1, double lat1, double lon2, double lat2) noexcept nogil:
+    cdef double dlat = (lat2 - lat1) * _DEG2RAD
+    cdef double dlon = (lon2 - lon1) * _DEG2RAD
+    cdef double s1 = sin(dlat * 0.5)
+    cdef double s2 = sin(dlon * 0.5)
+    cdef double h = s1 * s1 + cos(lat1 * _DEG2RAD) * cos(lat2 * _DEG2RAD) * s2 * s2
+    if h > 1.0:
+        h = 1.0
+    return 2.0 * _EARTH_MEAN_RADIUS * atan2(sqrt(h), sqrt(1.0 - h))
+
+
+cdef double _vincenty(double lon1, double lat1, double lon2, double lat2) noexcept nogil:
+    """Vincenty inverse distance on the WGS84 ellipsoid.
+
+    Falls back to the haversine distance for nearly antipodal points where the
+    iteration does not converge.
+    """
+    cdef double L = (lon2 - lon1) * _DEG2RAD
+    cdef double U1 = atan((1.0 - _WGS84_F) * tan(lat1 * _DEG2RAD))
+    cdef double U2 = atan((1.0 - _WGS84_F) * tan(lat2 * _DEG2RAD))
+    cdef double sin_u1 = sin(U1), cos_u1 = cos(U1)
+    cdef double sin_u2 = sin(U2), cos_u2 = cos(U2)
+    cdef double lam = L, lam_prev
+    cdef double sin_lam, cos_lam, sin_sigma, cos_sigma, sigma
+    cdef double sin_alpha, cos_sq_alpha, cos_2sigma_m, c
+    cdef double u_sq, big_a, big_b, delta_sigma
+    cdef int _it
+    for _it in range(200):
+        sin_lam = sin(lam)
+        cos_lam = cos(lam)
+        sin_sigma = sqrt(
+            (cos_u2 * sin_lam) * (cos_u2 * sin_lam)
+            + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            * (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+        )
+        if sin_sigma == 0.0:
+            return 0.0
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+        sigma = atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lam / sin_sigma
+        cos_sq_alpha = 1.0 - sin_alpha * sin_alpha
+        if cos_sq_alpha != 0.0:
+            cos_2sigma_m = cos_sigma - 2.0 * sin_u1 * sin_u2 / cos_sq_alpha
+        else:
+            cos_2sigma_m = 0.0  # equatorial line
+        c = _WGS84_F / 16.0 * cos_sq_alpha * (4.0 + _WGS84_F * (4.0 - 3.0 * cos_sq_alpha))
+        lam_prev = lam
+        lam = L + (1.0 - c) * _WGS84_F * sin_alpha * (
+            sigma + c * sin_sigma * (
+                cos_2sigma_m + c * cos_sigma * (-1.0 + 2.0 * cos_2sigma_m * cos_2sigma_m)
+            )
+        )
+        if fabs(lam - lam_prev) < 1e-12:
+            break
+    else:
+        return _haversine(lon1, lat1, lon2, lat2)
+    u_sq = cos_sq_alpha * (_WGS84_A * _WGS84_A - _WGS84_B * _WGS84_B) / (_WGS84_B * _WGS84_B)
+    big_a = 1.0 + u_sq / 16384.0 * (4096.0 + u_sq * (-768.0 + u_sq * (320.0 - 175.0 * u_sq)))
+    big_b = u_sq / 1024.0 * (256.0 + u_sq * (-128.0 + u_sq * (74.0 - 47.0 * u_sq)))
+    delta_sigma = big_b * sin_sigma * (
+        cos_2sigma_m + big_b / 4.0 * (
+            cos_sigma * (-1.0 + 2.0 * cos_2sigma_m * cos_2sigma_m)
+            - big_b / 6.0 * cos_2sigma_m * (-3.0 + 4.0 * sin_sigma * sin_sigma)
+            * (-3.0 + 4.0 * cos_2sigma_m * cos_2sigma_m)
+        )
+    )
+    return _WGS84_B * big_a * (sigma - delta_sigma)
+
+
+cdef inline double _geodesic_segment(
+    tg_point a, tg_point b, int method
+) noexcept nogil:
+    if method == _GEODESIC_VINCENTY:
+        return _vincenty(a.x, a.y, b.x, b.y)
+    return _haversine(a.x, a.y, b.x, b.y)
+
+
+cdef double _geodesic_path_length(const tg_point *pts, int n, int method) noexcept nogil:
+    cdef double total = 0.0
+    cdef int i
+    for i in range(n - 1):
+        total += _geodesic_segment(pts[i], pts[i + 1], method)
+    return total
+
+
+cdef double _geodesic_ring_area(const tg_ring *ring) noexcept nogil:
+    """Unsigned spherical area of a lon/lat ring (authalic sphere)."""
+    cdef int n = tg_ring_num_points(ring)
+    cdef const tg_point *pts = tg_ring_points(ring)
+    cdef double total = 0.0
+    cdef int i, j
+    if n < 3:
+        return 0.0
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        total += (pts[j].x - pts[i].x) * _DEG2RAD * (
+            2.0 + sin(pts[i].y * _DEG2RAD) + sin(pts[j].y * _DEG2RAD)
+        )
+    return fabs(total * _EARTH_AUTHALIC_RADIUS * _EARTH_AUTHALIC_RADIUS / 2.0)
+
+
+cdef double _geodesic_poly_area(const tg_poly *poly) noexcept nogil:
+    cdef double area = _geodesic_ring_area(tg_poly_exterior(poly))
+    cdef int i
+    for i in range(tg_poly_num_holes(poly)):
+        area -= _geodesic_ring_area(tg_poly_hole_at(poly, i))
+    return area if area > 0.0 else 0.0
+
+
+cdef double _geodesic_geom_length(const tg_geom *geom, int method) noexcept nogil:
+    cdef int t = tg_geom_typeof(geom)
+    cdef int i, n
+    cdef const tg_line *ln
+    cdef const tg_ring *ring
+    cdef double total = 0.0
+    if t == 2:
+        ln = tg_geom_line(geom)
+        return _geodesic_path_length(tg_line_points(ln), tg_line_num_points(ln), method)
+    if t == 3:
+        ring = tg_poly_exterior(tg_geom_poly(geom))
+        return _geodesic_path_length(tg_ring_points(ring), tg_ring_num_points(ring), method)
+    if t == 5:
+        n = tg_geom_num_lines(geom)
+        for i in range(n):
+            ln = tg_geom_line_at(geom, i)
+            total += _geodesic_path_length(tg_line_points(ln), tg_line_num_points(ln), method)
+        return total
+    if t == 6:
+        n = tg_geom_num_polys(geom)
+        for i in range(n):
+            ring = tg_poly_exterior(tg_geom_poly_at(geom, i))
+            total += _geodesic_path_length(
+                tg_ring_points(ring), tg_ring_num_points(ring), method
+            )
+        return total
+    if t == 7:
+        n = tg_geom_num_geometries(geom)
+        for i in range(n):
+            total += _geodesic_geom_length(tg_geom_geometry_at(geom, i), method)
+        return total
+    return 0.0
+
+
+cdef double _geodesic_geom_area(const tg_geom *geom) noexcept nogil:
+    cdef int t = tg_geom_typeof(geom)
+    cdef int i, n
+    cdef double total = 0.0
+    if t == 3:
+        return _geodesic_poly_area(tg_geom_poly(geom))
+    if t == 6:
+        n = tg_geom_num_polys(geom)
+        for i in range(n):
+            total += _geodesic_poly_area(tg_geom_poly_at(geom, i))
+        return total
+    if t == 7:
+        n = tg_geom_num_geometries(geom)
+        for i in range(n):
+            total += _geodesic_geom_area(tg_geom_geometry_at(geom, i))
+        return total
+    return 0.0
+
+
+def geodesic_distance(a, b, method: str = "vincenty") -> float:
+    """
+    Return the distance in meters between two lon/lat points.
+
+    Parameters:
+    -----------
+    a, b : Point, (lon, lat) tuple, or Point geometry
+        The two locations, in degrees (EPSG:4326 axis order: x=lon, y=lat)
+    method : str
+        "vincenty" (default) for the WGS84 ellipsoid, or "haversine" for
+        the faster spherical approximation (mean Earth radius)
+
+    Returns:
+    --------
+    float
+        Distance in meters
+    """
+    cdef int m = _geodesic_method(method)
+    cdef tg_point pa, pb
+    pa.x, pa.y = _coerce_xy(a, "a")
+    pb.x, pb.y = _coerce_xy(b, "b")
+    return _geodesic_segment(pa, pb, m)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def geodesic_distances(a, b, method: str = "vincenty"):
+    """
+    Vectorized geodesic distance between paired lon/lat coordinates.
+
+    Parameters:
+    -----------
+    a, b : buffer of float64 with shape (N, 2)
+        Contiguous coordinate arrays (e.g. NumPy arrays) of (lon, lat) rows
+    method : str
+        "vincenty" (default) or "haversine"
+
+    Returns:
+    --------
+    array.array
+        N distances in meters (typecode "d", usable via ``numpy.asarray``)
+    """
+    cdef int m = _geodesic_method(method)
+    cdef const double[:, ::1] va = a
+    cdef const double[:, ::1] vb = b
+    cdef Py_ssize_t n = va.shape[0]
+    cdef Py_ssize_t i
+    if va.shape[1] != 2 or vb.shape[1] != 2:
+        raise ValueError("coordinate arrays must have shape (N, 2)")
+    if vb.shape[0] != n:
+        raise ValueError("coordinate arrays must have the same length")
+    cdef array.array out = _new_double_array(n)
+    cdef double *dst = out.data.as_doubles
+    cdef tg_point pa, pb
+    with nogil:
+        for i in range(n):
+            pa.x = va[i, 0]
+            pa.y = va[i, 1]
+            pb.x = vb[i, 0]
+            pb.y = vb[i, 1]
+            dst[i] = _geodesic_segment(pa, pb, m)
+    return out
+
+
+def geodesic_length(geom, method: str = "vincenty") -> float:
+    """
+    Return the geodesic length in meters of a lon/lat geometry.
+
+    LineStrings are measured along their vertices, polygons along their
+    exterior ring (matching ``Geometry.length``); multi-geometries and
+    collections are summed. Points have zero length.
+    """
+    cdef int m = _geodesic_method(method)
+    cdef Geometry g = _coerce_geometry_or_raise(geom, "geom")
+    g._ensure_initialized("this")
+    cdef double result
+    with nogil:
+        result = _geodesic_geom_length(g.geom, m)
+    return result
+
+
+def geodesic_area(geom) -> float:
+    """
+    Return the geodesic area in square meters of a lon/lat geometry.
+
+    The area is computed on the WGS84 authalic sphere with holes subtracted;
+    multi-polygons and collections are summed. Rings crossing the
+    antimeridian are not supported.
+    """
+    cdef Geometry g = _coerce_geometry_or_raise(geom, "geom")
+    g._ensure_initialized("this")
+    cdef double result
+    with nogil:
+        result = _geodesic_geom_area(g.geom)
+    return result
+
+
+def geodesic_lengths(geoms, method: str = "vincenty"):
+    """Vectorized ``geodesic_length`` over a sequence of geometries (array of meters)."""
+    cdef int m = _geodesic_method(method)
+    cdef list coerced = _coerce_geometry_list(geoms, "geoms")
+    cdef Py_ssize_t n = len(coerced)
+    cdef Py_ssize_t i
+    cdef array.array out = _new_double_array(n)
+    cdef double *dst = out.data.as_doubles
+    cdef const tg_geom **ptrs = _geom_ptr_array(coerced)
+    with nogil:
+        for i in range(n):
+            dst[i] = _geodesic_geom_length(ptrs[i], m)
+    free(ptrs)
+    return out
+
+
+def geodesic_areas(geoms):
+    """Vectorized ``geodesic_area`` over a sequence of geometries (array of square meters)."""
+    cdef list coerced = _coerce_geometry_list(geoms, "geoms")
+    cdef Py_ssize_t n = len(coerced)
+    cdef Py_ssize_t i
+    cdef array.array out = _new_double_array(n)
+    cdef double *dst = out.data.as_doubles
+    cdef const tg_geom **ptrs = _geom_ptr_array(coerced)
+    with nogil:
+        for i in range(n):
+            dst[i] = _geodesic_geom_area(ptrs[i])
+    free(ptrs)
+    return out
+
+
+# --- Batch meters-grid projection ---
+
+cdef tg_geom *_meters_grid_convert(
+    const tg_geom *geom, tg_point origin, bint inverse
+) noexcept nogil:
+    if tg_geom_is_empty(geom) != 0:
+        return tg_geom_clone(geom)
+    if inverse:
+        return tg_geom_from_meters_grid(geom, origin)
+    return tg_geom_to_meters_grid(geom, origin)
+
+
+cdef list _wrap_geom_results(tg_geom **results, Py_ssize_t n, str label):
+    """Wrap owned tg_geom results, freeing all of them if any failed."""
+    cdef Py_ssize_t i
+    cdef const char *err
+    cdef str msg = None
+    for i in range(n):
+        if results[i] == NULL:
+            msg = f"{label} failed for geometry {i}"
+            break
+        err = tg_geom_error(results[i])
+        if err != NULL:
+            msg = f"{label} error for geometry {i}: {err.decode('utf-8')}"
+            break
+    if msg is not None:
+        for i in range(n):
+            if results[i] != NULL:
+                tg_geom_free(results[i])
+        raise ValueError(msg)
+    out = []
+    for i in range(n):
+        out.append(_geometry_from_ptr_concrete(results[i]))
+        results[i] = NULL
+    return out
+
+
+cdef list _meters_grid_many(object geoms, object origin, object threads, bint inverse):
+    cdef list coerced = _coerce_geometry_list(geoms, "geoms")
+    cdef Py_ssize_t n = len(coerced)
+    cdef int nthreads = _resolve_threads(threads)
+    cdef tg_point c_origin
+    c_origin.x, c_origin.y = _coerce_xy(origin, "origin")
+    cdef const tg_geom **ptrs = _geom_ptr_array(coerced)
+    cdef tg_geom **results = <tg_geom **>malloc((<size_t>(n if n > 0 else 1)) * sizeof(tg_geom *))
+    if results == NULL:
+        free(ptrs)
+        raise MemoryError("Failed to allocate meters grid results")
+
+    def work(Py_ssize_t start, Py_ssize_t stop):
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(start, stop):
+                results[i] = _meters_grid_convert(ptrs[i], c_origin, inverse)
+
+    try:
+        _run_chunked(n, nthreads, work)
+        return _wrap_geom_results(
+            results, n, "tgx from meters grid conversion" if inverse
+            else "tgx meters grid conversion"
+        )
+    finally:
+        free(results)
+        free(ptrs)
+
+
+def to_meters_grid_many(geoms, origin, threads=1) -> list:
+    """
+    Project many lon/lat geometries onto the meters grid around one origin.
+
+    Batch form of ``Geometry.to_meters_grid``: the tgx conversion runs in a
+    GIL-free loop, optionally split across ``threads`` worker threads
+    (``None`` uses one per CPU).
+
+    Parameters:
+    -----------
+    geoms : sequence of Geometry, Point, Line, Ring, Poly, or other geometry types
+        The geometries to project
+    origin : Point or (x, y)
+        The shared grid origin
+    threads : int or None
+        Number of worker threads (default: 1)
+
+    Returns:
+    --------
+    list
+        Projected geometries, in input order
+    """
+    return _meters_grid_many(geoms, origin, threads, False)
+
+
+def from_meters_grid_many(geoms, origin, threads=1) -> list:
+    """Batch form of ``Geometry.from_meters_grid``; see ``to_meters_grid_many``."""
+    return _meters_grid_many(geoms, origin, threads, True)
+
+
+cdef tg_geom *_buffer_meters_kernel(
+    GEOSContextHandle_t ctx, const tg_geom *geom, tg_point origin, double distance,
+    int quad_segs, int cap_style, int join_style, double mitre_limit, int *stage
+) noexcept nogil:
+    """Project, buffer and unproject geom; on failure stage reports the failing step."""
+    cdef tg_geom *projected
+    cdef tg_geom *buffered
+    cdef tg_geom *result
+    cdef GEOSGeometry *g_geos
+    cdef GEOSGeometry *g_buffered
+    stage[0] = 1
+    projected = tg_geom_to_meters_grid(geom, origin)
+    if projected == NULL or tg_geom_error(projected) != NULL:
+        if projected != NULL:
+            tg_geom_free(projected)
+        return NULL
+    stage[0] = 2
+    g_geos = tg_geom_to_geos(ctx, projected)
+    tg_geom_free(projected)
+    if g_geos == NULL:
+        return NULL
+    stage[0] = 3
+    g_buffered = GEOSBufferWithStyle_r(
+        ctx, g_geos, distance, quad_segs, cap_style, join_style, mitre_limit
+    )
+    GEOSGeom_destroy_r(ctx, g_geos)
+    if g_buffered == NULL:
+        return NULL
+    stage[0] = 4
+    buffered = tg_geom_from_geos(ctx, g_buffered)
+    GEOSGeom_destroy_r(ctx, g_buffered)
+    if buffered == NULL or tg_geom_error(buffered) != NULL:
+        if buffered != NULL:
+            tg_geom_free(buffered)
+        return NULL
+    if tg_geom_is_empty(buffered) != 0:
+        stage[0] = 0
+        return buffered
+    stage[0] = 5
+    result = tg_geom_from_meters_grid(buffered, origin)
+    tg_geom_free(buffered)
+    if result == NULL or tg_geom_error(result) != NULL:
+        if result != NULL:
+            tg_geom_free(result)
+        return NULL
+    stage[0] = 0
+    return result
+
+
+def buffer_meters(geom, distance_m: float, origin=None, quad_segs: int = 16,
+                  cap_style: int = 1, join_style: int = 1,
+                  mitre_limit: float = 5.0) -> Geometry:
+    """
+    Buffer a lon/lat geometry by a distance in meters.
+
+    The geometry is projected onto the tgx meters grid, buffered with GEOS
+    and projected back in a single native call with the GIL released.
+
+    Parameters:
+    -----------
+    geom : Geometry, Point, Line, Ring, Poly, or other geometry type
+        The lon/lat geometry to buffer
+    distance_m : float
+        The buffer distance in meters
+    origin : Point or (x, y), optional
+        Meters grid origin; defaults to the center of the geometry bounds
+    quad_segs, cap_style, join_style, mitre_limit :
+        Same as ``Geometry.buffer``
+
+    Returns:
+    --------
+    Geometry
+        The buffered geometry in lon/lat
+    """
+    cdef Geometry g = _coerce_geometry_or_raise(geom, "geom")
+    g._ensure_initialized("this")
+    if not (0 < cap_style < 4):
+        raise ValueError("cap_style must be 1 (round), 2 (flat), or 3 (square)")
+    if not (0 < join_style < 4):
+        raise ValueError("join_style must be 1 (round), 2 (flat), or 3 (bevel)")
+    if quad_segs < 1:
+        raise ValueError("quad_segs must be >= 1")
+    if not mitre_limit > 0.0:
+        raise ValueError("mitre_limit must be > 0.0")
+    if distance_m == 0 or tg_geom_is_empty(g.geom) != 0:
+        return g.buffer(distance_m, quad_segs, cap_style, join_style, mitre_limit)
+
+    cdef tg_point c_origin
+    if origin is None:
+        c_origin = tg_rect_center(tg_geom_rect(g.geom))
+    else:
+        c_origin.x, c_origin.y = _coerce_xy(origin, "origin")
+    cdef double c_distance = distance_m
+    cdef int c_quad_segs = quad_segs
+    cdef int c_cap_style = cap_style
+    cdef int c_join_style = join_style
+    cdef double c_mitre_limit = mitre_limit
+    cdef int stage = 0
+    cdef tg_geom *result
+
+    cdef GEOSContextHandle_t ctx = GEOS_init_r()
+    if ctx == NULL:
+        raise RuntimeError("Failed to initialize GEOS context")
+    with nogil:
+        result = _buffer_meters_kernel(
+            ctx, g.geom, c_origin, c_distance, c_quad_segs, c_cap_style,
+            c_join_style, c_mitre_limit, &stage
+        )
+    GEOS_finish_r(ctx)
+    if result == NULL:
+        if stage == 1:
+            raise ValueError("tgx meters grid conversion failed")
+        if stage == 2:
+            raise RuntimeError("Failed to convert TG geometry to GEOS")
+        if stage == 3:
+            raise RuntimeError(f"GEOSBuffer failed with distance {distance_m}")
+        if stage == 4:
+            raise RuntimeError("Failed to convert GEOS geometry to TG")
+        raise ValueError("tgx from meters grid conversion failed")
+    return _geometry_from_ptr_concrete(result)
+
+
+# --- Native coordinate rewriting (projection kernels) ---
+
+ctypedef void (*_coord_kernel)(tg_point *pts, int n, const double *params) noexcept nogil
+
+
+cdef tg_point *_mapped_points(
+    const tg_point *src, int n, _coord_kernel kernel, const double *params
+) noexcept nogil:
+    cdef tg_point *buf = <tg_point *>malloc((<size_t>(n if n > 0 else 1)) * sizeof(tg_point))
+    cdef int i
+    if buf == NULL:
+        return NULL
+    for i in range(n):
+        buf[i] = src[i]
+    kernel(buf, n, params)
+    return buf
+
+
+cdef tg_ring *_map_ring(
+    const tg_ring *ring, _coord_kernel kernel, const double *params
+) noexcept nogil:
+    cdef int n = tg_ring_num_points(ring)
+    cdef tg_point *buf = _mapped_points(tg_ring_points(ring), n, kernel, params)
+    cdef tg_ring *out
+    if buf == NULL:
+        return NULL
+    out = tg_ring_new(buf, n)
+    free(buf)
+    return out
+
+
+cdef tg_line *_map_line(
+    const tg_line *line, _coord_kernel kernel, const double *params
+) noexcept nogil:
+    cdef int n = tg_line_num_points(line)
+    cdef tg_point *buf = _mapped_points(tg_line_points(line), n, kernel, params)
+    cdef tg_line *out
+    if buf == NULL:
+        return NULL
+    out = tg_line_new(buf, n)
+    free(buf)
+    return out
+
+
+cdef tg_poly *_map_poly(
+    const tg_poly *poly, _coord_kernel kernel, const double *params
+) noexcept nogil:
+    cdef int nholes = tg_poly_num_holes(poly)
+    cdef int i, made = 0
+    cdef tg_poly *out = NULL
+    cdef tg_ring *ext = _map_ring(tg_poly_exterior(poly), kernel, params)
+    cdef tg_ring **holes = NULL
+    if ext == NULL:
+        return NULL
+    if nholes > 0:
+        holes = <tg_ring **>malloc(<size_t>nholes * sizeof(tg_ring *))
+        if holes == NULL:
+            tg_ring_free(ext)
+            return NULL
+        for i in range(nholes):
+            holes[i] = _map_ring(tg_poly_hole_at(poly, i), kernel, params)
+            if holes[i] == NULL:
+                break
+            made += 1
+    if made == nholes:
+        out = tg_poly_new(ext, <const tg_ring * const *>holes, nholes)
+    for i in range(made):
+        tg_ring_free(holes[i])
+    free(holes)
+    tg_ring_free(ext)
+    return out
+
+
+cdef tg_geom *_map_geom(
+    const tg_geom *geom, _coord_kernel kernel, const double *params
+) noexcept nogil:
+    """Rebuild geom with every coordinate rewritten by kernel (2D output).
+
+    Returns NULL on allocation failure.
+    """
+    cdef int t = tg_geom_typeof(geom)
+    cdef int i, n, made = 0
+    cdef tg_point pt
+    cdef tg_point *pts
+    cdef tg_line *ln
+    cdef tg_poly *poly
+    cdef void **parts
+    cdef tg_geom *out = NULL
+    if tg_geom_is_empty(geom) != 0:
+        return tg_geom_clone(geom)
+    if t == 1:
+        pt = tg_geom_point(geom)
+        kernel(&pt, 1, params)
+        return tg_geom_new_point(pt)
+    if t == 2:
+        ln = _map_line(tg_geom_line(geom), kernel, params)
+        if ln == NULL:
+            return NULL
+        out = tg_geom_new_linestring(ln)
+        tg_line_free(ln)
+        return out
+    if t == 3:
+        poly = _map_poly(tg_geom_poly(geom), kernel, params)
+        if poly == NULL:
+            return NULL
+        out = tg_geom_new_polygon(poly)
+        tg_poly_free(poly)
+        return out
+    if t == 4:
+        n = tg_geom_num_points(geom)
+        pts = <tg_point *>malloc(<size_t>n * sizeof(tg_point))
+        if pts == NULL:
+            return NULL
+        for i in range(n):
+            pts[i] = tg_geom_point_at(geom, i)
+        kernel(pts, n, params)
+        out = tg_geom_new_multipoint(pts, n)
+        free(pts)
+        return out
+    if t == 5:
+        n = tg_geom_num_lines(geom)
+    elif t == 6:
+        n = tg_geom_num_polys(geom)
+    elif t == 7:
+        n = tg_geom_num_geometries(geom)
+    else:
+        return NULL
+    parts = <void **>malloc(<size_t>n * sizeof(void *))
+    if parts == NULL:
+        return NULL
+    for i in range(n):
+        if t == 5:
+            parts[i] = _map_line(tg_geom_line_at(geom, i), kernel, params)
+        elif t == 6:
+            parts[i] = _map_poly(tg_geom_poly_at(geom, i), kernel, params)
+        else:
+            parts[i] = _map_geom(tg_geom_geometry_at(geom, i), kernel, params)
+        if parts[i] == NULL:
+            break
+        made += 1
+    if made == n:
+        if t == 5:
+            out = tg_geom_new_multilinestring(<const tg_line * const *>parts, n)
+        elif t == 6:
+            out = tg_geom_new_multipolygon(<const tg_poly * const *>parts, n)
+        else:
+            out = tg_geom_new_geometrycollection(<const tg_geom * const *>parts, n)
+    for i in range(made):
+        if t == 5:
+            tg_line_free(<tg_line *>parts[i])
+        elif t == 6:
+            tg_poly_free(<tg_poly *>parts[i])
+        else:
+            tg_geom_free(<tg_geom *>parts[i])
+    free(parts)
+    return out
+
+
+cdef object _map_geometry(object geometry, _coord_kernel kernel, const double *params):
+    cdef Geometry g = _coerce_geometry_or_raise(geometry, "geometry")
+    g._ensure_initialized("this")
+    cdef tg_geom *out
+    with nogil:
+        out = _map_geom(g.geom, kernel, params)
+    if out == NULL:
+        raise MemoryError("Failed to rewrite geometry coordinates")
+    return _geometry_from_ptr_concrete(out)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _map_coords(object coords, _coord_kernel kernel, const double *params):
+    cdef const double[:, ::1] src = coords
+    cdef Py_ssize_t n = src.shape[0]
+    cdef Py_ssize_t i
+    if src.shape[1] != 2:
+        raise ValueError("coordinate array must have shape (N, 2)")
+    if n > INT_MAX:
+        raise OverflowError("coordinate array is too large")
+    cdef array.array out = _new_double_array(n * 2)
+    cdef double *dst = out.data.as_doubles
+    with nogil:
+        for i in range(n):
+            dst[2 * i] = src[i, 0]
+            dst[2 * i + 1] = src[i, 1]
+        kernel(<tg_point *>dst, <int>n, params)
+    return _double_rows(out, n, 2)
+
+
+# Web Mercator (EPSG:3857) sphere radius and latitude clamp
+cdef double _MERCATOR_RADIUS = 6378137.0
+cdef double _MERCATOR_MAX_LAT = 85.0511287798066
+
+
+cdef void _kernel_to_web_mercator(tg_point *pts, int n, const double *params) noexcept nogil:
+    cdef int i
+    cdef double lat
+    for i in range(n):
+        lat = pts[i].y
+        if lat > _MERCATOR_MAX_LAT:
+            lat = _MERCATOR_MAX_LAT
+        elif lat < -_MERCATOR_MAX_LAT:
+            lat = -_MERCATOR_MAX_LAT
+        pts[i].x = pts[i].x * _DEG2RAD * _MERCATOR_RADIUS
+        pts[i].y = log(tan(M_PI / 4.0 + lat * _DEG2RAD / 2.0)) * _MERCATOR_RADIUS
+
+
+cdef void _kernel_from_web_mercator(tg_point *pts, int n, const double *params) noexcept nogil:
+    cdef int i
+    for i in range(n):
+        pts[i].x = pts[i].x / _MERCATOR_RADIUS / _DEG2RAD
+        pts[i].y = (2.0 * atan(exp(pts[i].y / _MERCATOR_RADIUS)) - M_PI / 2.0) / _DEG2RAD
+
+
+cdef void _kernel_to_tile_pixels(tg_point *pts, int n, const double *params) noexcept nogil:
+    # params: world size in pixels, tile x offset, tile y offset (pixels)
+    cdef int i
+    cdef double lat, s
+    for i in range(n):
+        lat = pts[i].y
+        if lat > _MERCATOR_MAX_LAT:
+            lat = _MERCATOR_MAX_LAT
+        elif lat < -_MERCATOR_MAX_LAT:
+            lat = -_MERCATOR_MAX_LAT
+        s = sin(lat * _DEG2RAD)
+        pts[i].x = (pts[i].x + 180.0) / 360.0 * params[0] - params[1]
+        pts[i].y = (0.5 - log((1.0 + s) / (1.0 - s)) / (4.0 * M_PI)) * params[0] - params[2]
+
+
+cdef void _tile_params(double *params, int z, int x, int y, int extent) except *:
+    if z < 0 or z > 30:
+        raise ValueError("z must be between 0 and 30")
+    if extent < 1:
+        raise ValueError("extent must be >= 1")
+    params[0] = (<double>(1 << z)) * extent
+    params[1] = (<double>x) * extent
+    params[2] = (<double>y) * extent
+
+
+def to_web_mercator(geometry) -> Geometry:
+    """Project a lon/lat (EPSG:4326) geometry to Web Mercator (EPSG:3857) meters.
+
+    Latitudes are clamped to the Web Mercator limit of +/-85.0511 degrees.
+    """
+    _count_entry("to_web_mercator")
+    return _map_geometry(geometry, _kernel_to_web_mercator, NULL)
+
+
+def from_web_mercator(geometry) -> Geometry:
+    """Unproject a Web Mercator (EPSG:3857) geometry back to lon/lat (EPSG:4326)."""
+    _count_entry("from_web_mercator")
+    return _map_geometry(geometry, _kernel_from_web_mercator, NULL)
+
+
+def to_tile_pixels(geometry, int z, int x, int y, int extent=256) -> Geometry:
+    """
+    Transform a lon/lat geometry into pixel coordinates of the XYZ tile z/x/y.
+
+    Parameters:
+    -----------
+    geometry : Geometry, Point, Line, Ring, Poly, or other geometry type
+        The lon/lat geometry
+    z, x, y : int
+        Tile zoom level and column/row (XYZ / slippy-map scheme, origin top-left)
+    extent : int
+        Tile size in pixels (default: 256; use 4096 for vector tiles)
+
+    Returns:
+    --------
+    Geometry
+        The geometry in tile pixel space, where (0, 0) is the tile's top-left corner
+    """
+    _count_entry("to_tile_pixels")
+    cdef double params[3]
+    _tile_params(params, z, x, y, extent)
+    return _map_geometry(geometry, _kernel_to_tile_pixels, params)
+
+
+def to_web_mercator_coords(coords):
+    """Array form of ``to_web_mercator`` for an (N, 2) float64 lon/lat buffer.
+
+    Returns a new (N, 2) float64 memoryview (wrap with ``numpy.asarray``).
+    """
+    return _map_coords(coords, _kernel_to_web_mercator, NULL)
+
+
+def from_web_mercator_coords(coords):
+    """Array form of ``from_web_mercator`` for an (N, 2) float64 buffer."""
+    return _map_coords(coords, _kernel_from_web_mercator, NULL)
+
+
+def to_tile_pixels_coords(coords, int z, int x, int y, int extent=256):
+    """Array form of ``to_tile_pixels`` for an (N, 2) float64 lon/lat buffer."""
+    cdef double params[3]
+    _tile_params(params, z, x, y, extent)
+    return _map_coords(coords, _kernel_to_tile_pixels, params)
+
+
+# --- Packed R-tree and spatial join ---
+
+cdef struct _IndexBuffer:
+    Py_ssize_t *data
+    Py_ssize_t size
+    Py_ssize_t capacity
+
+
+cdef int _ibuf_push(_IndexBuffer *buf, Py_ssize_t value) noexcept nogil:
+    """Append value, growing the buffer geometrically; -1 on allocation failure."""
+    cdef Py_ssize_t cap
+    cdef Py_ssize_t *grown
+    if buf.size == buf.capacity:
+        cap = buf.capacity * 2 if buf.capacity > 0 else 64
+        grown = <Py_ssize_t *>realloc(buf.data, <size_t>cap * sizeof(Py_ssize_t))
+        if grown == NULL:
+            return -1
+        buf.data = grown
+        buf.capacity = cap
+    buf.data[buf.size] = value
+    buf.size += 1
+    return 0
+
+
+cdef int _cmp_ssize(const void *a, const void *b) noexcept nogil:
+    cdef Py_ssize_t x = (<const Py_ssize_t *>a)[0]
+    cdef Py_ssize_t y = (<const Py_ssize_t *>b)[0]
+    return -1 if x < y else (1 if x > y else 0)
+
+
+cdef struct _PackedTree:
+    # Static R-tree in the flatbush layout: leaves first (Hilbert-sorted), then
+    # each parent level, root last. boxes holds minx, miny, maxx, maxy per node;
+    # indices holds the item index for leaves and the first child node otherwise.
+    Py_ssize_t num_items
+    Py_ssize_t num_nodes
+    int node_size
+    int num_levels
+    double *boxes
+    Py_ssize_t *indices
+    Py_ssize_t *level_bounds
+
+
+cdef void _packed_tree_free(_PackedTree *tree) noexcept nogil:
+    free(tree.boxes)
+    free(tree.indices)
+    free(tree.level_bounds)
+    tree.boxes = NULL
+    tree.indices = NULL
+    tree.level_bounds = NULL
+    tree.num_items = 0
+    tree.num_nodes = 0
+    tree.num_levels = 0
+
+
+cdef int _packed_tree_build(
+    _PackedTree *tree, const tg_rect *rects, Py_ssize_t n, int node_size
+) noexcept nogil:
+    """Bulk-load rects into tree; returns -1 on allocation failure."""
+    cdef Py_ssize_t m, total, pos, end, write, i, k
+    cdef int levels = 1
+    cdef double w, h, cx, cy, minx, miny, maxx, maxy
+    cdef tg_rect extent
+    cdef _HilbertItem *items
+    tree.num_items = n
+    tree.node_size = node_size
+    tree.num_nodes = 0
+    tree.num_levels = 0
+    tree.boxes = NULL
+    tree.indices = NULL
+    tree.level_bounds = NULL
+    if n == 0:
+        return 0
+    m = n
+    total = n
+    while True:
+        m = (m + node_size - 1) // node_size
+        total += m
+        levels += 1
+        if m == 1:
+            break
+    tree.num_nodes = total
+    tree.num_levels = levels
+    tree.boxes = <double *>malloc(<size_t>total * 4 * sizeof(double))
+    tree.indices = <Py_ssize_t *>malloc(<size_t>total * sizeof(Py_ssize_t))
+    tree.level_bounds = <Py_ssize_t *>malloc(<size_t>levels * sizeof(Py_ssize_t))
+    items = <_HilbertItem *>malloc(<size_t>n * sizeof(_HilbertItem))
+    if tree.boxes == NULL or tree.indices == NULL or tree.level_bounds == NULL or items == NULL:
+        free(items)
+        _packed_tree_free(tree)
+        return -1
+    m = n
+    total = n
+    tree.level_bounds[0] = n
+    for k in range(1, levels):
+        m = (m + node_size - 1) // node_size
+        total += m
+        tree.level_bounds[k] = total
+    extent = rects[0]
+    for i in range(1, n):
+        extent = tg_rect_expand(extent, rects[i])
+    w = extent.max.x - extent.min.x
+    h = extent.max.y - extent.min.y
+    if w <= 0:
+        w = 1.0
+    if h <= 0:
+        h = 1.0
+    for i in range(n):
+        cx = ((rects[i].min.x + rects[i].max.x) / 2.0 - extent.min.x) / w
+        cy = ((rects[i].min.y + rects[i].max.y) / 2.0 - extent.min.y) / h
+        items[i].key = _hilbert_key(_hilbert_cell(cx), _hilbert_cell(cy))
+        items[i].index = i
+    qsort(items, <size_t>n, sizeof(_HilbertItem), _cmp_hilbert_item)
+    for i in range(n):
+        k = items[i].index
+        tree.boxes[4 * i] = rects[k].min.x
+        tree.boxes[4 * i + 1] = rects[k].min.y
+        tree.boxes[4 * i + 2] = rects[k].max.x
+        tree.boxes[4 * i + 3] = rects[k].max.y
+        tree.indices[i] = k
+    free(items)
+    pos = 0
+    write = n
+    for k in range(levels - 1):
+        end = tree.level_bounds[k]
+        while pos < end:
+            tree.indices[write] = pos
+            minx = tree.boxes[4 * pos]
+            miny = tree.boxes[4 * pos + 1]
+            maxx = tree.boxes[4 * pos + 2]
+            maxy = tree.boxes[4 * pos + 3]
+            i = 0
+            while i < node_size and pos < end:
+                if tree.boxes[4 * pos] < minx:
+                    minx = tree.boxes[4 * pos]
+                if tree.boxes[4 * pos + 1] < miny:
+                    miny = tree.boxes[4 * pos + 1]
+                if tree.boxes[4 * pos + 2] > maxx:
+                    maxx = tree.boxes[4 * pos + 2]
+                if tree.boxes[4 * pos + 3] > maxy:
+                    maxy = tree.boxes[4 * pos + 3]
+                pos += 1
+                i += 1
+            tree.boxes[4 * write] = minx
+            tree.boxes[4 * write + 1] = miny
+            tree.boxes[4 * write + 2] = maxx
+            tree.boxes[4 * write + 3] = maxy
+            write += 1
+    return 0
+
+
+cdef int _packed_tree_search(
+    const _PackedTree *tree, tg_rect q, _IndexBuffer *out, _IndexBuffer *stack
+) noexcept nogil:
+    """Append the items whose boxes intersect q to out; -1 on allocation failure."""
+    cdef Py_ssize_t node, end, pos, bound
+    cdef int k
+    cdef const double *b
+    if tree.num_items == 0:
+        return 0
+    stack.size = 0
+    node = tree.num_nodes - 1
+    while True:
+        bound = tree.num_nodes
+        for k in range(tree.num_levels):
+            if tree.level_bounds[k] > node:
+                bound = tree.level_bounds[k]
+                break
+        end = node + tree.node_size
+        if end > bound:
+            end = bound
+        for pos in range(node, end):
+            b = tree.boxes + 4 * pos
+            if q.max.x < b[0] or q.max.y < b[1] or q.min.x > b[2] or q.min.y > b[3]:
+                continue
+            if node >= tree.num_items:
+                if _ibuf_push(stack, tree.indices[pos]) < 0:
+                    return -1
+            elif _ibuf_push(out, tree.indices[pos]) < 0:
+                return -1
+        if stack.size == 0:
+            return 0
+        stack.size -= 1
+        node = stack.data[stack.size]
+
+
+cdef enum _JoinPredicate:
+    _JOIN_INTERSECTS
+    _JOIN_CONTAINS
+    _JOIN_WITHIN
+    _JOIN_COVERS
+    _JOIN_COVERED_BY
+    _JOIN_TOUCHES
+
+
+cdef dict _JOIN_PREDICATES = {
+    "intersects": _JOIN_INTERSECTS,
+    "contains": _JOIN_CONTAINS,
+    "within": _JOIN_WITHIN,
+    "covers": _JOIN_COVERS,
+    "covered_by": _JOIN_COVERED_BY,
+    "coveredby": _JOIN_COVERED_BY,
+    "touches": _JOIN_TOUCHES,
+}
+
+
+cdef int _join_predicate(object name) except -1:
+    try:
+        return _JOIN_PREDICATES[name]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"predicate must be one of {sorted(_JOIN_PREDICATES)}, got {name!r}"
+        ) from None
+
+
+cdef inline bint _apply_predicate(int predicate, const tg_geom *a, const tg_geom *b) noexcept nogil:
+    if predicate == _JOIN_INTERSECTS:
+        return tg_geom_intersects(a, b) != 0
+    if predicate == _JOIN_CONTAINS:
+        return tg_geom_contains(a, b) != 0
+    if predicate == _JOIN_WITHIN:
+        return tg_geom_within(a, b) != 0
+    if predicate == _JOIN_COVERS:
+        return tg_geom_covers(a, b) != 0
+    if predicate == _JOIN_COVERED_BY:
+        return tg_geom_coveredby(a, b) != 0
+    return tg_geom_touches(a, b) != 0
+
+
+cdef int _sjoin_probe(
+    const _PackedTree *tree, const tg_geom **left, const tg_geom **right,
+    Py_ssize_t start, Py_ssize_t stop, int predicate,
+    _IndexBuffer *out_left, _IndexBuffer *out_right
+) noexcept nogil:
+    """Probe tree with left[start:stop] and refine candidates; -1 on allocation failure."""
+    cdef _IndexBuffer cand
+    cdef _IndexBuffer stack
+    cdef Py_ssize_t i, k, j
+    cdef int rc = 0
+    cand.data = NULL
+    cand.size = 0
+    cand.capacity = 0
+    stack.data = NULL
+    stack.size = 0
+    stack.capacity = 0
+    for i in range(start, stop):
+        cand.size = 0
+        if _packed_tree_search(tree, tg_geom_rect(left[i]), &cand, &stack) < 0:
+            rc = -1
+            break
+        if cand.size > 1:
+            qsort(cand.data, <size_t>cand.size, sizeof(Py_ssize_t), _cmp_ssize)
+        for k in range(cand.size):
+            j = cand.data[k]
+            if _apply_predicate(predicate, left[i], right[j]):
+                if _ibuf_push(out_left, i) < 0 or _ibuf_push(out_right, j) < 0:
+                    rc = -1
+                    break
+        if rc < 0:
+            break
+    free(cand.data)
+    free(stack.data)
+    return rc
+
+
+cdef array.array _ibuf_to_array(const _IndexBuffer *buf):
+    cdef array.array out = _new_int64_array(buf.size)
+    cdef Py_ssize_t i
+    for i in range(buf.size):
+        out.data.as_longlongs[i] = buf.data[i]
+    return out
+
+
+cdef class _SpatialJoin:
+    """Packed R-tree over the right-hand geometries, probed by the left ones."""
+    cdef list left
+    cdef list right
+    cdef const tg_geom **left_ptrs
+    cdef const tg_geom **right_ptrs
+    cdef _PackedTree tree
+    cdef int predicate
+
+    def __cinit__(self):
+        self.left_ptrs = NULL
+        self.right_ptrs = NULL
+        self.tree.num_items = 0
+        self.tree.num_nodes = 0
+        self.tree.boxes = NULL
+        self.tree.indices = NULL
+        self.tree.level_bounds = NULL
+
+    def __init__(self, left, right, predicate):
+        cdef Py_ssize_t i, n
+        cdef tg_rect *rects
+        cdef int rc
+        self.predicate = _join_predicate(predicate)
+        self.left = _coerce_geometry_list(left, "left")
+        self.right = _coerce_geometry_list(right, "right")
+        self.left_ptrs = _geom_ptr_array(self.left)
+        self.right_ptrs = _geom_ptr_array(self.right)
+        n = len(self.right)
+        rects = <tg_rect *>malloc((<size_t>(n if n > 0 else 1)) * sizeof(tg_rect))
+        if rects == NULL:
+            raise MemoryError("Failed to allocate spatial join envelopes")
+        with nogil:
+            for i in range(n):
+                rects[i] = tg_geom_rect(self.right_ptrs[i])
+            rc = _packed_tree_build(&self.tree, rects, n, 16)
+        free(rects)
+        if rc < 0:
+            raise MemoryError("Failed to allocate spatial join index")
+
+    def __dealloc__(self):
+        _packed_tree_free(&self.tree)
+        free(self.left_ptrs)
+        free(self.right_ptrs)
+
+    def num_left(self):
+        return len(self.left)
+
+    def probe(self, Py_ssize_t start, Py_ssize_t stop, int threads):
+        """Join left[start:stop]; returns (left_idx, right_idx) array('q') values."""
+        cdef dict parts = {}
+
+        def work(Py_ssize_t lo, Py_ssize_t hi):
+            cdef _IndexBuffer out_left
+            cdef _IndexBuffer out_right
+            cdef int rc
+            out_left.data = NULL
+            out_left.size = 0
+            out_left.capacity = 0
+            out_right.data = NULL
+            out_right.size = 0
+            out_right.capacity = 0
+            with nogil:
+                rc = _sjoin_probe(
+                    &self.tree, self.left_ptrs, self.right_ptrs, start + lo, start + hi,
+                    self.predicate, &out_left, &out_right
+                )
+            try:
+                if rc < 0:
+                    raise MemoryError("Failed to allocate spatial join results")
+                parts[lo] = (_ibuf_to_array(&out_left), _ibuf_to_array(&out_right))
+            finally:
+                free(out_left.data)
+                free(out_right.data)
+
+        _run_chunked(stop - start, threads, work)
+        left_idx = _new_int64_array(0)
+        right_idx = _new_int64_array(0)
+        for lo in sorted(parts):
+            left_idx.extend(parts[lo][0])
+            right_idx.extend(parts[lo][1])
+        return left_idx, right_idx
+
+
+def sjoin(left, right, predicate: str = "intersects", threads=1):
+    """
+    Spatial join between two sequences of geometries.
+
+    A packed (Hilbert-sorted) R-tree is built over the envelopes of ``right``;
+    each geometry of ``left`` probes it in C and the candidates are refined
+    with the exact TG predicate ``predicate(left[i], right[j])``.
+
+    Parameters:
+    -----------
+    left, right : sequence of Geometry, Point, Line, Ring, Poly, or other geometry types
+        The geometries to join (index the larger, more complex side as ``right``)
+    predicate : str
+        One of "intersects", "contains", "within", "covers", "covered_by", "touches"
+    threads : int or None
+        Worker threads used to probe ``left`` with the GIL released
+        (default: 1; None uses one per CPU)
+
+    Returns:
+    --------
+    tuple of array('q')
+        (left_idx, right_idx): matching index pairs, sorted by left then right index
+    """
+    _count_entry("sjoin")
+    cdef int nthreads = _resolve_threads(threads)
+    cdef _SpatialJoin join = _SpatialJoin(left, right, predicate)
+    return join.probe(0, join.num_left(), nthreads)
+
+
+def sjoin_iter(left, right, predicate: str = "intersects", threads=1,
+               chunk_size: int = 65536):
+    """
+    Streaming form of ``sjoin`` for joins producing more pairs than fit in memory.
+
+    The index is built once; ``left`` is then probed ``chunk_size`` geometries at
+    a time and each chunk's (left_idx, right_idx) arrays are yielded as soon as
+    they are ready. Concatenating the chunks gives the same result as ``sjoin``.
+    """
+    cdef int nthreads = _resolve_threads(threads)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    return _sjoin_chunks(_SpatialJoin(left, right, predicate), nthreads, chunk_size)
+
+
+def _sjoin_chunks(_SpatialJoin join, int threads, Py_ssize_t chunk_size):
+    cdef Py_ssize_t n = join.num_left()
+    cdef Py_ssize_t start = 0
+    while start < n:
+        yield join.probe(start, min(start + chunk_size, n), threads)
+        start += chunk_size
+
+
+# --- Dynamic R-tree ---
+
+cdef enum:
+    _RT_MAX_ENTRIES = 16
+    _RT_MIN_ENTRIES = 6
+    _RT_CAPACITY = 17   # _RT_MAX_ENTRIES + 1: room for the overflowing entry
+    _RT_POOL_SIZE = 64
+
+
+cdef struct _RNode:
+    bint leaf
+    int count
+    tg_rect rects[_RT_CAPACITY]
+    _RNode *children[_RT_CAPACITY]
+    Py_ssize_t ids[_RT_CAPACITY]
+
+
+cdef struct _RNodePool:
+    # Nodes reserved before an insert so that splits cannot fail midway.
+    _RNode *nodes[_RT_POOL_SIZE]
+    int count
+
+
+cdef inline double _rect_area(tg_rect r) noexcept nogil:
+    return (r.max.x - r.min.x) * (r.max.y - r.min.y)
+
+
+cdef inline double _rect_margin(tg_rect r) noexcept nogil:
+    return (r.max.x - r.min.x) + (r.max.y - r.min.y)
+
+
+cdef inline double _rect_overlap(tg_rect a, tg_rect b) noexcept nogil:
+    cdef double w = (
+        (a.max.x if a.max.x < b.max.x else b.max.x) - (a.min.x if a.min.x > b.min.x else b.min.x)
+    )
+    cdef double h = (
+        (a.max.y if a.max.y < b.max.y else b.max.y) - (a.min.y if a.min.y > b.min.y else b.min.y)
+    )
+    if w <= 0 or h <= 0:
+        return 0.0
+    return w * h
+
+
+cdef inline bint _rect_hits(tg_rect a, tg_rect b) noexcept nogil:
+    return not (a.max.x < b.min.x or a.max.y < b.min.y or a.min.x > b.max.x or a.min.y > b.max.y)
+
+
+cdef inline bint _rect_covers(tg_rect a, tg_rect b) noexcept nogil:
+    return a.min.x <= b.min.x and a.min.y <= b.min.y and a.max.x >= b.max.x and a.max.y >= b.max.y
+
+
+cdef tg_rect _rt_node_rect(const _RNode *node) noexcept nogil:
+    cdef tg_rect r = node.rects[0]
+    cdef int i
+    for i in range(1, node.count):
+        r = tg_rect_expand(r, node.rects[i])
+    return r
+
+
+cdef void _rt_free(_RNode *node) noexcept nogil:
+    cdef int i
+    if node == NULL:
+        return
+    if not node.leaf:
+        for i in range(node.count):
+            _rt_free(node.children[i])
+    free(node)
+
+
+cdef int _rt_choose(const _RNode *node, tg_rect r) noexcept nogil:
+    """R*-tree ChooseSubtree.
+
+    Least overlap enlargement above leaves, else least area enlargement.
+    """
+    cdef int i, j, best = 0
+    cdef bint above_leaves = node.children[0].leaf
+    cdef tg_rect grown
+    cdef double cost, enlarge, area
+    cdef double best_cost = 0, best_enlarge = 0, best_area = 0
+    for i in range(node.count):
+        grown = tg_rect_expand(node.rects[i], r)
+        area = _rect_area(node.rects[i])
+        enlarge = _rect_area(grown) - area
+        cost = enlarge
+        if above_leaves:
+            cost = 0.0
+            for j in range(node.count):
+                if j != i:
+                    cost += (
+                        _rect_overlap(grown, node.rects[j])
+                        - _rect_overlap(node.rects[i], node.rects[j])
+                    )
+        if i == 0 or cost < best_cost or (cost == best_cost and (
+            enlarge < best_enlarge or (enlarge == best_enlarge and area < best_area)
+        )):
+            best = i
+            best_cost = cost
+            best_enlarge = enlarge
+            best_area = area
+    return best
+
+
+cdef inline double _rt_sort_key(const _RNode *node, int e, int axis, bint use_max) noexcept nogil:
+    if axis == 0:
+        return node.rects[e].max.x if use_max else node.rects[e].min.x
+    return node.rects[e].max.y if use_max else node.rects[e].min.y
+
+
+cdef void _rt_sort_entries(
+    const _RNode *node, int *order, int n, int axis, bint use_max
+) noexcept nogil:
+    cdef int i, j, e
+    cdef double key
+    for i in range(n):
+        order[i] = i
+    for i in range(1, n):
+        e = order[i]
+        key = _rt_sort_key(node, e, axis, use_max)
+        j = i - 1
+        while j >= 0 and _rt_sort_key(node, order[j], axis, use_max) > key:
+            order[j + 1] = order[j]
+            j -= 1
+        order[j + 1] = e
+
+
+cdef tg_rect _rt_group_rect(
+    const _RNode *node, const int *order, int start, int stop
+) noexcept nogil:
+    cdef tg_rect r = node.rects[order[start]]
+    cdef int i
+    for i in range(start + 1, stop):
+        r = tg_rect_expand(r, node.rects[order[i]])
+    return r
+
+
+cdef _RNode *_rt_split(_RNode *node, _RNodePool *pool) noexcept nogil:
+    """R*-tree split of an overflowing node; returns the new sibling."""
+    cdef int n = node.count
+    cdef int order[_RT_CAPACITY]
+    cdef int best_order[_RT_CAPACITY]
+    cdef tg_rect rects[_RT_CAPACITY]
+    cdef _RNode *children[_RT_CAPACITY]
+    cdef Py_ssize_t ids[_RT_CAPACITY]
+    cdef int axis, k, i, e, best_axis = 0, best_k = _RT_MIN_ENTRIES
+    cdef bint use_max
+    cdef double margin, best_margin = 0, ov, area, best_overlap = -1, best_area = 0
+    cdef tg_rect a, b
+    cdef _RNode *sib
+    cdef _RNode *target
+    # ChooseSplitAxis: smallest sum of margins over all distributions.
+    for axis in range(2):
+        margin = 0.0
+        for use_max in range(2):
+            _rt_sort_entries(node, order, n, axis, use_max)
+            for k in range(_RT_MIN_ENTRIES, n - _RT_MIN_ENTRIES + 1):
+                margin += _rect_margin(_rt_group_rect(node, order, 0, k))
+                margin += _rect_margin(_rt_group_rect(node, order, k, n))
+        if axis == 0 or margin < best_margin:
+            best_margin = margin
+            best_axis = axis
+    # ChooseSplitIndex: least overlap, then least total area.
+    for use_max in range(2):
+        _rt_sort_entries(node, order, n, best_axis, use_max)
+        for k in range(_RT_MIN_ENTRIES, n - _RT_MIN_ENTRIES + 1):
+            a = _rt_group_rect(node, order, 0, k)
+            b = _rt_group_rect(node, order, k, n)
+            ov = _rect_overlap(a, b)
+            area = _rect_area(a) + _rect_area(b)
+            if best_overlap < 0 or ov < best_overlap or (ov == best_overlap and area < best_area):
+                best_overlap = ov
+                best_area = area
+                best_k = k
+                for i in range(n):
+                    best_order[i] = order[i]
+    pool.count -= 1
+    sib = pool.nodes[pool.count]
+    sib.leaf = node.leaf
+    sib.count = 0
+    for i in range(n):
+        rects[i] = node.rects[i]
+        children[i] = node.children[i]
+        ids[i] = node.ids[i]
+    node.count = 0
+    for i in range(n):
+        e = best_order[i]
+        target = node if i < best_k else sib
+        target.rects[target.count] = rects[e]
+        target.children[target.count] = children[e]
+        target.ids[target.count] = ids[e]
+        target.count += 1
+    return sib
+
+
+cdef _RNode *_rt_insert_rec(
+    _RNode *node, tg_rect r, Py_ssize_t id, _RNodePool *pool
+) noexcept nogil:
+    """Insert below node; returns the new sibling if node had to split."""
+    cdef int i
+    cdef _RNode *sib
+    if node.leaf:
+        node.rects[node.count] = r
+        node.ids[node.count] = id
+        node.children[node.count] = NULL
+        node.count += 1
+    else:
+        i = _rt_choose(node, r)
+        sib = _rt_insert_rec(node.children[i], r, id, pool)
+        node.rects[i] = _rt_node_rect(node.children[i])
+        if sib != NULL:
+            node.rects[node.count] = _rt_node_rect(sib)
+            node.children[node.count] = sib
+            node.count += 1
+    if node.count > _RT_MAX_ENTRIES:
+        return _rt_split(node, pool)
+    return NULL
+
+
+cdef bint _rt_remove(_RNode *node, tg_rect r, Py_ssize_t id) noexcept nogil:
+    """Remove entry id (stored with envelope r); empty nodes are unlinked."""
+    cdef int i
+    cdef _RNode *child
+    if node.leaf:
+        for i in range(node.count):
+            if node.ids[i] == id:
+                node.count -= 1
+                node.rects[i] = node.rects[node.count]
+                node.ids[i] = node.ids[node.count]
+                return True
+        return False
+    for i in range(node.count):
+        if not _rect_covers(node.rects[i], r):
+            continue
+        child = node.children[i]
+        if _rt_remove(child, r, id):
+            if child.count == 0:
+                free(child)
+                node.count -= 1
+                node.rects[i] = node.rects[node.count]
+                node.children[i] = node.children[node.count]
+            else:
+                node.rects[i] = _rt_node_rect(child)
+            return True
+    return False
+
+
+cdef int _rt_search(const _RNode *node, tg_rect q, _IndexBuffer *out) noexcept nogil:
+    cdef int i
+    for i in range(node.count):
+        if not _rect_hits(node.rects[i], q):
+            continue
+        if node.leaf:
+            if _ibuf_push(out, node.ids[i]) < 0:
+                return -1
+        elif _rt_search(node.children[i], q, out) < 0:
+            return -1
+    return 0
+
+
+class _ReadWriteLock:
+    """Many concurrent readers or a single writer; waiting writers go first."""
+
+    def __init__(self):
+        self._cond = _threading.Condition(_threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+
+cdef tg_rect _coerce_query_rect(object rect) except *:
+    cdef tg_rect r
+    if isinstance(rect, Rect):
+        return (<Rect>rect)._get_c_rect()
+    try:
+        r.min.x, r.min.y, r.max.x, r.max.y = [float(v) for v in rect]
+    except (TypeError, ValueError):
+        raise TypeError("rect must be a Rect or a (minx, miny, maxx, maxy) sequence") from None
+    return r
+
+
+cdef array.array _sorted_ids(_IndexBuffer *buf):
+    if buf.size > 1:
+        qsort(buf.data, <size_t>buf.size, sizeof(Py_ssize_t), _cmp_ssize)
+    return _ibuf_to_array(buf)
+
+
+cdef class RTree:
+    """
+    Mutable R-tree (R*-tree splits) over geometries keyed by integer ids.
+
+    Any number of threads may query concurrently (tree traversal runs with
+    the GIL released) while a single writer inserts, deletes or updates.
+
+    Parameters:
+    -----------
+    items : iterable of (int, geometry), optional
+        Initial (id, geometry) pairs to insert
+    """
+    cdef _RNode *root
+    cdef int height
+    cdef dict _items
+    cdef object _lock
+
+    def __cinit__(self, *args, **kwargs):
+        self.root = <_RNode *>calloc(1, sizeof(_RNode))
+        if self.root == NULL:
+            raise MemoryError("Failed to allocate R-tree root")
+        self.root.leaf = True
+        self.height = 1
+        self._items = {}
+        self._lock = _ReadWriteLock()
+
+    def __init__(self, items=None):
+        if items is not None:
+            for item_id, geometry in items:
+                self.insert(item_id, geometry)
+
+    def __dealloc__(self):
+        _rt_free(self.root)
+        self.root = NULL
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id) -> bool:
+        return item_id in self._items
+
+    def __repr__(self):
+        return f"RTree({len(self._items)} items)"
+
+    def get(self, Py_ssize_t item_id):
+        """Return the geometry stored under item_id (KeyError if absent)."""
+        return self._items[item_id][0]
+
+    @property
+    def bounds(self):
+        """Returns (minx, miny, maxx, maxy) of all entries, or None when empty."""
+        cdef tg_rect r
+        self._lock.acquire_read()
+        try:
+            if self.root.count == 0:
+                return None
+            r = _rt_node_rect(self.root)
+            return (r.min.x, r.min.y, r.max.x, r.max.y)
+        finally:
+            self._lock.release_read()
+
+    cdef int _insert_locked(self, Py_ssize_t item_id, object geometry) except -1:
+        cdef Geometry g = _coerce_geometry_or_raise(geometry, "geometry")
+        cdef _RNodePool pool
+        cdef _RNode *sib
+        cdef _RNode *new_root
+        cdef tg_rect r
+        cdef int i, j
+        g._ensure_initialized("geometry")
+        if item_id in self._items:
+            raise ValueError(f"id {item_id} is already in the tree; use update()")
+        # One node per level may split, plus a new root.
+        pool.count = 0
+        for i in range(self.height + 2):
+            pool.nodes[i] = <_RNode *>calloc(1, sizeof(_RNode))
+            if pool.nodes[i] == NULL:
+                for j in range(pool.count):
+                    free(pool.nodes[j])
+                raise MemoryError("Failed to allocate R-tree nodes")
+            pool.count += 1
+        r = tg_geom_rect(g.geom)
+        sib = _rt_insert_rec(self.root, r, item_id, &pool)
+        if sib != NULL:
+            pool.count -= 1
+            new_root = pool.nodes[pool.count]
+            new_root.leaf = False
+            new_root.count = 2
+            new_root.rects[0] = _rt_node_rect(self.root)
+            new_root.children[0] = self.root
+            new_root.rects[1] = _rt_node_rect(sib)
+            new_root.children[1] = sib
+            self.root = new_root
+            self.height += 1
+        for i in range(pool.count):
+            free(pool.nodes[i])
+        self._items[item_id] = (geometry, g)
+        return 0
+
+    cdef int _delete_locked(self, Py_ssize_t item_id) except -1:
+        cdef Geometry g = self._items[item_id][1]
+        cdef _RNode *old
+        _rt_remove(self.root, tg_geom_rect(g.geom), item_id)
+        del self._items[item_id]
+        while not self.root.leaf and self.root.count == 1:
+            old = self.root
+            self.root = old.children[0]
+            free(old)
+            self.height -= 1
+        if not self.root.leaf and self.root.count == 0:
+            self.root.leaf = True
+            self.height = 1
+        return 0
+
+    def insert(self, Py_ssize_t item_id, geometry) -> None:
+        """Insert geometry under a new integer id (ValueError if the id exists)."""
+        self._lock.acquire_write()
+        try:
+            self._insert_locked(item_id, geometry)
+        finally:
+            self._lock.release_write()
+
+    def delete(self, Py_ssize_t item_id) -> None:
+        """Remove the entry stored under item_id (KeyError if absent)."""
+        self._lock.acquire_write()
+        try:
+            self._delete_locked(item_id)
+        finally:
+            self._lock.release_write()
+
+    def update(self, Py_ssize_t item_id, geometry) -> None:
+        """Replace the geometry stored under item_id (KeyError if absent)."""
+        self._lock.acquire_write()
+        try:
+            _coerce_geometry_or_raise(geometry, "geometry")._ensure_initialized("geometry")
+            old = self._items[item_id][0]
+            self._delete_locked(item_id)
+            try:
+                self._insert_locked(item_id, geometry)
+            except BaseException:
+                # Keep the previous entry rather than losing the id.
+                self._insert_locked(item_id, old)
+                raise
+        finally:
+            self._lock.release_write()
+
+    def query(self, rect):
+        """Return the ids whose envelopes intersect rect, as a sorted array('q').
+
+        rect may be a Rect or a (minx, miny, maxx, maxy) sequence.
+        """
+        cdef tg_rect q = _coerce_query_rect(rect)
+        cdef _IndexBuffer out
+        cdef int rc
+        out.data = NULL
+        out.size = 0
+        out.capacity = 0
+        self._lock.acquire_read()
+        try:
+            with nogil:
+                rc = _rt_search(self.root, q, &out)
+            if rc < 0:
+                raise MemoryError("Failed to allocate R-tree query results")
+            return _sorted_ids(&out)
+        finally:
+            self._lock.release_read()
+            free(out.data)
+
+    def query_geom(self, geometry, predicate: str = "intersects"):
+        """
+        Return the ids of entries for which ``predicate(geometry, entry)`` holds.
+
+        Candidates come from the envelope search and are refined with the exact
+        TG predicate ("intersects", "contains", "within", "covers",
+        "covered_by" or "touches"). Returns a sorted array('q').
+        """
+        cdef int pred = _join_predicate(predicate)
+        cdef Geometry g = _coerce_geometry_or_raise(geometry, "geometry")
+        cdef _IndexBuffer cand
+        cdef const tg_geom **ptrs = NULL
+        cdef Py_ssize_t i, kept = 0
+        cdef int rc
+        g._ensure_initialized("geometry")
+        cand.data = NULL
+        cand.size = 0
+        cand.capacity = 0
+        self._lock.acquire_read()
+        try:
+            with nogil:
+                rc = _rt_search(self.root, tg_geom_rect(g.geom), &cand)
+            if rc < 0:
+                raise MemoryError("Failed to allocate R-tree query results")
+            ptrs = <const tg_geom **>malloc(
+                (<size_t>(cand.size if cand.size > 0 else 1)) * sizeof(tg_geom *)
+            )
+            if ptrs == NULL:
+                raise MemoryError("Failed to allocate R-tree query results")
+            for i in range(cand.size):
+                ptrs[i] = (<Geometry>self._items[cand.data[i]][1]).geom
+            with nogil:
+                for i in range(cand.size):
+                    if _apply_predicate(pred, g.geom, ptrs[i]):
+                        cand.data[kept] = cand.data[i]
+                        kept += 1
+                cand.size = kept
+            return _sorted_ids(&cand)
+        finally:
+            self._lock.release_read()
+            free(ptrs)
+            free(cand.data)
+
+
+# --- Grid point index ---
+
+cdef class PointIndex:
+    """
+    Compact uniform-grid index over contiguous x/y float64 arrays.
+
+    Points are bucketed by grid cell (counting sort, CSR layout) and their
+    coordinates copied in cell order; no per-point Python objects are created.
+    Query results are sorted array('q') indices into the original arrays.
+    Points with NaN or infinite coordinates are not indexed.
+
+    Parameters:
+    -----------
+    x, y : 1-D float64 buffers (e.g. NumPy arrays) of equal length
+        Point coordinates
+    cell_size : float, optional
+        Grid cell size (default: about four points per cell for uniform data);
+        enlarged if it would make the grid much larger than the point count
+    """
+    cdef Py_ssize_t num_points
+    cdef Py_ssize_t num_indexed
+    cdef Py_ssize_t nx
+    cdef Py_ssize_t ny
+    cdef double minx
+    cdef double miny
+    cdef double maxx
+    cdef double maxy
+    cdef double _cell_size
+    cdef Py_ssize_t *cell_start   # nx * ny + 1 offsets into order/xs/ys
+    cdef Py_ssize_t *order        # original point index, in cell order
+    cdef double *xs
+    cdef double *ys
+
+    def __cinit__(self, *args, **kwargs):
+        self.cell_start = NULL
+        self.order = NULL
+        self.xs = NULL
+        self.ys = NULL
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def __init__(self, x, y, cell_size=None):
+        cdef const double[::1] xv = x
+        cdef const double[::1] yv = y
+        cdef Py_ssize_t n = xv.shape[0]
+        cdef Py_ssize_t i, c, ncells, pos
+        cdef Py_ssize_t *cells
+        cdef double w, h, cs
+        if yv.shape[0] != n:
+            raise ValueError("x and y must have the same length")
+        self.num_points = n
+        self.num_indexed = 0
+        self.minx = self.miny = self.maxx = self.maxy = 0.0
+        for i in range(n):
+            if not (isfinite(xv[i]) and isfinite(yv[i])):
+                continue
+            if self.num_indexed == 0:
+                self.minx = self.maxx = xv[i]
+                self.miny = self.maxy = yv[i]
+            else:
+                if xv[i] < self.minx:
+                    self.minx = xv[i]
+                elif xv[i] > self.maxx:
+                    self.maxx = xv[i]
+                if yv[i] < self.miny:
+                    self.miny = yv[i]
+                elif yv[i] > self.maxy:
+                    self.maxy = yv[i]
+            self.num_indexed += 1
+        w = self.maxx - self.minx
+        h = self.maxy - self.miny
+        if not (isfinite(w) and isfinite(h)):
+            raise ValueError("point extent is too large to index")
+        if cell_size is None:
+            cs = sqrt(w * h * 4.0 / self.num_indexed) if self.num_indexed > 0 else 0.0
+            if cs <= 0:
+                cs = (w if w > h else h) / 64.0
+            if cs <= 0:
+                cs = 1.0
+        else:
+            cs = cell_size
+            if not cs > 0:
+                raise ValueError("cell_size must be > 0")
+        # Keep the grid no larger than the number of points (a zero-width
+        # extent still spans one row or column of cells).
+        while max(1.0, ceil(w / cs)) * max(1.0, ceil(h / cs)) > 4.0 * self.num_indexed + 16:
+            cs *= 2.0
+        self._cell_size = cs
+        self.nx = <Py_ssize_t>(w / cs) + 1
+        self.ny = <Py_ssize_t>(h / cs) + 1
+        ncells = self.nx * self.ny
+        self.cell_start = <Py_ssize_t *>calloc(<size_t>(ncells + 1), sizeof(Py_ssize_t))
+        self.order = <Py_ssize_t *>malloc((<size_t>(n if n > 0 else 1)) * sizeof(Py_ssize_t))
+        self.xs = <double *>malloc((<size_t>(n if n > 0 else 1)) * sizeof(double))
+        self.ys = <double *>malloc((<size_t>(n if n > 0 else 1)) * sizeof(double))
+        cells = <Py_ssize_t *>malloc((<size_t>(n if n > 0 else 1)) * sizeof(Py_ssize_t))
+        if (
+            self.cell_start == NULL or self.order == NULL or self.xs == NULL
+            or self.ys == NULL or cells == NULL
+        ):
+            free(cells)
+            raise MemoryError("Failed to allocate point index")
+        with nogil:
+            for i in range(n):
+                if not (isfinite(xv[i]) and isfinite(yv[i])):
+                    cells[i] = -1
+                    continue
+                cells[i] = self._cell_of(xv[i], yv[i])
+                self.cell_start[cells[i] + 1] += 1
+            for c in range(ncells):
+                self.cell_start[c + 1] += self.cell_start[c]
+            # Stable scatter: cell_start[c] is used as the write cursor, then restored.
+            for i in range(n):
+                c = cells[i]
+                if c < 0:
+                    continue
+                pos = self.cell_start[c]
+                self.order[pos] = i
+                self.xs[pos] = xv[i]
+                self.ys[pos] = yv[i]
+                self.cell_start[c] = pos + 1
+            for c in range(ncells - 1, 0, -1):
+                self.cell_start[c] = self.cell_start[c - 1]
+            self.cell_start[0] = 0
+        free(cells)
+
+    def __dealloc__(self):
+        free(self.cell_start)
+        free(self.order)
+        free(self.xs)
+        free(self.ys)
+
+    def __len__(self) -> int:
+        return self.num_points
+
+    def __repr__(self):
+        return f"PointIndex({self.num_points} points, {self.nx}x{self.ny} grid)"
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    @property
+    def bounds(self):
+        """Returns (minx, miny, maxx, maxy) of the indexed points, or None when empty."""
+        if self.num_indexed == 0:
+            return None
+        return (self.minx, self.miny, self.maxx, self.maxy)
+
+    cdef inline Py_ssize_t _col(self, double x) noexcept nogil:
+        cdef double c = (x - self.minx) / self._cell_size
+        if c < 0:
+            return 0
+        if c >= self.nx:
+            return self.nx - 1
+        return <Py_ssize_t>c
+
+    cdef inline Py_ssize_t _row(self, double y) noexcept nogil:
+        cdef double r = (y - self.miny) / self._cell_size
+        if r < 0:
+            return 0
+        if r >= self.ny:
+            return self.ny - 1
+        return <Py_ssize_t>r
+
+    cdef inline Py_ssize_t _cell_of(self, double x, double y) noexcept nogil:
+        return self._row(y) * self.nx + self._col(x)
+
+    cdef int _scan(self, tg_rect q, const tg_geom *geom, double cx, double cy,
+                   double r2, _IndexBuffer *out) noexcept nogil:
+        """Collect points inside q; further filtered by geom or by radius when r2 >= 0."""
+        cdef Py_ssize_t c0, c1, r0, r1, row, col, c, k
+        cdef double x, y, dx, dy
+        if self.num_indexed == 0 or q.max.x < self.minx or q.max.y < self.miny \
+                or q.min.x > self.maxx or q.min.y > self.maxy:
+            return 0
+        c0 = self._col(q.min.x)
+        c1 = self._col(q.max.x)
+        r0 = self._row(q.min.y)
+        r1 = self._row(q.max.y)
+        for row in range(r0, r1 + 1):
+            for col in range(c0, c1 + 1):
+                c = row * self.nx + col
+                for k in range(self.cell_start[c], self.cell_start[c + 1]):
+                    x = self.xs[k]
+                    y = self.ys[k]
+                    if x < q.min.x or x > q.max.x or y < q.min.y or y > q.max.y:
+                        continue
+                    if geom != NULL and tg_geom_intersects_xy(geom, x, y) == 0:
+                        continue
+                    if r2 >= 0:
+                        dx = x - cx
+                        dy = y - cy
+                        if dx * dx + dy * dy > r2:
+                            continue
+                    if _ibuf_push(out, self.order[k]) < 0:
+                        return -1
+        return 0
+
+    cdef array.array _run_query(
+        self, tg_rect q, const tg_geom *geom, double cx, double cy, double r2
+    ):
+        cdef _IndexBuffer out
+        cdef int rc
+        out.data = NULL
+        out.size = 0
+        out.capacity = 0
+        try:
+            with nogil:
+                rc = self._scan(q, geom, cx, cy, r2, &out)
+            if rc < 0:
+                raise MemoryError("Failed to allocate point index query results")
+            return _sorted_ids(&out)
+        finally:
+            free(out.data)
+
+    def query_rect(self, rect):
+        """Indices of points inside rect (Rect or (minx, miny, maxx, maxy)), as array('q')."""
+        return self._run_query(_coerce_query_rect(rect), NULL, 0.0, 0.0, -1.0)
+
+    def query_polygon(self, geometry):
+        """Indices of points intersecting geometry (boundary included), as array('q').
+
+        Candidates from the polygon's envelope are tested with TG's point
+        intersection, which uses the polygon's ring index when present.
+        """
+        cdef Geometry g = _coerce_geometry_or_raise(geometry, "geometry")
+        g._ensure_initialized("geometry")
+        return self._run_query(tg_geom_rect(g.geom), g.geom, 0.0, 0.0, -1.0)
+
+    def query_radius(self, center, double radius):
+        """Indices of points within planar distance radius of center (Point or (x, y))."""
+        cdef double cx, cy
+        cdef tg_rect q
+        if not radius >= 0:
+            raise ValueError("radius must be >= 0")
+        if isinstance(center, Point):
+            cx = (<Point>center).pt.x
+            cy = (<Point>center).pt.y
+        else:
+            cx, cy = _coerce_xy(center, "center")
+        q.min.x = cx - radius
+        q.min.y = cy - radius
+        q.max.x = cx + radius
+        q.max.y = cy + radius
+        return self._run_query(q, NULL, cx, cy, radius * radius)
+
+
+# --- Persistent (memory-mapped) geometry index ---
+
+# File layout (native byte order, 64-bit, every section 8-byte aligned):
+#   header | level_bounds[num_levels] i64 | boxes[num_nodes][4] f64
+#   | indices[num_nodes] i64 | wkb_offsets[num_items + 1] u64 | wkb bytes
+cdef struct _IndexFileHeader:
+    char magic[8]
+    uint32_t version
+    uint32_t byte_order
+    uint32_t node_size
+    uint32_t num_levels
+    uint64_t num_items
+    uint64_t num_nodes
+    uint64_t wkb_size
+
+
+cdef bytes _INDEX_MAGIC = b"TOGOIDX1"
+cdef uint32_t _INDEX_VERSION = 1
+cdef uint32_t _INDEX_BYTE_ORDER = 0x01020304
+_INDEX_HEADER_FORMAT = "=8sIIIIQQQ"
+
+
+cdef class GeometryIndex:
+    """
+    Static packed R-tree over a fixed sequence of geometries.
+
+    The index (node envelopes, tree layout and the geometries as WKB) can be
+    written to a single file with ``save`` and reopened with
+    ``GeometryIndex.open``, which memory-maps it: worker processes share the
+    same pages and only the geometries touched by a query are parsed.
+    Index files are trusted input, like pickles.
+
+    Parameters:
+    -----------
+    geoms : sequence of Geometry, Point, Line, Ring, Poly, or other geometry types
+        The geometries to index; query results are positions in this sequence
+    node_size : int
+        Maximum number of children per tree node (default: 16)
+    """
+    cdef _PackedTree tree
+    cdef bint mapped
+    cdef list _geoms
+    cdef object _mmap
+    cdef object _buffer
+    cdef const unsigned char *_wkb
+    cdef const uint64_t *_wkb_offsets
+    cdef uint64_t _wkb_size
+    cdef tg_geom **_parsed
+
+    def __cinit__(self, *args, **kwargs):
+        self.tree.num_items = 0
+        self.tree.num_nodes = 0
+        self.tree.num_levels = 0
+        self.tree.boxes = NULL
+        self.tree.indices = NULL
+        self.tree.level_bounds = NULL
+        self.mapped = False
+        self._parsed = NULL
+
+    def __init__(self, geoms, int node_size=16):
+        cdef Py_ssize_t i, n
+        cdef tg_rect *rects
+        cdef const tg_geom **ptrs
+        cdef int rc
+        if node_size < 2:
+            raise ValueError("node_size must be >= 2")
+        self._geoms = _coerce_geometry_list(geoms, "geoms")
+        n = len(self._geoms)
+        ptrs = _geom_ptr_array(self._geoms)
+        rects = <tg_rect *>malloc((<size_t>(n if n > 0 else 1)) * sizeof(tg_rect))
+        if rects == NULL:
+            free(ptrs)
+            raise MemoryError("Failed to allocate index envelopes")
+        with nogil:
+            for i in range(n):
+                rects[i] = tg_geom_rect(ptrs[i])
+            rc = _packed_tree_build(&self.tree, rects, n, node_size)
+        free(rects)
+        free(ptrs)
+        if rc < 0:
+            raise MemoryError("Failed to allocate geometry index")
+
+    def __dealloc__(self):
+        cdef Py_ssize_t i
+        if self._parsed != NULL:
+            for i in range(self.tree.num_items):
+                if self._parsed[i] != NULL:
+                    tg_geom_free(self._parsed[i])
+            free(self._parsed)
+        if not self.mapped:
+            _packed_tree_free(&self.tree)
+
+    def __len__(self) -> int:
+        return self.tree.num_items
+
+    def __repr__(self):
+        kind = "mapped" if self.mapped else "in-memory"
+        return f"GeometryIndex({self.tree.num_items} items, {kind})"
+
+    @property
+    def bounds(self):
+        """Returns (minx, miny, maxx, maxy) of all entries, or None when empty."""
+        cdef const double *b
+        if self.tree.num_items == 0:
+            return None
+        b = self.tree.boxes + 4 * (self.tree.num_nodes - 1)
+        return (b[0], b[1], b[2], b[3])
+
+    cdef const tg_geom *_geom_at(self, Py_ssize_t i) except NULL:
+        cdef uint64_t start, end
+        cdef tg_geom *g
+        cdef const char *err
+        if not self.mapped:
+            return (<Geometry>self._geoms[i]).geom
+        if self._parsed[i] == NULL:
+            start = self._wkb_offsets[i]
+            end = self._wkb_offsets[i + 1]
+            if start > end or end > self._wkb_size:
+                raise ValueError(f"corrupt index file: bad WKB offsets for item {i}")
+            g = tg_parse_wkb(self._wkb + start, <size_t>(end - start))
+            if g == NULL:
+                raise ValueError("ParseError: invalid binary")
+            err = tg_geom_error(g)
+            if err != NULL:
+                msg = err.decode("utf-8")
+                tg_geom_free(g)
+                raise ValueError(msg)
+            self._parsed[i] = g
+        return self._parsed[i]
+
+    def __getitem__(self, Py_ssize_t i):
+        cdef tg_geom *g
+        if i < 0:
+            i += self.tree.num_items
+        if i < 0 or i >= self.tree.num_items:
+            raise IndexError("GeometryIndex index out of range")
+        if not self.mapped:
+            return self._geoms[i]
+        g = tg_geom_clone(self._geom_at(i))
+        if g == NULL:
+            raise MemoryError("Failed to clone geometry")
+        return _geometry_from_ptr_concrete(g)
+
+    def query(self, rect):
+        """Return the positions whose envelopes intersect rect, as a sorted array('q').
+
+        rect may be a Rect or a (minx, miny, maxx, maxy) sequence.
+        """
+        cdef tg_rect q = _coerce_query_rect(rect)
+        cdef _IndexBuffer out
+        cdef _IndexBuffer stack
+        cdef int rc
+        out.data = NULL
+        out.size = 0
+        out.capacity = 0
+        stack.data = NULL
+        stack.size = 0
+        stack.capacity = 0
+        try:
+            with nogil:
+                rc = _packed_tree_search(&self.tree, q, &out, &stack)
+            if rc < 0:
+                raise MemoryError("Failed to allocate index query results")
+            return _sorted_ids(&out)
+        finally:
+            free(out.data)
+            free(stack.data)
+
+    def query_geom(self, geometry, predicate: str = "intersects"):
+        """
+        Return the positions of entries for which ``predicate(geometry, entry)`` holds.
+
+        Uses the same predicates as ``sjoin``; on a mapped index only the
+        envelope candidates are parsed. Returns a sorted array('q').
+        """
+        cdef int pred = _join_predicate(predicate)
+        cdef Geometry g = _coerce_geometry_or_raise(geometry, "geometry")
+        cdef _IndexBuffer cand
+        cdef _IndexBuffer stack
+        cdef const tg_geom **ptrs = NULL
+        cdef Py_ssize_t i, kept = 0
+        cdef int rc
+        g._ensure_initialized("geometry")
+        cand.data = NULL
+        cand.size = 0
+        cand.capacity = 0
+        stack.data = NULL
+        stack.size = 0
+        stack.capacity = 0
+        try:
+            with nogil:
+                rc = _packed_tree_search(&self.tree, tg_geom_rect(g.geom), &cand, &stack)
+            if rc < 0:
+                raise MemoryError("Failed to allocate index query results")
+            ptrs = <const tg_geom **>malloc(
+                (<size_t>(cand.size if cand.size > 0 else 1)) * sizeof(tg_geom *)
+            )
+            if ptrs == NULL:
+                raise MemoryError("Failed to allocate index query results")
+            for i in range(cand.size):
+                ptrs[i] = self._geom_at(cand.data[i])
+            with nogil:
+                for i in range(cand.size):
+                    if _apply_predicate(pred, g.geom, ptrs[i]):
+                        cand.data[kept] = cand.data[i]
+                        kept += 1
+                cand.size = kept
+            return _sorted_ids(&cand)
+        finally:
+            free(ptrs)
+            free(cand.data)
+            free(stack.data)
+
+    cdef bytes _item_wkb(self, Py_ssize_t i):
+        cdef uint64_t start, end
+        if not self.mapped:
+            return (<Geometry>self._geoms[i]).to_wkb()
+        start = self._wkb_offsets[i]
+        end = self._wkb_offsets[i + 1]
+        if start > end or end > self._wkb_size:
+            raise ValueError(f"corrupt index file: bad WKB offsets for item {i}")
+        return (<const char *>self._wkb)[start:end]
+
+    def save(self, path) -> None:
+        """Write the index and its geometries (as WKB) to a single file."""
+        cdef Py_ssize_t i, n = self.tree.num_items
+        cdef uint64_t total = 0
+        if sizeof(Py_ssize_t) != 8:
+            raise RuntimeError("index files require a 64-bit platform")
+        offsets = _array.array("Q", [0]) * (n + 1)
+        chunks = []
+        for i in range(n):
+            wkb = self._item_wkb(i)
+            chunks.append(wkb)
+            total += len(wkb)
+            offsets[i + 1] = total
+        header = _struct.pack(
+            _INDEX_HEADER_FORMAT, _INDEX_MAGIC, _INDEX_VERSION, _INDEX_BYTE_ORDER,
+            self.tree.node_size, self.tree.num_levels, n, self.tree.num_nodes, total,
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            if n > 0:
+                f.write((<const char *>self.tree.level_bounds)[:self.tree.num_levels * 8])
+                f.write((<const char *>self.tree.boxes)[:self.tree.num_nodes * 32])
+                f.write((<const char *>self.tree.indices)[:self.tree.num_nodes * 8])
+            f.write(offsets.tobytes())
+            for wkb in chunks:
+                f.write(wkb)
+
+    @staticmethod
+    def open(path) -> GeometryIndex:
+        """Memory-map an index written by ``save`` (read-only, shared between processes)."""
+        cdef GeometryIndex idx = GeometryIndex.__new__(GeometryIndex)
+        cdef const unsigned char[::1] view
+        cdef const unsigned char *base
+        cdef const _IndexFileHeader *hdr
+        cdef uint64_t size, off, n, nodes, levels, m, total
+        cdef Py_ssize_t k
+        if sizeof(Py_ssize_t) != 8:
+            raise RuntimeError("index files require a 64-bit platform")
+        with open(path, "rb") as f:
+            if _os.fstat(f.fileno()).st_size < sizeof(_IndexFileHeader):
+                raise ValueError("not a togo index file")
+            mm = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+        buf = memoryview(mm)
+        view = buf
+        base = &view[0]
+        size = <uint64_t>view.shape[0]
+        hdr = <const _IndexFileHeader *>base
+        if memcmp(hdr.magic, <const char *>_INDEX_MAGIC, 8) != 0:
+            raise ValueError("not a togo index file")
+        if hdr.version != _INDEX_VERSION:
+            raise ValueError(f"unsupported index file version {hdr.version}")
+        if hdr.byte_order != _INDEX_BYTE_ORDER:
+            raise ValueError("index file was written with a different byte order")
+        n = hdr.num_items
+        nodes = hdr.num_nodes
+        levels = hdr.num_levels
+        # Recompute the tree shape from the item count and check it matches.
+        if n > size // 8 or hdr.node_size < 2:
+            raise ValueError("corrupt index file: bad header")
+        m = n
+        total = n
+        k = 0
+        if n > 0:
+            k = 1
+            while True:
+                m = (m + hdr.node_size - 1) // hdr.node_size
+                total += m
+                k += 1
+                if m == 1:
+                    break
+        if total != nodes or <uint64_t>k != levels:
+            raise ValueError("corrupt index file: bad tree shape")
+        off = sizeof(_IndexFileHeader)
+        if off + levels * 8 + nodes * 40 + (n + 1) * 8 + hdr.wkb_size != size:
+            raise ValueError("corrupt index file: unexpected file size")
+        # Mark as mapped first so __dealloc__ never frees the mapped arrays.
+        idx.mapped = True
+        idx._mmap = mm
+        idx._buffer = buf
+        idx.tree.num_items = <Py_ssize_t>n
+        idx.tree.num_nodes = <Py_ssize_t>nodes
+        idx.tree.num_levels = <int>levels
+        idx.tree.node_size = <int>hdr.node_size
+        idx.tree.level_bounds = <Py_ssize_t *>(base + off)
+        off += levels * 8
+        idx.tree.boxes = <double *>(base + off)
+        off += nodes * 32
+        idx.tree.indices = <Py_ssize_t *>(base + off)
+        off += nodes * 8
+        idx._wkb_offsets = <const uint64_t *>(base + off)
+        off += (n + 1) * 8
+        idx._wkb = base + off
+        idx._wkb_size = hdr.wkb_size
+        idx._parsed = <tg_geom **>calloc(<size_t>(n if n > 0 else 1), sizeof(tg_geom *))
+        if idx._parsed == NULL:
+            raise MemoryError("Failed to allocate index parse cache")
+        return idx
+
+
+# --- Segment-pair search ---
+
+cdef struct _SegmentPairs:
+    _IndexBuffer pairs  # interleaved (a segment index, b segment index)
+    bint swapped
+    bint failed
+
+
+cdef bool _collect_segment_pair(
+    tg_segment aseg, int aidx, tg_segment bseg, int bidx, void *udata
+) noexcept nogil:
+    cdef _SegmentPairs *ctx = <_SegmentPairs *>udata
+    if ctx.swapped:
+        aidx, bidx = bidx, aidx
+    if _ibuf_push(&ctx.pairs, aidx) < 0 or _ibuf_push(&ctx.pairs, bidx) < 0:
+        ctx.failed = True
+        return False
+    return True
+
+
+cdef int _cmp_ssize_pair(const void *a, const void *b) noexcept nogil:
+    cdef const Py_ssize_t *x = <const Py_ssize_t *>a
+    cdef const Py_ssize_t *y = <const Py_ssize_t *>b
+    if x[0] != y[0]:
+        return -1 if x[0] < y[0] else 1
+    return -1 if x[1] < y[1] else (1 if x[1] > y[1] else 0)
+
+
+cdef void _segment_crossing(tg_segment a, tg_segment b, double *out) noexcept nogil:
+    """Intersection point of two intersecting segments; NaN when they overlap collinearly."""
+    cdef double dax = a.b.x - a.a.x
+    cdef double day = a.b.y - a.a.y
+    cdef double dbx = b.b.x - b.a.x
+    cdef double dby = b.b.y - b.a.y
+    cdef double den = dax * dby - day * dbx
+    cdef double t
+    if den == 0.0:
+        out[0] = NAN
+        out[1] = NAN
+        return
+    t = ((b.a.x - a.a.x) * dby - (b.a.y - a.a.y) * dbx) / den
+    if t <= 0.0:
+        out[0] = a.a.x
+        out[1] = a.a.y
+    elif t >= 1.0:
+        out[0] = a.b.x
+        out[1] = a.b.y
+    else:
+        out[0] = a.a.x + t * dax
+        out[1] = a.a.y + t * day
+
+
+cdef int _coerce_series(
+    object obj, str name, const tg_ring **ring, const tg_line **line
+) except -1:
+    """Resolve a Ring, Line or LineString geometry to its TG ring or line."""
+    ring[0] = NULL
+    line[0] = NULL
+    if isinstance(obj, Ring):
+        ring[0] = (<Ring>obj)._get_c_ring()
+    elif isinstance(obj, Line):
+        line[0] = (<Line>obj)._get_c_line()
+    elif isinstance(obj, Geometry) and (<Geometry>obj).geom != NULL \
+            and tg_geom_typeof((<Geometry>obj).geom) == 2:
+        line[0] = tg_geom_line((<Geometry>obj).geom)
+    else:
+        raise TypeError(f"{name} must be a Ring, Line or LineString geometry")
+    if ring[0] == NULL and line[0] == NULL:
+        raise ValueError(f"{name} is not initialized")
+    return 0
+
+
+def segment_intersections(a, b):
+    """
+    Find every pair of intersecting segments between two rings or lines.
+
+    The search runs in C over TG's ring/line indexes (``tg_ring_ring_search``,
+    ``tg_ring_line_search``, ``tg_line_line_search``) without going through GEOS.
+
+    Parameters:
+    -----------
+    a, b : Ring, Line or LineString geometry
+        Segment ``i`` of a ring or line joins vertices ``i`` and ``i + 1``.
+
+    Returns:
+    --------
+    tuple
+        ``(a_idx, b_idx, points)``: array('q') segment indices into ``a`` and
+        ``b``, sorted by ``(a_idx, b_idx)``, and an (N, 2) float64 memoryview of
+        the intersection points. Collinear overlapping pairs share a stretch
+        rather than a point and report NaN coordinates.
+    """
+    cdef const tg_ring *ra
+    cdef const tg_ring *rb
+    cdef const tg_line *la
+    cdef const tg_line *lb
+    cdef _SegmentPairs ctx
+    cdef Py_ssize_t i, n
+    cdef tg_segment sa, sb
+    cdef array.array a_idx, b_idx, points
+
+    _coerce_series(a, "a", &ra, &la)
+    _coerce_series(b, "b", &rb, &lb)
+    ctx.pairs.data = NULL
+    ctx.pairs.size = 0
+    ctx.pairs.capacity = 0
+    ctx.swapped = False
+    ctx.failed = False
+    try:
+        with nogil:
+            if ra != NULL and rb != NULL:
+                tg_ring_ring_search(ra, rb, _collect_segment_pair, &ctx)
+            elif ra != NULL:
+                tg_ring_line_search(ra, lb, _collect_segment_pair, &ctx)
+            elif rb != NULL:
+                ctx.swapped = True
+                tg_ring_line_search(rb, la, _collect_segment_pair, &ctx)
+            else:
+                tg_line_line_search(la, lb, _collect_segment_pair, &ctx)
+            n = ctx.pairs.size // 2
+            if not ctx.failed and n > 1:
+                qsort(ctx.pairs.data, <size_t>n, 2 * sizeof(Py_ssize_t), _cmp_ssize_pair)
+        if ctx.failed:
+            raise MemoryError("Failed to allocate segment pairs")
+        a_idx = _new_int64_array(n)
+        b_idx = _new_int64_array(n)
+        points = _new_double_array(2 * n)
+        with nogil:
+            for i in range(n):
+                a_idx.data.as_longlongs[i] = ctx.pairs.data[2 * i]
+                b_idx.data.as_longlongs[i] = ctx.pairs.data[2 * i + 1]
+                if ra != NULL:
+                    sa = tg_ring_segment_at(ra, <int>ctx.pairs.data[2 * i])
+                else:
+                    sa = tg_line_segment_at(la, <int>ctx.pairs.data[2 * i])
+                if rb != NULL:
+                    sb = tg_ring_segment_at(rb, <int>ctx.pairs.data[2 * i + 1])
+                else:
+                    sb = tg_line_segment_at(lb, <int>ctx.pairs.data[2 * i + 1])
+                _segment_crossing(sa, sb, points.data.as_doubles + 2 * i)
+    finally:
+        free(ctx.pairs.data)
+    return a_idx, b_idx, _double_rows(points, n, 2)
+
+
+# --- Segment arrays ---
+
+cdef struct _SweepItem:
+    double minx
+    double miny
+    double maxx
+    double maxy
+    Py_ssize_t index
+
+
+cdef int _cmp_sweep_item(const void *a, const void *b) noexcept nogil:
+    cdef double x = (<const _SweepItem *>a).minx
+    cdef double y = (<const _SweepItem *>b).minx
+    return -1 if x < y else (1 if x > y else 0)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline tg_segment _segment_row(const double[:, ::1] rows, Py_ssize_t i) noexcept nogil:
+    cdef tg_segment seg
+    seg.a.x = rows[i, 0]
+    seg.a.y = rows[i, 1]
+    seg.b.x = rows[i, 2]
+    seg.b.y = rows[i, 3]
+    return seg
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef _SweepItem *_sweep_items(const double[:, ::1] rows) noexcept nogil:
+    """Segment envelopes sorted by minx; NULL on allocation failure."""
+    cdef Py_ssize_t n = rows.shape[0]
+    cdef Py_ssize_t i
+    cdef _SweepItem *items = <_SweepItem *>malloc(<size_t>(n if n > 0 else 1) * sizeof(_SweepItem))
+    if items == NULL:
+        return NULL
+    for i in range(n):
+        items[i].minx = min(rows[i, 0], rows[i, 2])
+        items[i].maxx = max(rows[i, 0], rows[i, 2])
+        items[i].miny = min(rows[i, 1], rows[i, 3])
+        items[i].maxy = max(rows[i, 1], rows[i, 3])
+        items[i].index = i
+    qsort(items, <size_t>n, sizeof(_SweepItem), _cmp_sweep_item)
+    return items
+
+
+cdef int _sweep_test(
+    const double[:, ::1] a, const _SweepItem *ia,
+    const double[:, ::1] b, const _SweepItem *ib,
+    bint swapped, _IndexBuffer *out,
+) noexcept nogil:
+    if ia.miny > ib.maxy or ib.miny > ia.maxy:
+        return 0
+    if not tg_segment_intersects_segment(_segment_row(a, ia.index), _segment_row(b, ib.index)):
+        return 0
+    if swapped:
+        if _ibuf_push(out, ib.index) < 0 or _ibuf_push(out, ia.index) < 0:
+            return -1
+    elif _ibuf_push(out, ia.index) < 0 or _ibuf_push(out, ib.index) < 0:
+        return -1
+    return 0
+
+
+cdef int _segment_sweep(
+    const double[:, ::1] a, const double[:, ::1] b, _IndexBuffer *out
+) noexcept nogil:
+    """
+    Bipartite sort-and-sweep over x: walking both minx-sorted lists in merge
+    order, each segment is only tested against the segments of the other
+    array that start before it ends, so every overlapping pair is visited once.
+    Appends (a index, b index) pairs to ``out``; -1 on allocation failure.
+    """
+    cdef Py_ssize_t na = a.shape[0]
+    cdef Py_ssize_t nb = b.shape[0]
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t k
+    cdef int rc = 0
+    cdef _SweepItem *ia = _sweep_items(a)
+    cdef _SweepItem *ib = _sweep_items(b)
+    if ia == NULL or ib == NULL:
+        free(ia)
+        free(ib)
+        return -1
+    while rc == 0 and i < na and j < nb:
+        if ia[i].minx <= ib[j].minx:
+            k = j
+            while rc == 0 and k < nb and ib[k].minx <= ia[i].maxx:
+                rc = _sweep_test(a, &ia[i], b, &ib[k], False, out)
+                k += 1
+            i += 1
+        else:
+            k = i
+            while rc == 0 and k < na and ia[k].minx <= ib[j].maxx:
+                rc = _sweep_test(b, &ib[j], a, &ia[k], True, out)
+                k += 1
+            j += 1
+    free(ia)
+    free(ib)
+    return rc
+
+
+cdef bint _segment_intersects_geom(tg_segment seg, const tg_geom *geom, int *failed) noexcept nogil:
+    cdef tg_line *line
+    cdef bint hit
+    if not tg_rect_intersects_rect(tg_segment_rect(seg), tg_geom_rect(geom)):
+        return False
+    line = tg_line_new_ix(&seg.a, 2, TG_NONE)
+    if line == NULL:
+        failed[0] = 1
+        return False
+    # A tg_line can be upcast to a tg_geom.
+    hit = tg_geom_intersects(geom, <const tg_geom *>line)
+    tg_line_free(line)
+    return hit
+
+
+cdef class SegmentArray:
+    """
+    Array of segments backed by a contiguous (N, 4) float64 buffer of
+    ``ax, ay, bx, by`` rows, with vectorized envelope and intersection tests.
+
+    Buffers (e.g. NumPy arrays) are used without copying; any other iterable
+    of Segment objects, 4-tuples or point pairs is packed into a new buffer.
+    """
+    cdef const double[:, ::1] _rows
+
+    def __init__(self, data):
+        cdef Py_ssize_t i, n
+        cdef array.array buf
+        cdef double *dst
+        cdef Segment seg
+        cdef const double[:, ::1] rows
+        if PyObject_CheckBuffer(data):
+            rows = data
+            if rows.shape[1] != 4:
+                raise ValueError("segment array must have shape (N, 4)")
+            self._rows = rows
+            return
+        items = list(data)
+        n = len(items)
+        buf = _new_double_array((n if n > 0 else 1) * 4)
+        dst = buf.data.as_doubles
+        for i in range(n):
+            item = items[i]
+            if isinstance(item, Segment):
+                seg = <Segment>item
+                dst[4 * i] = seg.seg.a.x
+                dst[4 * i + 1] = seg.seg.a.y
+                dst[4 * i + 2] = seg.seg.b.x
+                dst[4 * i + 3] = seg.seg.b.y
+            elif len(item) == 4:
+                dst[4 * i], dst[4 * i + 1], dst[4 * i + 2], dst[4 * i + 3] = item
+            elif len(item) == 2:
+                dst[4 * i], dst[4 * i + 1] = _coerce_xy(item[0], "data")
+                dst[4 * i + 2], dst[4 * i + 3] = _coerce_xy(item[1], "data")
+            else:
+                raise TypeError("segments must be Segment, (ax, ay, bx, by) or (a, b)")
+        # Slice at the Python level: memoryview cannot cast to a zero-row shape.
+        self._rows = memoryview(buf).cast("B").cast("d", (n if n > 0 else 1, 4))[:n]
+
+    def __len__(self):
+        return self._rows.shape[0]
+
+    def __getitem__(self, Py_ssize_t i) -> Segment:
+        cdef Py_ssize_t n = self._rows.shape[0]
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError("SegmentArray index out of range")
+        return Segment(
+            (self._rows[i, 0], self._rows[i, 1]), (self._rows[i, 2], self._rows[i, 3])
+        )
+
+    @property
+    def coords(self):
+        """The (N, 4) float64 rows backing this array (read-only)."""
+        return self._rows
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def rect(self):
+        """
+        Envelope of every segment.
+
+        Returns:
+        --------
+        memoryview
+            (N, 4) float64 rows of minx, miny, maxx, maxy
+        """
+        cdef Py_ssize_t n = self._rows.shape[0]
+        cdef Py_ssize_t i
+        cdef array.array out = _new_double_array(n * 4)
+        cdef double *dst = out.data.as_doubles
+        with nogil:
+            for i in range(n):
+                dst[4 * i] = min(self._rows[i, 0], self._rows[i, 2])
+                dst[4 * i + 1] = min(self._rows[i, 1], self._rows[i, 3])
+                dst[4 * i + 2] = max(self._rows[i, 0], self._rows[i, 2])
+                dst[4 * i + 3] = max(self._rows[i, 1], self._rows[i, 3])
+        return _double_rows(out, n, 4)
+
+    def intersects(self, other):
+        """
+        All intersecting pairs between this array and ``other``.
+
+        Candidate pairs come from a sweep line over x with a y-overlap check,
+        and only those are tested with ``tg_segment_intersects_segment``.
+
+        Parameters:
+        -----------
+        other : SegmentArray or anything SegmentArray() accepts
+
+        Returns:
+        --------
+        tuple of array.array
+            ``(self_idx, other_idx)`` (typecode "q"), sorted by
+            ``(self_idx, other_idx)``
+        """
+        cdef SegmentArray b = other if isinstance(other, SegmentArray) else SegmentArray(other)
+        cdef _IndexBuffer out
+        cdef Py_ssize_t i, n
+        cdef int rc
+        cdef array.array left, right
+        out.data = NULL
+        out.size = 0
+        out.capacity = 0
+        try:
+            with nogil:
+                rc = _segment_sweep(self._rows, b._rows, &out)
+                n = out.size // 2
+                if rc == 0 and n > 1:
+                    qsort(out.data, <size_t>n, 2 * sizeof(Py_ssize_t), _cmp_ssize_pair)
+            if rc < 0:
+                raise MemoryError("Failed to allocate segment pairs")
+            left = _new_int64_array(n)
+            right = _new_int64_array(n)
+            for i in range(n):
+                left.data.as_longlongs[i] = out.data[2 * i]
+                right.data.as_longlongs[i] = out.data[2 * i + 1]
+        finally:
+            free(out.data)
+        return left, right
+
+    def intersects_geom(self, geometry, threads=1):
+        """
+        Boolean mask of the segments intersecting ``geometry``.
+
+        Segments whose envelope misses the geometry's are rejected without
+        building a TG line.
+
+        Parameters:
+        -----------
+        geometry : Geometry or geometry-like object
+        threads : int or None
+            Worker threads (None: one per CPU)
+
+        Returns:
+        --------
+        array.array
+            N bytes (typecode "B") of 0/1, usable as
+            ``numpy.asarray(mask).view(bool)``
+        """
+        cdef Geometry g = _coerce_geometry_or_raise(geometry, "geometry")
+        g._ensure_initialized("geometry")
+        cdef int nthreads = _resolve_threads(threads)
+        cdef Py_ssize_t n = self._rows.shape[0]
+        cdef array.array mask = _new_bool_array(n)
+        cdef unsigned char *dst = mask.data.as_uchars
+        cdef const double[:, ::1] rows = self._rows
+        cdef const tg_geom *gp = g.geom
+
+        def work(Py_ssize_t start, Py_ssize_t stop):
+            cdef Py_ssize_t i
+            cdef int chunk_failed = 0
+            with nogil:
+                for i in range(start, stop):
+                    dst[i] = _segment_intersects_geom(_segment_row(rows, i), gp, &chunk_failed)
+            if chunk_failed:
+                raise MemoryError("Failed to allocate segment line")
+
+        _run_chunked(n, nthreads, work)
+        return mask
+
+
+# --- Rect arrays ---
+
+cdef class RectArray:
+    """
+    Array of rectangles stored as four contiguous float64 buffers
+    (``minx``, ``miny``, ``maxx``, ``maxy``) with vectorized envelope operations.
+    The columns are exposed as read-only memoryviews of those buffers.
+
+    Build from an iterable of Rect / (minx, miny, maxx, maxy) values, from an
+    (N, 4) float64 buffer, with ``from_arrays`` or with ``bounds_of(geoms)``.
+    Binary operations take a Rect, Point, 4-sequence (broadcast) or a
+    RectArray of the same length (elementwise).
+    """
+    cdef array.array _minx
+    cdef array.array _miny
+    cdef array.array _maxx
+    cdef array.array _maxy
+    cdef Py_ssize_t n
+
+    def __init__(self, rects=()):
+        cdef Py_ssize_t i
+        cdef tg_rect r
+        cdef const double[:, ::1] rows
+        if PyObject_CheckBuffer(rects):
+            rows = rects
+            if rows.shape[1] != 4:
+                raise ValueError("rect array must have shape (N, 4)")
+            self._alloc(rows.shape[0])
+            for i in range(self.n):
+                self._set(i, rows[i, 0], rows[i, 1], rows[i, 2], rows[i, 3])
+            return
+        items = list(rects)
+        self._alloc(len(items))
+        for i in range(self.n):
+            r = _coerce_query_rect(items[i])
+            self._set(i, r.min.x, r.min.y, r.max.x, r.max.y)
+
+    cdef void _alloc(self, Py_ssize_t n):
+        self.n = n
+        self._minx = _new_double_array(n)
+        self._miny = _new_double_array(n)
+        self._maxx = _new_double_array(n)
+        self._maxy = _new_double_array(n)
+
+    cdef inline void _set(
+        self, Py_ssize_t i, double minx, double miny, double maxx, double maxy
+    ) noexcept nogil:
+        self._minx.data.as_doubles[i] = minx
+        self._miny.data.as_doubles[i] = miny
+        self._maxx.data.as_doubles[i] = maxx
+        self._maxy.data.as_doubles[i] = maxy
+
+    cdef inline tg_rect _get(self, Py_ssize_t i) noexcept nogil:
+        cdef tg_rect r
+        r.min.x = self._minx.data.as_doubles[i]
+        r.min.y = self._miny.data.as_doubles[i]
+        r.max.x = self._maxx.data.as_doubles[i]
+        r.max.y = self._maxy.data.as_doubles[i]
+        return r
+
+    @staticmethod
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def from_arrays(minx, miny, maxx, maxy) -> RectArray:
+        """Build from four equally sized 1-D float64 buffers (copied)."""
+        cdef const double[::1] a = minx
+        cdef const double[::1] b = miny
+        cdef const double[::1] c = maxx
+        cdef const double[::1] d = maxy
+        cdef Py_ssize_t i
+        cdef RectArray out = RectArray.__new__(RectArray)
+        if not (a.shape[0] == b.shape[0] == c.shape[0] == d.shape[0]):
+            raise ValueError("minx, miny, maxx and maxy must have the same length")
+        out._alloc(a.shape[0])
+        with nogil:
+            for i in range(out.n):
+                out._set(i, a[i], b[i], c[i], d[i])
+        return out
+
+    @staticmethod
+    def bounds_of(geoms) -> RectArray:
+        """
+        Envelopes of a sequence of geometries (see ``bounds``).
+
+        Geometry rows are read from ``tg_geom_rect`` without the GIL; other
+        togo classes are dispatched per object.
+        """
+        cdef RectArray out = RectArray.__new__(RectArray)
+        cdef const tg_geom **ptrs
+        cdef Py_ssize_t i
+        cdef tg_rect r
+        cdef Geometry g
+        if not isinstance(geoms, (list, tuple)):
+            geoms = list(geoms)
+        out._alloc(len(geoms))
+        ptrs = <const tg_geom **>calloc(<size_t>(out.n if out.n > 0 else 1), sizeof(tg_geom *))
+        if ptrs == NULL:
+            raise MemoryError("Failed to allocate geometry pointer array")
+        try:
+            for i in range(out.n):
+                obj = geoms[i]
+                if isinstance(obj, Geometry):
+                    g = <Geometry>obj
+                    g._ensure_initialized("geoms")
+                    ptrs[i] = g.geom
+                else:
+                    _object_rect(obj, &r)
+                    out._set(i, r.min.x, r.min.y, r.max.x, r.max.y)
+            with nogil:
+                for i in range(out.n):
+                    if ptrs[i] != NULL:
+                        r = tg_geom_rect(ptrs[i])
+                        out._set(i, r.min.x, r.min.y, r.max.x, r.max.y)
+        finally:
+            free(ptrs)
+        return out
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, Py_ssize_t i) -> Rect:
+        if i < 0:
+            i += self.n
+        if i < 0 or i >= self.n:
+            raise IndexError("RectArray index out of range")
+        cdef tg_rect r = self._get(i)
+        return Rect(Point(r.min.x, r.min.y), Point(r.max.x, r.max.y))
+
+    def __repr__(self):
+        return f"RectArray(n={self.n})"
+
+    @property
+    def minx(self) -> memoryview:
+        return memoryview(self._minx).toreadonly()
+
+    @property
+    def miny(self) -> memoryview:
+        return memoryview(self._miny).toreadonly()
+
+    @property
+    def maxx(self) -> memoryview:
+        return memoryview(self._maxx).toreadonly()
+
+    @property
+    def maxy(self) -> memoryview:
+        return memoryview(self._maxy).toreadonly()
+
+    cdef RectArray _operand(self, object other, tg_rect *scalar):
+        """Resolve a binary-op operand: a same-length RectArray, or None with scalar filled."""
+        cdef tg_point p
+        if isinstance(other, RectArray):
+            if (<RectArray>other).n != self.n:
+                raise ValueError("RectArray operands must have the same length")
+            return <RectArray>other
+        if isinstance(other, Point):
+            p = (<Point>other)._get_c_point()
+            scalar.min = p
+            scalar.max = p
+        else:
+            scalar[0] = _coerce_query_rect(other)
+        return None
+
+    def area(self) -> array.array:
+        """Area of every rectangle as array('d')."""
+        cdef array.array out = _new_double_array(self.n)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.n):
+                out.data.as_doubles[i] = _rect_area(self._get(i))
+        return out
+
+    def intersects(self, other) -> array.array:
+        """
+        Mask of the rectangles intersecting ``other`` (boundaries included).
+
+        Returns:
+        --------
+        array.array
+            N bytes (typecode "B") of 0/1
+        """
+        cdef tg_rect q
+        cdef RectArray b = self._operand(other, &q)
+        cdef array.array out = _new_bool_array(self.n)
+        cdef Py_ssize_t i
+        if b is None:
+            with nogil:
+                for i in range(self.n):
+                    out.data.as_uchars[i] = _rect_hits(self._get(i), q)
+        else:
+            with nogil:
+                for i in range(self.n):
+                    out.data.as_uchars[i] = _rect_hits(self._get(i), b._get(i))
+        return out
+
+    def contains(self, other) -> array.array:
+        """
+        Mask of the rectangles covering ``other`` (boundaries included).
+
+        Returns:
+        --------
+        array.array
+            N bytes (typecode "B") of 0/1
+        """
+        cdef tg_rect q
+        cdef RectArray b = self._operand(other, &q)
+        cdef array.array out = _new_bool_array(self.n)
+        cdef Py_ssize_t i
+        if b is None:
+            with nogil:
+                for i in range(self.n):
+                    out.data.as_uchars[i] = _rect_covers(self._get(i), q)
+        else:
+            with nogil:
+                for i in range(self.n):
+                    out.data.as_uchars[i] = _rect_covers(self._get(i), b._get(i))
+        return out
+
+    def expand(self, other) -> RectArray:
+        """Return a new RectArray with every rectangle grown to include ``other``."""
+        cdef tg_rect q
+        cdef tg_rect r
+        cdef RectArray b = self._operand(other, &q)
+        cdef RectArray out = RectArray.__new__(RectArray)
+        cdef Py_ssize_t i
+        out._alloc(self.n)
+        with nogil:
+            for i in range(self.n):
+                r = tg_rect_expand(self._get(i), q if b is None else b._get(i))
+                out._set(i, r.min.x, r.min.y, r.max.x, r.max.y)
+        return out
+
+    def union(self) -> Rect:
+        """Reduce to the single Rect covering every rectangle."""
+        cdef tg_rect r
+        cdef Py_ssize_t i
+        if self.n == 0:
+            raise ValueError("union of an empty RectArray")
+        r = self._get(0)
+        with nogil:
+            for i in range(1, self.n):
+                r = tg_rect_expand(r, self._get(i))
+        return Rect(Point(r.min.x, r.min.y), Point(r.max.x, r.max.y))
+
+
+# --- Bounds ---
+
+cdef int _object_rect(object obj, tg_rect *out) except -1:
+    """
+    Envelope of a togo geometry-like object, read straight from its TG
+    structure (no Geometry/Rect/Point objects are created). Returns 0 for
+    empty geometries and 1 otherwise.
+    """
+    cdef const tg_ring *ring
+    cdef const tg_line *line
+    cdef const tg_poly *poly
+    cdef Geometry g
+    if isinstance(obj, Geometry):
+        g = <Geometry>obj
+        g._ensure_initialized("geoms")
+        out[0] = tg_geom_rect(g.geom)
+        return 0 if tg_geom_is_empty(g.geom) else 1
+    if isinstance(obj, Poly):
+        poly = (<Poly>obj).poly
+        if poly == NULL:
+            raise ValueError("geoms contains an uninitialized Poly")
+        out[0] = tg_poly_rect(poly)
+        return 0 if tg_ring_num_points(tg_poly_exterior(poly)) == 0 else 1
+    if isinstance(obj, Ring):
+        ring = (<Ring>obj)._get_c_ring()
+        if ring == NULL:
+            raise ValueError("geoms contains an uninitialized Ring")
+        out[0] = tg_ring_rect(ring)
+        return 0 if tg_ring_num_points(ring) == 0 else 1
+    if isinstance(obj, Line):
+        line = (<Line>obj)._get_c_line()
+        if line == NULL:
+            raise ValueError("geoms contains an uninitialized Line")
+        out[0] = tg_line_rect(line)
+        return 0 if tg_line_num_points(line) == 0 else 1
+    if isinstance(obj, Point):
+        out.min = (<Point>obj).pt
+        out.max = (<Point>obj).pt
+        return 1
+    if isinstance(obj, Rect):
+        out[0] = (<Rect>obj).rect
+        return 1
+    if isinstance(obj, Segment):
+        out[0] = tg_segment_rect((<Segment>obj).seg)
+        return 1
+    g = _coerce_geometry_or_raise(obj, "geoms")
+    g._ensure_initialized("geoms")
+    out[0] = tg_geom_rect(g.geom)
+    return 0 if tg_geom_is_empty(g.geom) else 1
+
+
+def bounds(geoms):
+    """
+    Envelopes of a sequence of geometries in one call.
+
+    Each row matches ``geoms[i].bounds``, but is read directly from the TG
+    structure of any togo class (Geometry, Poly, Ring, Line, Point, Rect,
+    Segment) without allocating per-geometry Python objects.
+
+    Parameters:
+    -----------
+    geoms : sequence of geometry-like objects
+
+    Returns:
+    --------
+    memoryview
+        (N, 4) float64 rows of minx, miny, maxx, maxy (usable via ``numpy.asarray``)
+    """
+    cdef Py_ssize_t i, n
+    cdef tg_rect r
+    cdef array.array out
+    cdef double *dst
+    if not isinstance(geoms, (list, tuple)):
+        geoms = list(geoms)
+    n = len(geoms)
+    out = _new_double_array(n * 4)
+    dst = out.data.as_doubles
+    for i in range(n):
+        _object_rect(geoms[i], &r)
+        dst[4 * i] = r.min.x
+        dst[4 * i + 1] = r.min.y
+        dst[4 * i + 2] = r.max.x
+        dst[4 * i + 3] = r.max.y
+    return _double_rows(out, n, 4)
+
+
+def total_bounds(geoms) -> tuple:
+    """
+    Envelope covering every non-empty geometry of ``geoms``.
+
+    Returns:
+    --------
+    tuple
+        (minx, miny, maxx, maxy); all NaN when there is no non-empty geometry
+    """
+    cdef tg_rect r
+    cdef tg_rect total
+    cdef bint found = False
+    for obj in geoms:
+        if not _object_rect(obj, &r):
+            continue
+        total = tg_rect_expand(total, r) if found else r
+        found = True
+    if not found:
+        return (NAN, NAN, NAN, NAN)
+    return (total.min.x, total.min.y, total.max.x, total.max.y)
+
+
+# --- Batch overlays ---
+
+cdef enum _OverlayOp:
+    _OP_BUFFER
+    _OP_SIMPLIFY
+    _OP_INTERSECTION
+    _OP_UNION
+    _OP_DIFFERENCE
+
+
+cdef struct _OverlayArgs:
+    int op
+    double distance  # buffer distance or simplify tolerance
+    int quad_segs
+    int cap_style
+    int join_style
+    double mitre_limit
+    bint preserve_topology
+
+
+cdef tg_geom *_geos_overlay(
+    GEOSContextHandle_t ctx, const _OverlayArgs *args,
+    const tg_geom *a, const tg_geom *b, int *stage
+) noexcept nogil:
+    """Run one GEOS operation on TG inputs; ``stage`` records where it failed."""
+    cdef GEOSGeometry *g1 = tg_geom_to_geos(ctx, a)
+    cdef GEOSGeometry *g2 = NULL
+    cdef GEOSGeometry *res = NULL
+    cdef tg_geom *out
+    if g1 == NULL:
+        stage[0] = 1
+        return NULL
+    if b != NULL:
+        g2 = tg_geom_to_geos(ctx, b)
+        if g2 == NULL:
+            GEOSGeom_destroy_r(ctx, g1)
+            stage[0] = 1
+            return NULL
+    if args.op == _OP_BUFFER:
+        res = GEOSBufferWithStyle_r(
+            ctx, g1, args.distance, args.quad_segs, args.cap_style,
+            args.join_style, args.mitre_limit
+        )
+    elif args.op == _OP_SIMPLIFY:
+        if args.preserve_topology:
+            res = GEOSTopologyPreserveSimplify_r(ctx, g1, args.distance)
+        else:
+            res = GEOSSimplify_r(ctx, g1, args.distance)
+    elif args.op == _OP_INTERSECTION:
+        res = GEOSIntersection_r(ctx, g1, g2)
+    elif args.op == _OP_UNION:
+        res = GEOSUnion_r(ctx, g1, g2)
+    else:
+        res = GEOSDifference_r(ctx, g1, g2)
+    if g2 != NULL:
+        GEOSGeom_destroy_r(ctx, g2)
+    GEOSGeom_destroy_r(ctx, g1)
+    if res == NULL:
+        stage[0] = 2
+        return NULL
+    out = tg_geom_from_geos(ctx, res)
+    GEOSGeom_destroy_r(ctx, res)
+    if out == NULL:
+        stage[0] = 3
+    return out
+
+
+_OVERLAY_NAMES = {
+    _OP_BUFFER: ("buffer", "GEOSBuffer"),
+    _OP_SIMPLIFY: ("simplify", "Simplification"),
+    _OP_INTERSECTION: ("intersection", "GEOSIntersection"),
+    _OP_UNION: ("union", "GEOSUnion"),
+    _OP_DIFFERENCE: ("difference", "GEOSDifference"),
+}
+
+
+cdef object _overlay_shortcut(int op, Geometry a, Geometry b):
+    """Result the single-geometry method returns without calling GEOS, or None."""
+    cdef bint a_empty = tg_geom_is_empty(a.geom) != 0
+    cdef bint b_empty = tg_geom_is_empty(b.geom) != 0
+    cdef tg_geom *out
+    if not (a_empty or b_empty):
+        return None
+    if op == _OP_INTERSECTION or (op == _OP_DIFFERENCE and a_empty):
+        out = tg_geom_new_geometrycollection_empty()
+    elif op == _OP_UNION and a_empty:
+        out = tg_geom_clone(b.geom)
+    else:
+        out = tg_geom_clone(a.geom)
+    if out == NULL:
+        raise MemoryError(f"Failed to allocate {_OVERLAY_NAMES[op][0]} result")
+    return _geometry_from_ptr_concrete(out)
+
+
+cdef list _overlay_many(_OverlayArgs args, object lhs, object rhs, object threads):
+    """
+    Apply one GEOS operation to every geometry (or pair) in order.
+
+    Shortcuts for empty inputs and 3D normalization mirror the corresponding
+    Geometry method and run up front; the remaining GEOS calls are spread over
+    the thread pool in small chunks, each worker chunk with its own GEOS
+    context and the GIL released.
+    """
+    cdef int nthreads = _resolve_threads(threads)
+    cdef list left = _coerce_geometry_list(lhs, "geoms")
+    cdef list right = None
+    cdef Py_ssize_t n = len(left)
+    cdef Py_ssize_t i, k
+    cdef Py_ssize_t npending = 0
+    cdef bint binary = args.op >= _OP_INTERSECTION
+    cdef Geometry a, b, single
+    cdef list results = [None] * n
+    cdef list keep = []
+    cdef const tg_geom **pa = NULL
+    cdef const tg_geom **pb = NULL
+    cdef Py_ssize_t *slots = NULL
+    cdef tg_geom **out = NULL
+    cdef int *stages = NULL
+    cdef _OverlayArgs *pargs = &args
+
+    if binary:
+        try:
+            single = _coerce_geometry_or_raise(rhs, "other")
+        except TypeError:
+            single = None
+        if single is not None:
+            single._ensure_initialized("other")
+            right = [single] * n
+        else:
+            right = _coerce_geometry_list(rhs, "other")
+            if len(right) != n:
+                raise ValueError("geoms and other must have the same length")
+
+    pa = <const tg_geom **>malloc(<size_t>(n if n > 0 else 1) * sizeof(tg_geom *))
+    pb = <const tg_geom **>malloc(<size_t>(n if n > 0 else 1) * sizeof(tg_geom *))
+    slots = <Py_ssize_t *>malloc(<size_t>(n if n > 0 else 1) * sizeof(Py_ssize_t))
+    out = <tg_geom **>calloc(<size_t>(n if n > 0 else 1), sizeof(tg_geom *))
+    stages = <int *>calloc(<size_t>(n if n > 0 else 1), sizeof(int))
+    try:
+        if pa == NULL or pb == NULL or slots == NULL or out == NULL or stages == NULL:
+            raise MemoryError("Failed to allocate batch overlay buffers")
+        for i in range(n):
+            a = <Geometry>left[i]
+            if args.op == _OP_BUFFER and args.distance == 0:
+                results[i] = a
+                continue
+            b = None
+            if binary:
+                b = <Geometry>right[i]
+                if tg_geom_dims(a.geom) > 2:
+                    a = force_2d(a)
+                    keep.append(a)
+                if tg_geom_dims(b.geom) > 2:
+                    b = force_2d(b)
+                    keep.append(b)
+                results[i] = _overlay_shortcut(args.op, a, b)
+                if results[i] is not None:
+                    continue
+            pa[npending] = a.geom
+            pb[npending] = b.geom if b is not None else NULL
+            slots[npending] = i
+            npending += 1
+
+        def work(Py_ssize_t start, Py_ssize_t stop):
+            cdef Py_ssize_t j
+            cdef GEOSContextHandle_t ctx = GEOS_init_r()
+            if ctx == NULL:
+                raise RuntimeError("Failed to initialize GEOS context")
+            with nogil:
+                for j in range(start, stop):
+                    out[j] = _geos_overlay(ctx, pargs, pa[j], pb[j], &stages[j])
+            GEOS_finish_r(ctx)
+
+        _run_chunked(npending, nthreads, work, 8)
+
+        name, geos_name = _OVERLAY_NAMES[args.op]
+        for k in range(npending):
+            if stages[k] == 1:
+                raise RuntimeError("Failed to convert TG geometry to GEOS")
+            if stages[k] == 2:
+                raise RuntimeError(f"{geos_name} failed for geoms[{slots[k]}]")
+            if stages[k] == 3:
+                raise RuntimeError("Failed to convert GEOS geometry to TG")
+            if tg_geom_error(out[k]) != NULL:
+                err_msg = tg_geom_error(out[k]).decode("utf-8")
+                raise RuntimeError(f"{name}: TGX conversion error: {err_msg}")
+        for k in range(npending):
+            results[slots[k]] = _geometry_from_ptr_concrete(out[k])
+            out[k] = NULL
+    finally:
+        if out != NULL:
+            for k in range(npending):
+                if out[k] != NULL:
+                    tg_geom_free(out[k])
+        free(pa)
+        free(pb)
+        free(slots)
+        free(out)
+        free(stages)
+    return results
+
+
+def buffer_many(geoms, distance: float, quad_segs: int = 16, cap_style: int = 1,
+                join_style: int = 1, mitre_limit: float = 5.0, threads=1) -> list:
+    """
+    Buffer every geometry by ``distance`` in parallel (see ``Geometry.buffer``).
+
+    Parameters:
+    -----------
+    geoms : sequence of geometry-like objects
+    distance, quad_segs, cap_style, join_style, mitre_limit
+        As for ``Geometry.buffer``
+    threads : int or None
+        Worker threads (default: 1; None uses one per CPU)
+
+    Returns:
+    --------
+    list
+        One result per input, in input order
+    """
+    _count_entry("buffer_many")
+    cdef _OverlayArgs args
+    if not (0 < cap_style < 4):
+        raise ValueError("cap_style must be 1 (round), 2 (flat), or 3 (square)")
+    if not (0 < join_style < 4):
+        raise ValueError("join_style must be 1 (round), 2 (flat), or 3 (bevel)")
+    if quad_segs < 1:
+        raise ValueError("quad_segs must be >= 1")
+    if not mitre_limit > 0.0:
+        raise ValueError("mitre_limit must be > 0.0")
+    args.op = _OP_BUFFER
+    args.distance = distance
+    args.quad_segs = quad_segs
+    args.cap_style = cap_style
+    args.join_style = join_style
+    args.mitre_limit = mitre_limit
+    return _overlay_many(args, geoms, None, threads)
+
+
+def simplify_many(geoms, tolerance: float, preserve_topology: bool = True, threads=1) -> list:
+    """
+    Simplify every geometry in parallel (see ``Geometry.simplify``).
+
+    Parameters:
+    -----------
+    geoms : sequence of geometry-like objects
+    tolerance, preserve_topology
+        As for ``Geometry.simplify``
+    threads : int or None
+        Worker threads (default: 1; None uses one per CPU)
+
+    Returns:
+    --------
+    list
+        One result per input, in input order
+    """
+    _count_entry("simplify_many")
+    cdef _OverlayArgs args
+    if tolerance < 0:
+        raise ValueError("tolerance must be >= 0")
+    args.op = _OP_SIMPLIFY
+    args.distance = tolerance
+    args.preserve_topology = preserve_topology
+    return _overlay_many(args, geoms, None, threads)
+
+
+def intersection_many(geoms, other, threads=1) -> list:
+    """
+    Pairwise intersection in parallel (see ``Geometry.intersection``).
+
+    Parameters:
+    -----------
+    geoms : sequence of geometry-like objects
+    other : geometry-like object or sequence of the same length
+        A single geometry is intersected with every element of ``geoms``.
+    threads : int or None
+        Worker threads (default: 1; None uses one per CPU)
+
+    Returns:
+    --------
+    list
+        One result per pair, in input order
+    """
+    _count_entry("intersection_many")
+    cdef _OverlayArgs args
+    args.op = _OP_INTERSECTION
+    return _overlay_many(args, geoms, other, threads)
+
+
+def union_many(geoms, other, threads=1) -> list:
+    """Pairwise union in parallel (see ``intersection_many`` for broadcasting)."""
+    _count_entry("union_many")
+    cdef _OverlayArgs args
+    args.op = _OP_UNION
+    return _overlay_many(args, geoms, other, threads)
+
+
+def difference_many(geoms, other, threads=1) -> list:
+    """Pairwise difference in parallel (see ``intersection_many`` for broadcasting)."""
+    _count_entry("difference_many")
+    cdef _OverlayArgs args
+    args.op = _OP_DIFFERENCE
+    return _overlay_many(args, geoms, other, threads)
+
+
+# --- Shared-memory geometry arrays ---
+
+# Packed layout (native byte order, every section 8-byte aligned):
+#   header | geom_offsets uint64[n + 1] | nodes _GANode[num_nodes] | coords float64[2 * num_points]
+# Each geometry is a preorder run of nodes starting at geom_offsets[i]. Point,
+# LineString, MultiPoint and ring (type 0) nodes own ``count`` points starting
+# at ``offset``; Polygon nodes are followed by ``count`` rings and the other
+# multi types / GeometryCollection by ``count`` child geometries.
+
+cdef struct _GANode:
+    uint32_t type
+    uint32_t count
+    uint64_t offset
+
+
+cdef struct _GAHeader:
+    char magic[8]
+    uint32_t version
+    uint32_t byte_order
+    uint64_t num_geoms
+    uint64_t num_nodes
+    uint64_t num_points
+
+
+cdef bytes _GA_MAGIC = b"TOGOGA01"
+cdef uint32_t _GA_VERSION = 1
+_GA_HEADER_FORMAT = "=8sIIQQQ"
+# Deeper nesting than this is treated as a corrupt buffer.
+cdef int _GA_MAX_DEPTH = 64
+
+
+cdef void _ga_measure(const tg_geom *g, Py_ssize_t *nodes, Py_ssize_t *points) noexcept nogil:
+    cdef int t = tg_geom_typeof(g)
+    cdef int i, j, k
+    cdef const tg_poly *poly
+    nodes[0] += 1
+    if tg_geom_is_empty(g):
+        return
+    if t == 1:
+        points[0] += 1
+    elif t == 2:
+        points[0] += tg_line_num_points(tg_geom_line(g))
+    elif t == 3 or t == 6:
+        k = 1 if t == 3 else tg_geom_num_polys(g)
+        for i in range(k):
+            poly = tg_geom_poly(g) if t == 3 else tg_geom_poly_at(g, i)
+            if t == 6:
+                nodes[0] += 1
+            nodes[0] += 1 + tg_poly_num_holes(poly)
+            points[0] += tg_ring_num_points(tg_poly_exterior(poly))
+            for j in range(tg_poly_num_holes(poly)):
+                points[0] += tg_ring_num_points(tg_poly_hole_at(poly, j))
+    elif t == 4:
+        points[0] += tg_geom_num_points(g)
+    elif t == 5:
+        for i in range(tg_geom_num_lines(g)):
+            nodes[0] += 1
+            points[0] += tg_line_num_points(tg_geom_line_at(g, i))
+    elif t == 7:
+        for i in range(tg_geom_num_geometries(g)):
+            _ga_measure(tg_geom_geometry_at(g, i), nodes, points)
+
+
+cdef void _ga_put(
+    _GANode *nodes, double *coords, Py_ssize_t *ni, Py_ssize_t *pi,
+    int t, const tg_point *pts, int n
+) noexcept nogil:
+    """Append a leaf node owning ``n`` points."""
+    cdef int i
+    nodes[ni[0]].type = t
+    nodes[ni[0]].count = n
+    nodes[ni[0]].offset = pi[0]
+    ni[0] += 1
+    for i in range(n):
+        coords[2 * pi[0]] = pts[i].x
+        coords[2 * pi[0] + 1] = pts[i].y
+        pi[0] += 1
+
+
+cdef void _ga_put_poly(
+    const tg_poly *poly, _GANode *nodes, double *coords, Py_ssize_t *ni, Py_ssize_t *pi
+) noexcept nogil:
+    cdef const tg_ring *ring = tg_poly_exterior(poly)
+    cdef int j, nholes = tg_poly_num_holes(poly)
+    _ga_put(nodes, coords, ni, pi, 3, NULL, 0)
+    nodes[ni[0] - 1].count = 1 + nholes
+    _ga_put(nodes, coords, ni, pi, 0, tg_ring_points(ring), tg_ring_num_points(ring))
+    for j in range(nholes):
+        ring = tg_poly_hole_at(poly, j)
+        _ga_put(nodes, coords, ni, pi, 0, tg_ring_points(ring), tg_ring_num_points(ring))
+
+
+cdef void _ga_write(
+    const tg_geom *g, _GANode *nodes, double *coords, Py_ssize_t *ni, Py_ssize_t *pi
+) noexcept nogil:
+    cdef int t = tg_geom_typeof(g)
+    cdef int i, k
+    cdef tg_point pt
+    cdef const tg_line *line
+    cdef Py_ssize_t head
+    if tg_geom_is_empty(g):
+        _ga_put(nodes, coords, ni, pi, t, NULL, 0)
+        return
+    if t == 1:
+        pt = tg_geom_point(g)
+        _ga_put(nodes, coords, ni, pi, 1, &pt, 1)
+    elif t == 2:
+        line = tg_geom_line(g)
+        _ga_put(nodes, coords, ni, pi, 2, tg_line_points(line), tg_line_num_points(line))
+    elif t == 3:
+        _ga_put_poly(tg_geom_poly(g), nodes, coords, ni, pi)
+    elif t == 4:
+        head = ni[0]
+        _ga_put(nodes, coords, ni, pi, 4, NULL, 0)
+        k = tg_geom_num_points(g)
+        nodes[head].count = k
+        for i in range(k):
+            pt = tg_geom_point_at(g, i)
+            coords[2 * pi[0]] = pt.x
+            coords[2 * pi[0] + 1] = pt.y
+            pi[0] += 1
+    else:
+        head = ni[0]
+        _ga_put(nodes, coords, ni, pi, t, NULL, 0)
+        if t == 5:
+            k = tg_geom_num_lines(g)
+            for i in range(k):
+                line = tg_geom_line_at(g, i)
+                _ga_put(nodes, coords, ni, pi, 2, tg_line_points(line), tg_line_num_points(line))
+        elif t == 6:
+            k = tg_geom_num_polys(g)
+            for i in range(k):
+                _ga_put_poly(tg_geom_poly_at(g, i), nodes, coords, ni, pi)
+        else:
+            k = tg_geom_num_geometries(g)
+            for i in range(k):
+                _ga_write(tg_geom_geometry_at(g, i), nodes, coords, ni, pi)
+        nodes[head].count = k
+
+
+cdef struct _GAReader:
+    const _GANode *nodes
+    const double *coords
+    uint64_t num_nodes
+    uint64_t num_points
+    uint64_t pos
+    int failed  # 1: corrupt buffer, 2: allocation failure
+
+
+cdef const _GANode *_ga_next(_GAReader *r, int expected) noexcept nogil:
+    """Consume the next node, checking its type and point range."""
+    cdef const _GANode *node
+    if r.failed or r.pos >= r.num_nodes:
+        r.failed = r.failed or 1
+        return NULL
+    node = &r.nodes[r.pos]
+    r.pos += 1
+    if (expected >= 0 and node.type != <uint32_t>expected) or node.type > 7 \
+            or node.count > <uint32_t>INT_MAX:
+        r.failed = 1
+        return NULL
+    if node.type in (0, 1, 2, 4) and (
+        node.offset > r.num_points or node.count > r.num_points - node.offset
+    ):
+        r.failed = 1
+        return NULL
+    return node
+
+
+cdef inline const tg_point *_ga_points(_GAReader *r, const _GANode *node) noexcept nogil:
+    return <const tg_point *>(r.coords + 2 * node.offset)
+
+
+cdef tg_poly *_ga_read_poly(_GAReader *r, const _GANode *node) noexcept nogil:
+    cdef int i, n = <int>node.count
+    cdef const _GANode *rn
+    cdef tg_ring **rings
+    cdef tg_poly *poly = NULL
+    if n < 1:
+        r.failed = 1
+        return NULL
+    rings = <tg_ring **>calloc(<size_t>n, sizeof(tg_ring *))
+    if rings == NULL:
+        r.failed = 2
+        return NULL
+    for i in range(n):
+        rn = _ga_next(r, 0)
+        if rn == NULL:
+            break
+        rings[i] = tg_ring_new(_ga_points(r, rn), <int>rn.count)
+        if rings[i] == NULL:
+            r.failed = 2
+            break
+    if not r.failed:
+        poly = tg_poly_new(rings[0], <const tg_ring * const *>(rings + 1), n - 1)
+        if poly == NULL:
+            r.failed = 2
+    for i in range(n):
+        if rings[i] != NULL:
+            tg_ring_free(rings[i])
+    free(rings)
+    return poly
+
+
+cdef tg_geom *_ga_read(_GAReader *r, int depth) noexcept nogil:
+    cdef const _GANode *node = _ga_next(r, -1)
+    cdef const _GANode *child
+    cdef tg_geom *g = NULL
+    cdef tg_line *line
+    cdef tg_poly *poly
+    cdef void **parts
+    cdef int i, n
+    if node == NULL:
+        return NULL
+    if depth > _GA_MAX_DEPTH:
+        r.failed = 1
+        return NULL
+    n = <int>node.count
+    if node.type == 1:
+        g = tg_geom_new_point(_ga_points(r, node)[0]) if n == 1 else tg_geom_new_point_empty()
+    elif node.type == 2:
+        if n == 0:
+            g = tg_geom_new_linestring_empty()
+        else:
+            line = tg_line_new(_ga_points(r, node), n)
+            if line != NULL:
+                g = tg_geom_new_linestring(line)
+                tg_line_free(line)
+    elif node.type == 3:
+        if n == 0:
+            g = tg_geom_new_polygon_empty()
+        else:
+            poly = _ga_read_poly(r, node)
+            if poly != NULL:
+                g = tg_geom_new_polygon(poly)
+                tg_poly_free(poly)
+    elif node.type == 4:
+        if n == 0:
+            g = tg_geom_new_multipoint_empty()
+        else:
+            g = tg_geom_new_multipoint(_ga_points(r, node), n)
+    elif node.type in (5, 6, 7):
+        parts = <void **>calloc(<size_t>(n if n > 0 else 1), sizeof(void *))
+        if parts == NULL:
+            r.failed = 2
+            return NULL
+        for i in range(n):
+            if node.type == 5:
+                child = _ga_next(r, 2)
+                if child != NULL:
+                    parts[i] = tg_line_new(_ga_points(r, child), <int>child.count)
+            elif node.type == 6:
+                child = _ga_next(r, 3)
+                if child != NULL:
+                    parts[i] = _ga_read_poly(r, child)
+            else:
+                parts[i] = _ga_read(r, depth + 1)
+            if r.failed:
+                break
+            if parts[i] == NULL:
+                r.failed = 2
+                break
+        if not r.failed:
+            if node.type == 5:
+                g = tg_geom_new_multilinestring(<const tg_line * const *>parts, n) \
+                    if n > 0 else tg_geom_new_multilinestring_empty()
+            elif node.type == 6:
+                g = tg_geom_new_multipolygon(<const tg_poly * const *>parts, n) \
+                    if n > 0 else tg_geom_new_multipolygon_empty()
+            else:
+                g = tg_geom_new_geometrycollection(<const tg_geom * const *>parts, n) \
+                    if n > 0 else tg_geom_new_geometrycollection_empty()
+        for i in range(n):
+            if parts[i] != NULL:
+                if node.type == 5:
+                    tg_line_free(<tg_line *>parts[i])
+                elif node.type == 6:
+                    tg_poly_free(<tg_poly *>parts[i])
+                else:
+                    tg_geom_free(<tg_geom *>parts[i])
+        free(parts)
+    else:
+        r.failed = 1
+        return NULL
+    if g == NULL and not r.failed:
+        r.failed = 2
+    return g
+
+
+cdef _attach_shared_memory(str name):
+    """Attach to an existing block without making this process responsible for it."""
+    try:
+        return _shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching always registers the block with the
+        # resource tracker. Worker processes started by multiprocessing share
+        # their parent's tracker, which already holds the name, so this is a
+        # no-op for them; unregistering here would drop the creator's entry.
+        return _shared_memory.SharedMemory(name=name)
+
+
+cdef class GeometryArray:
+    """
+    Immutable sequence of geometries packed into one flat buffer (type codes,
+    offsets and 2D float64 coordinates) that can live in
+    ``multiprocessing.shared_memory``.
+
+    ``to_shared_memory`` copies the buffer into a new shared-memory block;
+    pickling such an array only sends the block name, and workers attach to
+    the same pages without copying or parsing WKB. Geometries are rebuilt from
+    the packed coordinates lazily, on first access, and then cached.
+    Z/M coordinates and GeoJSON feature properties are not stored.
+
+    Parameters:
+    -----------
+    geoms : sequence of Geometry, Point, Line, Ring, Poly, or other geometry types
+    """
+    cdef object _owner
+    cdef object _shm
+    cdef const unsigned char[::1] _view
+    cdef bint _is_open
+    cdef Py_ssize_t n
+    cdef const uint64_t *_offsets
+    cdef _GAReader _reader
+    cdef list _cache
+
+    def __init__(self, geoms):
+        cdef list coerced = _coerce_geometry_list(geoms, "geoms")
+        cdef const tg_geom **ptrs = _geom_ptr_array(coerced)
+        cdef Py_ssize_t n = len(coerced)
+        cdef Py_ssize_t i, nnodes = 0, npoints = 0, ni = 0, pi = 0
+        cdef unsigned char *base
+        cdef uint64_t *offsets
+        cdef _GANode *nodes
+        cdef double *coords
+        try:
+            with nogil:
+                for i in range(n):
+                    _ga_measure(ptrs[i], &nnodes, &npoints)
+            buf = bytearray(
+                sizeof(_GAHeader) + (n + 1) * 8 + nnodes * sizeof(_GANode) + npoints * 16
+            )
+            _struct.pack_into(
+                _GA_HEADER_FORMAT, buf, 0, _GA_MAGIC, _GA_VERSION, _INDEX_BYTE_ORDER,
+                n, nnodes, npoints,
+            )
+            base = <unsigned char *>(<char *>buf)
+            offsets = <uint64_t *>(base + sizeof(_GAHeader))
+            nodes = <_GANode *>(<unsigned char *>offsets + (n + 1) * 8)
+            coords = <double *>(<unsigned char *>nodes + nnodes * sizeof(_GANode))
+            with nogil:
+                for i in range(n):
+                    offsets[i] = ni
+                    _ga_write(ptrs[i], nodes, coords, &ni, &pi)
+                offsets[n] = ni
+        finally:
+            free(ptrs)
+        self._attach(buf, None)
+
+    cdef _attach(self, object buf, object shm):
+        cdef const unsigned char[::1] view = buf
+        cdef const _GAHeader *hdr
+        cdef uint64_t size = <uint64_t>view.shape[0]
+        cdef uint64_t n, nnodes, npoints
+        if size < sizeof(_GAHeader):
+            raise ValueError("not a togo geometry array")
+        hdr = <const _GAHeader *>&view[0]
+        if memcmp(hdr.magic, <const char *>_GA_MAGIC, 8) != 0:
+            raise ValueError("not a togo geometry array")
+        if hdr.version != _GA_VERSION:
+            raise ValueError(f"unsupported geometry array version {hdr.version}")
+        if hdr.byte_order != _INDEX_BYTE_ORDER:
+            raise ValueError("geometry array was written with a different byte order")
+        n = hdr.num_geoms
+        nnodes = hdr.num_nodes
+        npoints = hdr.num_points
+        if n > size // 8 or nnodes > size // sizeof(_GANode) or npoints > size // 16 \
+                or sizeof(_GAHeader) + (n + 1) * 8 + nnodes * sizeof(_GANode) + npoints * 16 > size:
+            raise ValueError("corrupt geometry array: unexpected size")
+        if (<size_t>&view[0]) % 8 != 0:
+            raise ValueError("geometry array buffer must be 8-byte aligned")
+        self._view = view
+        self._owner = buf
+        self._shm = shm
+        self._is_open = True
+        self.n = <Py_ssize_t>n
+        self._offsets = <const uint64_t *>(&view[0] + sizeof(_GAHeader))
+        self._reader.nodes = <const _GANode *>(<const unsigned char *>self._offsets + (n + 1) * 8)
+        self._reader.coords = <const double *>(
+            <const unsigned char *>self._reader.nodes + nnodes * sizeof(_GANode)
+        )
+        self._reader.num_nodes = nnodes
+        self._reader.num_points = npoints
+        self._cache = [None] * self.n
+        return self
+
+    cdef void _check_open(self) except *:
+        if not self._is_open:
+            raise ValueError("GeometryArray is closed")
+
+    @staticmethod
+    def from_buffer(buf) -> GeometryArray:
+        """View a packed buffer (e.g. ``SharedMemory.buf``) without copying it."""
+        cdef GeometryArray arr = GeometryArray.__new__(GeometryArray)
+        arr._attach(buf, None)
+        return arr
+
+    @staticmethod
+    def from_shared_memory(str name) -> GeometryArray:
+        """Attach to a block created by ``to_shared_memory`` in another process."""
+        cdef GeometryArray arr = GeometryArray.__new__(GeometryArray)
+        shm = _attach_shared_memory(name)
+        try:
+            arr._attach(shm.buf, shm)
+        except BaseException:
+            shm.close()
+            raise
+        return arr
+
+    def to_shared_memory(self, name=None) -> GeometryArray:
+        """
+        Copy the packed buffer into a new shared-memory block.
+
+        Returns:
+        --------
+        GeometryArray
+            An array backed by the new block. Its creator should call
+            ``unlink()`` once every process is done with it.
+        """
+        self._check_open()
+        cdef Py_ssize_t size = self._view.shape[0]
+        cdef GeometryArray arr = GeometryArray.__new__(GeometryArray)
+        shm = _shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        try:
+            shm.buf[:size] = self._view
+            arr._attach(shm.buf[:size], shm)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return arr
+
+    @property
+    def shm_name(self):
+        """Name of the backing shared-memory block, or None."""
+        return self._shm.name if self._shm is not None else None
+
+    @property
+    def nbytes(self) -> int:
+        self._check_open()
+        return self._view.shape[0]
+
+    @property
+    def buffer(self) -> memoryview:
+        """Read-only view of the packed bytes."""
+        self._check_open()
+        return memoryview(self._owner).toreadonly()
+
+    def close(self) -> None:
+        """Release this process's view of the buffer (geometries already accessed stay valid)."""
+        if not self._is_open:
+            return
+        self._is_open = False
+        self._view = None
+        self._owner = None
+        self._cache = None
+        self.n = 0
+        if self._shm is not None:
+            self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the backing shared-memory block (call once, from the creator)."""
+        if self._shm is None:
+            raise ValueError("GeometryArray is not backed by shared memory")
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, Py_ssize_t i):
+        cdef tg_geom *g
+        cdef uint64_t start, stop
+        cdef _GAReader r
+        self._check_open()
+        if i < 0:
+            i += self.n
+        if i < 0 or i >= self.n:
+            raise IndexError("GeometryArray index out of range")
+        cached = self._cache[i]
+        if cached is not None:
+            return cached
+        start = self._offsets[i]
+        stop = self._offsets[i + 1]
+        r = self._reader
+        r.pos = start
+        r.failed = 0
+        with nogil:
+            g = _ga_read(&r, 0) if start < stop else NULL
+        if g != NULL and r.pos != stop:
+            tg_geom_free(g)
+            g = NULL
+            r.failed = 1
+        if r.failed == 2:
+            raise MemoryError("Failed to rebuild geometry from GeometryArray")
+        if g == NULL:
+            raise ValueError(f"corrupt geometry array at index {i}")
+        cached = _geometry_from_ptr_concrete(g)
+        self._cache[i] = cached
+        return cached
+
+    def __reduce__(self):
+        self._check_open()
+        if self._shm is not None:
+            return (GeometryArray.from_shared_memory, (self._shm.name,))
+        return (GeometryArray.from_buffer, (bytes(self._view),))
+
+
+# --- asyncio offloading ---
+
+_aio_lock = _threading.Lock()
+_aio_executor = None
+_aio_max_workers = None
+_aio_width = 0
+
+
+def _aio_pool():
+    """Return the shared offloading pool and its size, creating it on first use."""
+    global _aio_executor, _aio_width
+    with _aio_lock:
+        if _aio_executor is None:
+            _aio_width = _resolve_threads(_aio_max_workers)
+            _aio_executor = _ThreadPoolExecutor(
+                max_workers=_aio_width, thread_name_prefix="togo-aio"
+            )
+        return _aio_executor, _aio_width
+
+
+def _aio_configure(max_workers=None) -> None:
+    """
+    Set the size of the pool used by ``togo.aio`` (None: one thread per CPU).
+
+    The pool bounds how many operations run at once across every event loop;
+    further calls queue until a worker is free. An existing pool is shut down
+    once its queued work has finished.
+    """
+    global _aio_executor, _aio_max_workers
+    _resolve_threads(max_workers)
+    with _aio_lock:
+        old = _aio_executor
+        _aio_executor = None
+        _aio_max_workers = max_workers
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def _aio_shutdown(wait: bool = True) -> None:
+    """Shut the offloading pool down; the next call starts a new one."""
+    global _aio_executor
+    with _aio_lock:
+        old = _aio_executor
+        _aio_executor = None
+    if old is not None:
+        old.shutdown(wait=wait)
+
+
+async def _aio_run(func, *args, **kwargs):
+    """Run ``func(*args, **kwargs)`` on the offloading pool and await its result."""
+    import asyncio
+    pool, _ = _aio_pool()
+    return await asyncio.get_running_loop().run_in_executor(
+        pool, lambda: func(*args, **kwargs)
+    )
+
+
+async def _aio_batch(func, geoms, other, bint binary, Py_ssize_t chunk_size, dict kwargs):
+    """
+    Run a ``*_many`` function over ``geoms`` in chunks on the offloading pool.
+
+    At most one chunk per pool worker is in flight for a call, so one large
+    batch cannot starve other requests. Cancelling the awaiting task cancels
+    every chunk that has not started yet; chunks already running finish in the
+    background and their results are dropped.
+    """
+    import asyncio
+    cdef list left = list(geoms)
+    cdef Py_ssize_t n = len(left)
+    cdef Py_ssize_t start
+    cdef list right = None
+    cdef list results
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if binary:
+        try:
+            _coerce_geometry_or_raise(other, "other")
+        except TypeError:
+            right = list(other)
+            if len(right) != n:
+                raise ValueError("geoms and other must have the same length")
+    pool, width = _aio_pool()
+    loop = asyncio.get_running_loop()
+    starts = range(0, n, chunk_size)
+    results = [None] * len(starts)
+    pending = {}
+    queued = iter(enumerate(starts))
+    try:
+        while True:
+            while len(pending) < width:
+                item = next(queued, None)
+                if item is None:
+                    break
+                k, start = item
+                chunk = left[start:start + chunk_size]
+                if not binary:
+                    job = _functools.partial(func, chunk, threads=1, **kwargs)
+                elif right is None:
+                    job = _functools.partial(func, chunk, other, threads=1)
+                else:
+                    part = right[start:start + chunk_size]
+                    job = _functools.partial(func, chunk, part, threads=1)
+                pending[loop.run_in_executor(pool, job)] = k
+            if not pending:
+                break
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+    return [g for chunk in results for g in chunk]
+
+
+async def _aio_buffer(geom, distance: float, quad_segs: int = 16, cap_style: int = 1,
+                      join_style: int = 1, mitre_limit: float = 5.0):
+    """Awaitable ``Geometry.buffer`` computed off the event loop."""
+    _count_entry("aio.buffer")
+    return (await _aio_run(
+        buffer_many, [geom], distance, quad_segs, cap_style, join_style, mitre_limit, threads=1
+    ))[0]
+
+
+async def _aio_simplify(geom, tolerance: float, preserve_topology: bool = True):
+    """Awaitable ``Geometry.simplify`` computed off the event loop."""
+    _count_entry("aio.simplify")
+    return (await _aio_run(simplify_many, [geom], tolerance, preserve_topology, threads=1))[0]
+
+
+async def _aio_intersection(a, b):
+    """Awaitable ``Geometry.intersection`` computed off the event loop."""
+    _count_entry("aio.intersection")
+    return (await _aio_run(intersection_many, [a], [b], threads=1))[0]
+
+
+async def _aio_union(a, b):
+    """Awaitable ``Geometry.union`` computed off the event loop."""
+    _count_entry("aio.union")
+    return (await _aio_run(union_many, [a], [b], threads=1))[0]
+
+
+async def _aio_difference(a, b):
+    """Awaitable ``Geometry.difference`` computed off the event loop."""
+    _count_entry("aio.difference")
+    return (await _aio_run(difference_many, [a], [b], threads=1))[0]
+
+
+async def _aio_unary_union(geoms, group_size: int = 256):
+    """
+    Awaitable ``unary_union``. The union runs as a single job on one pool
+    worker with the GIL released, so it cannot be interrupted once started.
+    """
+    _count_entry("aio.unary_union")
+    geoms = list(geoms)
+    if not geoms:
+        raise ValueError("unary_union requires at least one geometry")
+    if group_size < 2 or group_size > INT_MAX:
+        raise ValueError("group_size must be between 2 and INT_MAX")
+    return await _aio_run(_partitioned_unary_union, geoms, 1, group_size)
+
+
+async def _aio_buffer_many(geoms, distance: float, quad_segs: int = 16, cap_style: int = 1,
+                           join_style: int = 1, mitre_limit: float = 5.0,
+                           chunk_size: int = 64):
+    """Awaitable ``buffer_many``, cancellable between chunks of ``chunk_size`` geometries."""
+    _count_entry("aio.buffer_many")
+    return await _aio_batch(buffer_many, geoms, None, False, chunk_size, {
+        "distance": distance, "quad_segs": quad_segs, "cap_style": cap_style,
+        "join_style": join_style, "mitre_limit": mitre_limit,
+    })
+
+
+async def _aio_simplify_many(geoms, tolerance: float, preserve_topology: bool = True,
+                             chunk_size: int = 64):
+    """Awaitable ``simplify_many``, cancellable between chunks of ``chunk_size`` geometries."""
+    _count_entry("aio.simplify_many")
+    return await _aio_batch(simplify_many, geoms, None, False, chunk_size, {
+        "tolerance": tolerance, "preserve_topology": preserve_topology,
+    })
+
+
+async def _aio_intersection_many(geoms, other, chunk_size: int = 64):
+    """Awaitable ``intersection_many``, cancellable between chunks."""
+    _count_entry("aio.intersection_many")
+    return await _aio_batch(intersection_many, geoms, other, True, chunk_size, None)
+
+
+async def _aio_union_many(geoms, other, chunk_size: int = 64):
+    """Awaitable ``union_many``, cancellable between chunks."""
+    _count_entry("aio.union_many")
+    return await _aio_batch(union_many, geoms, other, True, chunk_size, None)
+
+
+async def _aio_difference_many(geoms, other, chunk_size: int = 64):
+    """Awaitable ``difference_many``, cancellable between chunks."""
+    _count_entry("aio.difference_many")
+    return await _aio_batch(difference_many, geoms, other, True, chunk_size, None)
+
+
+aio = _types.ModuleType("togo.aio", """\
+Awaitable versions of the heavy GEOS operations for asyncio applications.
+
+Every call runs on a dedicated pool of native threads with the GIL released,
+so the event loop keeps serving other requests. The pool size bounds
+concurrency (see ``configure``); batch functions are split into chunks and can
+be cancelled between chunks.
+""")
+for _name, _func in (
+    ("run", _aio_run),
+    ("configure", _aio_configure),
+    ("shutdown", _aio_shutdown),
+    ("buffer", _aio_buffer),
+    ("simplify", _aio_simplify),
+    ("intersection", _aio_intersection),
+    ("union", _aio_union),
+    ("difference", _aio_difference),
+    ("unary_union", _aio_unary_union),
+    ("buffer_many", _aio_buffer_many),
+    ("simplify_many", _aio_simplify_many),
+    ("intersection_many", _aio_intersection_many),
+    ("union_many", _aio_union_many),
+    ("difference_many", _aio_difference_many),
+):
+    setattr(aio, _name, _func)
+aio.__all__ = [
+    "run", "configure", "shutdown", "buffer", "simplify", "intersection", "union",
+    "difference", "unary_union", "buffer_many", "simplify_many", "intersection_many",
+    "union_many", "difference_many",
+]
+# Makes ``import togo.aio`` / ``from togo.aio import buffer`` work as well.
+_sys.modules.setdefault("togo.aio", aio)
+del _name, _func
+
+
+# --- Allocators and arenas ---
+
+_ALLOCATORS = {"malloc": 0, "pymem": 1}
+
+
+def set_allocator(name: str) -> None:
+    """
+    Select where new TG allocations come from: ``"malloc"`` (the default) or
+    ``"pymem"`` (``PyMem_RawMalloc``, visible to tracemalloc). Blocks made by
+    the previous allocator remain valid and are released by it.
+    """
+    global togo_backend
+    if name not in _ALLOCATORS:
+        raise ValueError(f"allocator must be one of {sorted(_ALLOCATORS)}")
+    togo_backend = _ALLOCATORS[name]
+
+
+def get_allocator() -> str:
+    """Name of the allocator used for new TG allocations."""
+    return "pymem" if togo_backend == 1 else "malloc"
+
+
+def allocator_stats(reset_peak: bool = False) -> dict:
+    """
+    Counters of native memory allocated through TG (GEOS is not included).
+
+    Returns:
+    --------
+    dict
+        ``live_bytes``, ``live_blocks`` and ``peak_bytes`` (requested sizes,
+        headers excluded), plus the running ``allocs``, ``frees`` and
+        ``reallocs`` totals. ``reset_peak`` restarts the peak from the current
+        live size after reading it.
+    """
+    stats = {
+        "live_bytes": togo_stats.live_bytes,
+        "live_blocks": togo_stats.live_blocks,
+        "peak_bytes": togo_stats.peak_bytes,
+        "allocs": togo_stats.allocs,
+        "frees": togo_stats.frees,
+        "reallocs": togo_stats.reallocs,
+    }
+    if reset_peak:
+        togo_stats.peak_bytes = togo_stats.live_bytes
+    return stats
+
+
+def memory_stats() -> dict:
+    """
+    Live wrapper objects per class and the native memory behind them.
+
+    Returns:
+    --------
+    dict
+        ``geometries`` (Geometry and subclasses), ``rings``, ``lines`` and
+        ``polys`` counts, plus ``native_bytes`` and ``native_blocks`` currently
+        allocated through TG (see ``allocator_stats``).
+    """
+    return {
+        "geometries": _live_geometries,
+        "rings": _live_rings,
+        "lines": _live_lines,
+        "polys": _live_polys,
+        "native_bytes": togo_stats.live_bytes,
+        "native_blocks": togo_stats.live_blocks,
+    }
+
+
+cdef class Arena:
+    """
+    Context manager that serves TG allocations made on the current thread
+    from large bump-allocated chunks.
+
+    Freeing an arena block only decrements a counter; the chunks are returned
+    to the system in one go once the ``with`` block has exited and every
+    geometry allocated inside it has been freed. Geometries may safely outlive
+    the block (they just keep the arena's memory alive), so arenas suit
+    scopes that parse, test and discard many short-lived geometries.
+    Allocations on other threads, including the worker pools used by
+    ``threads=`` arguments, are not affected. Exiting an arena out of order
+    or from another thread raises RuntimeError, but still closes it; an
+    arena closed from another thread leaves its own thread's stack at that
+    thread's next allocation or exit.
+
+    Parameters:
+    -----------
+    chunk_size : int
+        Bytes reserved per chunk (default: 1 MiB)
+    """
+    cdef togo_arena *_arena
+    cdef size_t chunk_size
+    cdef size_t _reserved
+
+    def __init__(self, chunk_size: int = 1 << 20):
+        if chunk_size < 1024:
+            raise ValueError("chunk_size must be >= 1024")
+        self.chunk_size = chunk_size
+
+    def __enter__(self):
+        if self._arena != NULL:
+            raise RuntimeError("Arena is already active")
+        self._arena = togo_arena_push(self.chunk_size)
+        if self._arena == NULL:
+            raise MemoryError("Failed to allocate arena")
+        return self
+
+    def __exit__(self, *exc):
+        if self._arena == NULL:
+            return
+        self._reserved = self._arena.reserved
+        # Close the arena even when misused so it never stays current.
+        rc = togo_arena_close(self._arena)
+        self._arena = NULL
+        if rc != 0:
+            raise RuntimeError("Arena must be exited on its thread, innermost first")
+
+    def __dealloc__(self):
+        if self._arena != NULL:
+            togo_arena_close(self._arena)
+            self._arena = NULL
+
+    @property
+    def active(self) -> bool:
+        return self._arena != NULL
+
+    @property
+    def reserved_bytes(self) -> int:
+        """Chunk bytes reserved so far (as of exit once the arena is closed)."""
+        return self._arena.reserved if self._arena != NULL else self._reserved
+
+    @property
+    def live_blocks(self):
+        """Blocks allocated in the arena and not yet freed (None once closed)."""
+        if self._arena == NULL:
+            return None
+        return self._arena.refs - 1 - self._arena.stacked
+
+
+# --- Instrumentation ---
+
+# Same order as the TOGO_ST_* stages of the instrumentation wrappers.
+_OP_STAT_NAMES = (
+    "tg_geom_to_geos", "tg_geom_from_geos", "coerce_geometry",
+    "parse_wkt", "parse_geojson", "parse_wkb", "parse_hex",
+    "write_wkt", "write_geojson", "write_wkb", "write_hex",
+    "equals", "disjoint", "contains", "within", "covers", "coveredby", "touches", "intersects",
+    "buffer", "simplify", "simplify_preserve_topology",
+    "intersection", "union", "difference", "unary_union",
+    "convex_hull", "centroid", "is_valid", "nearest_points", "project",
+)
+
+
+def set_instrumentation(enabled: bool = True) -> None:
+    """
+    Turn per-operation counters on or off (off by default).
+
+    While enabled, every TG predicate, parser and writer, every GEOS
+    operation, the TG <-> GEOS conversions and geometry argument coercion
+    count their calls, elapsed nanoseconds and bytes (input size for parsers
+    and conversions to GEOS, output size for writers and conversions back).
+    """
+    if not togo_set_flag(TOGO_FLAG_COUNTERS, 1 if enabled else 0):
+        raise RuntimeError("togo was built without instrumentation (TOGO_INSTRUMENT=0)")
+
+
+def instrumentation_enabled() -> bool:
+    return (togo_instrument & TOGO_FLAG_COUNTERS) != 0
+
+
+def stats(reset: bool = False) -> dict:
+    """
+    Snapshot of the instrumentation counters.
+
+    Operations are the native stages shared by every caller: for example,
+    ``Geometry.buffer``, ``buffer_many`` and ``aio.buffer`` all count as
+    ``buffer``. Use ``entry_stats()`` to tell the public calls apart.
+
+    Returns:
+    --------
+    dict
+        ``{operation: {"calls": int, "ns": int, "bytes": int}}`` for every
+        operation that has been called at least once. Counters are cumulative
+        (Prometheus counters); ``reset=True`` zeroes them after reading.
+    """
+    cdef int i
+    result = {}
+    for i in range(TOGO_ST_COUNT):
+        if togo_op_stats[i].calls:
+            result[_OP_STAT_NAMES[i]] = {
+                "calls": togo_op_stats[i].calls,
+                "ns": togo_op_stats[i].ns,
+                "bytes": togo_op_stats[i].bytes,
+            }
+    if reset:
+        _reset_op_stats()
+    return result
+
+
+def entry_stats(reset: bool = False) -> dict:
+    """
+    Calls per public entry point while instrumentation is enabled.
+
+    Covers the overlay and buffer methods, their ``*_many`` and ``aio``
+    variants, ``unary_union``, ``sjoin``, ``transform``, the Web Mercator
+    and tile projections and ``__geo_interface__``, including those with
+    no native stage in ``stats()``. A call is counted once per entry point
+    it goes through, so ``aio.buffer`` also counts ``buffer_many``.
+
+    Returns:
+    --------
+    dict
+        ``{entry_point: calls}``, e.g. ``{"Geometry.buffer": 3}``;
+        ``reset=True`` zeroes the counts after reading.
+    """
+    result = dict(_entry_calls)
+    if reset:
+        _entry_calls.clear()
+    return result
+
+
+cdef void _reset_op_stats():
+    cdef int i
+    for i in range(TOGO_ST_COUNT):
+        togo_op_stats[i].calls = 0
+        togo_op_stats[i].ns = 0
+        togo_op_stats[i].bytes = 0
+
+
+def reset_stats() -> None:
+    """Zero every instrumentation counter, including ``entry_stats()``."""
+    _reset_op_stats()
+    _entry_calls.clear()
+
+
+def stats_prometheus(snapshot=None, prefix: str = "togo", entries=None) -> str:
+    """
+    Render a ``stats()`` snapshot (default: the current counters) in the
+    Prometheus text exposition format, followed by an ``entry_stats()``
+    snapshot (default: the current counts when ``snapshot`` is None too).
+    """
+    if snapshot is None:
+        snapshot = stats()
+        if entries is None:
+            entries = entry_stats()
+    lines = []
+    for metric, key, scale, help_text in (
+        ("op_calls_total", "calls", 1, "Calls per operation."),
+        ("op_seconds_total", "ns", 1e-9, "Time spent per operation."),
+        ("op_bytes_total", "bytes", 1, "Bytes processed per operation."),
+    ):
+        name = f"{prefix}_{metric}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for op, values in snapshot.items():
+            value = values[key] * scale if scale != 1 else values[key]
+            lines.append(f'{name}{{op="{op}"}} {value}')
+    if entries:
+        name = f"{prefix}_entry_calls_total"
+        lines.append(f"# HELP {name} Calls per public entry point.")
+        lines.append(f"# TYPE {name} counter")
+        for entry, calls in entries.items():
+            lines.append(f'{name}{{entry="{entry}"}} {calls}')
+    return "\n".join(lines) + "\n"
+
+
+# --- Slow-operation hook ---
+
+SlowOperation = _namedtuple("SlowOperation", "operation seconds vertices memsize")
+SlowOperation.__doc__ = """\
+Report passed to the slow-operation hook.
+
+``vertices`` and ``memsize`` hold one entry per input geometry (for
+parsers: the parsed result). ``memsize`` is None for inputs that only
+exist as GEOS geometries at that point.
+"""
+
+_slow_hook = None
+_slow_threshold = None
+
+
+cdef Py_ssize_t _tg_num_vertices(const tg_geom *g) noexcept nogil:
+    cdef int t = tg_geom_typeof(g)
+    cdef int i, j
+    cdef const tg_poly *poly
+    cdef Py_ssize_t total = 0
+    if tg_geom_is_empty(g):
+        return 0
+    if t == 1:
+        return 1
+    if t == 2:
+        return tg_line_num_points(tg_geom_line(g))
+    if t == 4:
+        return tg_geom_num_points(g)
+    if t == 5:
+        for i in range(tg_geom_num_lines(g)):
+            total += tg_line_num_points(tg_geom_line_at(g, i))
+        return total
+    if t == 3 or t == 6:
+        for i in range(1 if t == 3 else tg_geom_num_polys(g)):
+            poly = tg_geom_poly(g) if t == 3 else tg_geom_poly_at(g, i)
+            total += tg_ring_num_points(tg_poly_exterior(poly))
+            for j in range(tg_poly_num_holes(poly)):
+                total += tg_ring_num_points(tg_poly_hole_at(poly, j))
+        return total
+    for i in range(tg_geom_num_geometries(g)):
+        total += _tg_num_vertices(tg_geom_geometry_at(g, i))
+    return total
+
+
+cdef void _report_slow(int stage, uint64_t ns, const togo_subject *subject) noexcept nogil:
+    cdef const void *inputs[2]
+    cdef int i
+    inputs[0] = subject.a
+    inputs[1] = subject.b
+    with gil:
+        hook = _slow_hook
+        if hook is None:
+            return
+        vertices = []
+        memsize = []
+        for i in range(2):
+            if inputs[i] == NULL:
+                continue
+            if subject.kind == TOGO_SUBJECT_TG:
+                vertices.append(_tg_num_vertices(<const tg_geom *>inputs[i]))
+                memsize.append(tg_geom_memsize(<const tg_geom *>inputs[i]))
+            elif subject.kind == TOGO_SUBJECT_GEOS:
+                vertices.append(GEOSGetNumCoordinates_r(
+                    subject.ctx, <const GEOSGeometry *>inputs[i]
+                ))
+                memsize.append(None)
+        try:
+            hook(SlowOperation(_OP_STAT_NAMES[stage], ns * 1e-9, tuple(vertices), tuple(memsize)))
+        except BaseException as exc:
+            _sys.unraisablehook(_unraisable_args(exc, hook))
+
+
+def _unraisable_args(exc, hook):
+    return _types.SimpleNamespace(
+        exc_type=type(exc), exc_value=exc, exc_traceback=exc.__traceback__,
+        err_msg="Exception ignored in togo slow-operation hook", object=hook,
+    )
+
+
+def set_slow_operation_hook(hook, threshold: float = 0.1) -> None:
+    """
+    Call ``hook(SlowOperation)`` whenever a TG- or GEOS-backed operation
+    (same operations as ``stats()``) takes at least ``threshold`` seconds.
+
+    The hook runs synchronously on the thread that ran the operation, with the
+    GIL held; exceptions it raises are reported through ``sys.unraisablehook``.
+    Pass ``hook=None`` to disable it, which restores the zero-cost path.
+    """
+    global _slow_hook, _slow_threshold, togo_slow_ns
+    if hook is None:
+        togo_set_flag(TOGO_FLAG_SLOW, 0)
+        _slow_hook = None
+        _slow_threshold = None
+        return
+    if not callable(hook):
+        raise TypeError("hook must be callable or None")
+    if not (threshold >= 0 and isfinite(threshold)):
+        raise ValueError("threshold must be a finite number >= 0")
+    _slow_hook = hook
+    _slow_threshold = float(threshold)
+    # Saturate thresholds beyond ~584 years instead of overflowing the cast.
+    togo_slow_ns = (
+        <uint64_t>(threshold * 1e9) if threshold * 1e9 < 1.8e19 else <uint64_t>-1
+    )
+    if not togo_set_flag(TOGO_FLAG_SLOW, 1):
+        _slow_hook = None
+        raise RuntimeError("togo was built without instrumentation (TOGO_INSTRUMENT=0)")
+
+
+def get_slow_operation_hook():
+    """Return ``(hook, threshold)`` or None when no hook is installed."""
+    if _slow_hook is None:
+        return None
+    return (_slow_hook, _slow_threshold)
+
+
+togo_slow_hook = _report_slow
+
+
+# --- Synthetic datasets ---
+
+cdef inline uint64_t _splitmix64(uint64_t *state) noexcept nogil:
+    cdef uint64_t z
+    state[0] += <uint64_t>0x9E3779B97F4A7C15
+    z = state[0]
+    z = (z ^ (z >> 30)) * <uint64_t>0xBF58476D1CE4E5B9
+    z = (z ^ (z >> 27)) * <uint64_t>0x94D049BB133111EB
+    return z ^ (z >> 31)
+
+
+cdef inline double _uniform(uint64_t *state) noexcept nogil:
+    """Uniform double in [0, 1)."""
+    return <double>(_splitmix64(state) >> 11) * (1.0 / 9007199254740992.0)
+
+
+cdef inline double _normal(uint64_t *state) noexcept nogil:
+    cdef double u = 1.0 - _uniform(state)
+    return sqrt(-2.0 * log(u)) * cos(2.0 * M_PI * _uniform(state))
+
+
+cdef inline void _normal_pair(uint64_t *state, double *a, double *b) noexcept nogil:
+    """Two independent standard normal samples (both halves of Box-Muller)."""
+    cdef double r = sqrt(-2.0 * log(1.0 - _uniform(state)))
+    cdef double angle = 2.0 * M_PI * _uniform(state)
+    a[0] = r * cos(angle)
+    b[0] = r * sin(angle)
+
+
+cdef uint64_t _dataset_seed(object seed, uint64_t stream):
+    return <uint64_t>(int(seed) & 0xFFFFFFFFFFFFFFFF) ^ stream
+
+
+cdef int _dataset_count(object value, str arg_name, int minimum) except -1:
+    cdef Py_ssize_t n = value
+    if n < minimum:
+        raise ValueError(f"{arg_name} must be >= {minimum}")
+    if n > INT_MAX - 1:
+        raise OverflowError(f"{arg_name} is too large")
+    return <int>n
+
+
+cdef void _star_ring(tg_point *out, int n, double cx, double cy, double radius,
+                     bint clockwise, uint64_t *state) noexcept nogil:
+    """Fill n + 1 points of a closed ring, star-shaped around (cx, cy)."""
+    cdef int i
+    cdef double angle, r
+    for i in range(n):
+        angle = 2.0 * M_PI * (i + 0.8 * _uniform(state)) / n
+        if clockwise:
+            angle = -angle
+        r = radius * (0.5 + 0.5 * _uniform(state))
+        out[i].x = cx + r * cos(angle)
+        out[i].y = cy + r * sin(angle)
+    out[n] = out[0]
+
+
+cdef double _ring_clearance(const tg_point *pts, int n, double cx, double cy) noexcept nogil:
+    """Smallest distance from (cx, cy) to the n edges of a closed ring."""
+    cdef int i
+    cdef double dx, dy, px, py, t, d
+    cdef double best = INFINITY
+    for i in range(n):
+        dx = pts[i + 1].x - pts[i].x
+        dy = pts[i + 1].y - pts[i].y
+        px = cx - pts[i].x
+        py = cy - pts[i].y
+        t = (px * dx + py * dy) / (dx * dx + dy * dy) if dx != 0.0 or dy != 0.0 else 0.0
+        t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+        d = sqrt((px - t * dx) * (px - t * dx) + (py - t * dy) * (py - t * dy))
+        if d < best:
+            best = d
+    return best
+
+
+cdef tg_geom *_polygon_from_rings(tg_point *pts, const int *sizes, int nrings) noexcept nogil:
+    """Polygon from nrings consecutive closed rings (exterior first)."""
+    cdef tg_ring **rings = <tg_ring **>calloc(nrings, sizeof(tg_ring *))
+    cdef tg_poly *poly = NULL
+    cdef tg_geom *g = NULL
+    cdef int i
+    cdef size_t offset = 0
+    if rings == NULL:
+        return NULL
+    for i in range(nrings):
+        rings[i] = tg_ring_new(pts + offset, sizes[i])
+        if rings[i] == NULL:
+            break
+        offset += sizes[i]
+    else:
+        poly = tg_poly_new(rings[0], <const tg_ring *const *>(rings + 1), nrings - 1)
+        if poly != NULL:
+            g = tg_geom_new_polygon(poly)
+            tg_poly_free(poly)
+    for i in range(nrings):
+        if rings[i] != NULL:
+            tg_ring_free(rings[i])
+    free(rings)
+    return g
+
+
+def _star_polygon(vertices: int, holes: int = 0, radius: float = 1.0,
+                  center=(0.0, 0.0), seed: int = 0):
+    """
+    Random star-shaped polygon with ``vertices`` exterior vertices.
+
+    Vertex radii vary between half and the full ``radius``, so the exterior
+    is always simple. ``holes`` star-shaped holes are laid out on a circle
+    inside the polygon's kernel and never touch each other or the exterior;
+    they shrink to fit when few exterior vertices leave little room.
+
+    Parameters:
+    -----------
+    vertices : int
+        Exterior vertex count (>= 3, or >= 4 with holes); each hole gets
+        ``max(8, vertices // (8 * holes))``
+    holes : int
+        Number of holes
+    radius : float
+        Outer radius
+    center : (x, y)
+    seed : int
+        Same seed and arguments produce the same polygon
+
+    Returns:
+    --------
+    Geometry
+    """
+    cdef int n = _dataset_count(vertices, "vertices", 3)
+    cdef int nholes = _dataset_count(holes, "holes", 0)
+    cdef int hole_n = max(8, n // (8 * nholes)) if nholes else 0
+    cdef double cx, cy
+    cdef double r = radius
+    cdef double ring_r = 0.25 * r, hole_r, angle, fit
+    cdef uint64_t state = _dataset_seed(seed, 0x5354415250)
+    cdef int *sizes
+    cdef tg_point *pts
+    cdef tg_geom *g = NULL
+    cdef int i
+    cdef size_t total
+    if not r > 0.0:
+        raise ValueError("radius must be > 0")
+    if nholes and n < 4:
+        # Three jittered vertices may leave the center outside the exterior.
+        raise ValueError("vertices must be >= 4 when holes > 0")
+    if nholes and <size_t>(hole_n + 1) * nholes > <size_t>INT_MAX:
+        raise OverflowError("holes is too large")
+    cx, cy = _coerce_xy(center, "center")
+    hole_r = 0.2 * r if nholes <= 1 else min(0.2 * r, 0.9 * ring_r * sin(M_PI / nholes))
+    total = <size_t>(n + 1) + <size_t>(hole_n + 1) * nholes
+    sizes = <int *>malloc((nholes + 1) * sizeof(int))
+    pts = <tg_point *>malloc(total * sizeof(tg_point))
+    try:
+        if sizes == NULL or pts == NULL:
+            raise MemoryError("Failed to allocate polygon points")
+        with nogil:
+            _star_ring(pts, n, cx, cy, r, False, &state)
+            sizes[0] = n + 1
+            if nholes:
+                # Keep every hole well inside the exterior's closest edge.
+                fit = 0.95 * _ring_clearance(pts, n, cx, cy) / (ring_r + hole_r)
+                if fit < 1.0:
+                    ring_r *= fit
+                    hole_r *= fit
+            for i in range(nholes):
+                angle = 2.0 * M_PI * i / nholes
+                _star_ring(pts + (n + 1) + <size_t>i * (hole_n + 1), hole_n,
+                           cx + ring_r * cos(angle), cy + ring_r * sin(angle),
+                           hole_r, True, &state)
+                sizes[i + 1] = hole_n + 1
+            g = _polygon_from_rings(pts, sizes, nholes + 1)
+    finally:
+        free(sizes)
+        free(pts)
+    if g == NULL:
+        raise MemoryError("Failed to build polygon")
+    return _geometry_from_ptr_concrete(g)
+
+
+def _coastline(vertices: int, roughness: float = 0.5, radius: float = 1.0,
+               center=(0.0, 0.0), seed: int = 0):
+    """
+    Coastline-like polygon: a closed fractal ring with ``vertices`` vertices.
+
+    The radius along the ring follows periodic midpoint displacement, so
+    detail appears at every scale; ``roughness`` in [0, 1] sets how slowly
+    the displacement shrinks per level (1 is the most jagged). The ring is
+    star-shaped around ``center`` and therefore simple.
+
+    Parameters:
+    -----------
+    vertices : int
+        Vertex count (>= 3)
+    roughness : float
+    radius : float
+        Outer radius; the innermost vertex sits at half of it
+    center : (x, y)
+    seed : int
+
+    Returns:
+    --------
+    Geometry
+    """
+    cdef int n = _dataset_count(vertices, "vertices", 3)
+    cdef double r = radius
+    cdef double h = roughness
+    cdef double cx, cy
+    cdef uint64_t state = _dataset_seed(seed, 0x434F415354)
+    cdef size_t m = 4, step, half, i, j
+    cdef double *vals
+    cdef tg_point *pts
+    cdef tg_geom *g = NULL
+    cdef double scale, lo, hi, pos, frac, t, angle
+    cdef int sizes[1]
+    if not r > 0.0:
+        raise ValueError("radius must be > 0")
+    if not 0.0 <= h <= 1.0:
+        raise ValueError("roughness must be between 0 and 1")
+    cx, cy = _coerce_xy(center, "center")
+    while m < <size_t>n:
+        m <<= 1
+    vals = <double *>malloc(m * sizeof(double))
+    pts = <tg_point *>malloc((n + 1) * sizeof(tg_point))
+    try:
+        if vals == NULL or pts == NULL:
+            raise MemoryError("Failed to allocate coastline points")
+        with nogil:
+            vals[0] = 0.0
+            step = m
+            scale = 1.0
+            while step > 1:
+                half = step >> 1
+                i = 0
+                while i < m:
+                    vals[i + half] = 0.5 * (vals[i] + vals[(i + step) % m]) \
+                        + scale * (2.0 * _uniform(&state) - 1.0)
+                    i += step
+                scale *= 2.0 ** (h - 1.0)
+                step = half
+            lo = hi = vals[0]
+            for i in range(m):
+                lo = min(lo, vals[i])
+                hi = max(hi, vals[i])
+            for j in range(<size_t>n):
+                pos = <double>j * m / n
+                i = <size_t>pos
+                frac = pos - i
+                t = vals[i] * (1.0 - frac) + vals[(i + 1) % m] * frac
+                t = (t - lo) / (hi - lo) if hi > lo else 1.0
+                angle = 2.0 * M_PI * j / n
+                pts[j].x = cx + r * (0.5 + 0.5 * t) * cos(angle)
+                pts[j].y = cy + r * (0.5 + 0.5 * t) * sin(angle)
+            pts[n] = pts[0]
+            sizes[0] = n + 1
+            g = _polygon_from_rings(pts, sizes, 1)
+    finally:
+        free(vals)
+        free(pts)
+    if g == NULL:
+        raise MemoryError("Failed to build coastline")
+    return _geometry_from_ptr_concrete(g)
+
+
+def _road_network(roads: int, vertices_per_road: int = 64,
+                  extent=(0.0, 0.0, 1.0, 1.0), wiggle: float = 0.002, seed: int = 0):
+    """
+    Dense road network as one MultiLineString.
+
+    Roads alternate between east-west and north-south, each crossing the
+    whole ``extent`` at a random offset and drifting sideways in a random
+    walk of step ``wiggle`` (clamped to the extent), so roads cross each
+    other like a street grid.
+
+    Parameters:
+    -----------
+    roads : int
+        Number of roads (>= 1)
+    vertices_per_road : int
+        Vertices per road (>= 2)
+    extent : (minx, miny, maxx, maxy)
+    wiggle : float
+        Standard deviation of the sideways step between vertices
+    seed : int
+
+    Returns:
+    --------
+    MultiLineString
+    """
+    cdef int nroads = _dataset_count(roads, "roads", 1)
+    cdef int n = _dataset_count(vertices_per_road, "vertices_per_road", 2)
+    cdef double minx, miny, maxx, maxy
+    cdef double w = wiggle
+    cdef uint64_t state = _dataset_seed(seed, 0x524F414453)
+    cdef tg_point *pts
+    cdef tg_line **lines
+    cdef tg_geom *g = NULL
+    cdef int k, i
+    cdef bint ok = True
+    cdef double along, lo, hi, side, t
+    minx, miny, maxx, maxy = [float(v) for v in extent]
+    if not (minx < maxx and miny < maxy):
+        raise ValueError("extent must be (minx, miny, maxx, maxy) with min < max")
+    if not w >= 0.0:
+        raise ValueError("wiggle must be >= 0")
+    pts = <tg_point *>malloc(n * sizeof(tg_point))
+    lines = <tg_line **>calloc(nroads, sizeof(tg_line *))
+    try:
+        if pts == NULL or lines == NULL:
+            raise MemoryError("Failed to allocate road network")
+        with nogil:
+            for k in range(nroads):
+                # Even roads run east-west (side is y), odd ones north-south.
+                lo, hi = (miny, maxy) if k % 2 == 0 else (minx, maxx)
+                side = lo + (hi - lo) * _uniform(&state)
+                for i in range(n):
+                    t = <double>i / (n - 1)
+                    if k % 2 == 0:
+                        along = minx + (maxx - minx) * t
+                        pts[i].x = along
+                        pts[i].y = side
+                    else:
+                        along = miny + (maxy - miny) * t
+                        pts[i].x = side
+                        pts[i].y = along
+                    side = min(hi, max(lo, side + w * _normal(&state)))
+                lines[k] = tg_line_new(pts, n)
+                if lines[k] == NULL:
+                    ok = False
+                    break
+            if ok:
+                g = tg_geom_new_multilinestring(<const tg_line *const *>lines, nroads)
+            for k in range(nroads):
+                if lines[k] != NULL:
+                    tg_line_free(lines[k])
+    finally:
+        free(pts)
+        free(lines)
+    if g == NULL:
+        raise MemoryError("Failed to build road network")
+    return _geometry_from_ptr_concrete(g)
+
+
+def _gps_points(count: int, clusters: int = 16, spread: float = 0.05,
+                extent=(-180.0, -85.0, 180.0, 85.0), seed: int = 0):
+    """
+    Clustered point cloud, like GPS fixes around a handful of cities.
+
+    Cluster centres are uniform in ``extent``; cluster sizes are skewed so a
+    few clusters hold most points. Points scatter around their centre with a
+    normal distribution of standard deviation ``spread`` and are clamped to
+    the extent.
+
+    Parameters:
+    -----------
+    count : int
+        Number of points (>= 0)
+    clusters : int
+        Number of clusters (>= 1)
+    spread : float
+    extent : (minx, miny, maxx, maxy)
+    seed : int
+
+    Returns:
+    --------
+    MultiPoint
+    """
+    cdef int n = _dataset_count(count, "count", 0)
+    cdef int nclusters = _dataset_count(clusters, "clusters", 1)
+    cdef double minx, miny, maxx, maxy
+    cdef double sigma = spread
+    cdef uint64_t state = _dataset_seed(seed, 0x475053)
+    cdef tg_point *centres
+    cdef tg_point *pts
+    cdef tg_geom *g = NULL
+    cdef int i, c
+    cdef double u, dx, dy
+    minx, miny, maxx, maxy = [float(v) for v in extent]
+    if not (minx <= maxx and miny <= maxy):
+        raise ValueError("extent must be (minx, miny, maxx, maxy) with min <= max")
+    if not sigma >= 0.0:
+        raise ValueError("spread must be >= 0")
+    centres = <tg_point *>malloc(nclusters * sizeof(tg_point))
+    pts = <tg_point *>malloc(max(n, 1) * sizeof(tg_point))
+    try:
+        if centres == NULL or pts == NULL:
+            raise MemoryError("Failed to allocate points")
+        with nogil:
+            for c in range(nclusters):
+                centres[c].x = minx + (maxx - minx) * _uniform(&state)
+                centres[c].y = miny + (maxy - miny) * _uniform(&state)
+            for i in range(n):
+                u = _uniform(&state)
+                c = <int>(u * u * nclusters)
+                _normal_pair(&state, &dx, &dy)
+                pts[i].x = min(maxx, max(minx, centres[c].x + sigma * dx))
+                pts[i].y = min(maxy, max(miny, centres[c].y + sigma * dy))
+            g = tg_geom_new_multipoint(pts, n)
+    finally:
+        free(centres)
+        free(pts)
+    if g == NULL:
+        raise MemoryError("Failed to build point cloud")
+    return _geometry_from_ptr_concrete(g)
+
+
+datasets = _types.ModuleType("togo.datasets", """\
+Deterministic synthetic datasets for benchmarks and tests.
+
+Every generator is seeded: the same arguments and ``seed`` give the same
+geometry. Coordinates are produced natively without the GIL, so
+million-vertex inputs build in well under a second.
+""")
+for _name, _func in (
+    ("star_polygon", _star_polygon),
+    ("coastline", _coastline),
+    ("road_network", _road_network),
+    ("gps_points", _gps_points),
+):
+    setattr(datasets, _name, _func)
+datasets.__all__ = ["star_polygon", "coastline", "road_network", "gps_points"]
+_sys.modules.setdefault("togo.datasets", datasets)
+del _name, _func
+
+
 __all__ = [
     "Geometry", "BaseGeometry", "Point", "Rect", "Ring", "Line", "Poly", "Segment",
     "LineString", "LinearRing", "Polygon",
@@ -5125,5 +11828,20 @@ __all__ = [
     "to_wkt", "to_geojson", "to_wkb",
     "unary_union", "shape", "box", "nearest_points", "shortest_line", "convex_hull",
     "intersection", "union", "difference", "transform", "force_2d",
-    "set_polygon_indexing_mode", "TGIndex"
+    "set_polygon_indexing_mode", "TGIndex",
+    "set_auto_index_policy", "get_auto_index_policy",
+    "geodesic_distance", "geodesic_distances", "geodesic_length", "geodesic_lengths",
+    "geodesic_area", "geodesic_areas",
+    "to_meters_grid_many", "from_meters_grid_many", "buffer_meters",
+    "to_web_mercator", "from_web_mercator", "to_tile_pixels",
+    "to_web_mercator_coords", "from_web_mercator_coords", "to_tile_pixels_coords",
+    "sjoin", "sjoin_iter", "RTree", "PointIndex", "GeometryIndex",
+    "segment_intersections", "SegmentArray", "RectArray", "bounds", "total_bounds",
+    "buffer_many", "simplify_many", "intersection_many", "union_many", "difference_many",
+    "GeometryArray", "aio",
+    "Arena", "set_allocator", "get_allocator", "allocator_stats",
+    "memory_stats", "set_cache_policy", "get_cache_policy",
+    "set_instrumentation", "instrumentation_enabled", "stats", "entry_stats", "reset_stats",
+    "stats_prometheus", "SlowOperation", "set_slow_operation_hook",
+    "get_slow_operation_hook", "datasets",
 ]